@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import UTC, datetime
+from typing import cast
+
+from bitcoin_bot.config.loader import load_runtime_config
+from bitcoin_bot.config.validator import validate_config
+from bitcoin_bot.data.backfill import backfill_klines
+from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
+from bitcoin_bot.exchange.protocol import ProductType
+from bitcoin_bot.exchange.rate_limit import GMORateLimiter
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="backfill GMO klines into cache")
+    parser.add_argument("--config", default="configs/runtime.example.yaml")
+    parser.add_argument("--start", required=True)
+    parser.add_argument("--end", required=True)
+    parser.add_argument("--max-workers", type=int, default=4)
+    return parser
+
+
+def main() -> None:
+    args = _build_parser().parse_args()
+    config = validate_config(load_runtime_config(args.config))
+    adapter = GMOAdapter(
+        product_type=cast(ProductType, config.exchange.product_type),
+        api_base_url=config.exchange.api_base_url,
+        ws_url=config.exchange.ws_url,
+        use_http=True,
+        rate_limiter=(
+            GMORateLimiter.from_rates(
+                public_per_second=config.exchange.public_rate_limit_per_second,
+                private_per_second=config.exchange.private_rate_limit_per_second,
+                burst=config.exchange.rate_limit_burst,
+            )
+            if config.exchange.rate_limit_enabled
+            else None
+        ),
+    )
+    result = backfill_klines(
+        adapter=adapter,
+        symbol=config.exchange.symbol,
+        timeframe=config.data.timeframe,
+        start=_parse_time(args.start),
+        end=_parse_time(args.end),
+        cache_dir=config.paths.cache_dir,
+        max_workers=args.max_workers,
+    )
+    print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
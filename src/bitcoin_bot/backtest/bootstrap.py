@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+BOOTSTRAP_PERCENTILES = (5, 25, 50, 75, 95)
+_CHUNK_ELEMENTS = 4_000_000
+_WORKER_RETURNS: dict[str, np.ndarray] = {}
+
+
+@dataclass(slots=True)
+class _BootstrapTask:
+    source: str
+    samples: int
+    block_bars: int
+    seed: np.random.SeedSequence
+
+
+def _path_statistics(path_returns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    equity = np.cumprod(1.0 + path_returns, axis=1)
+    peaks = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+    drawdown = (1.0 - (equity / peaks)).max(axis=1)
+    return equity[:, -1] - 1.0, np.maximum(drawdown, 0.0)
+
+
+def resample_trade_returns(
+    returns: np.ndarray, *, samples: int, rng: np.random.Generator
+) -> np.ndarray:
+    return returns[rng.integers(returns.shape[0], size=(samples, returns.shape[0]))]
+
+
+def block_resample_returns(
+    returns: np.ndarray,
+    *,
+    samples: int,
+    block_bars: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    bars = returns.shape[0]
+    block = max(1, min(block_bars, bars))
+    blocks = -(-bars // block)
+    starts = rng.integers(bars, size=(samples, blocks, 1))
+    positions = (starts + np.arange(block)) % bars
+    return returns[positions.reshape(samples, blocks * block)[:, :bars]]
+
+
+def _run_task(task: _BootstrapTask, returns: np.ndarray) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(task.seed)
+    if task.source == "trades":
+        paths = resample_trade_returns(returns, samples=task.samples, rng=rng)
+    else:
+        paths = block_resample_returns(
+            returns, samples=task.samples, block_bars=task.block_bars, rng=rng
+        )
+    return _path_statistics(paths)
+
+
+def _init_bootstrap_worker(trade_returns: np.ndarray, bar_returns: np.ndarray) -> None:
+    _WORKER_RETURNS.update(trades=trade_returns, bars=bar_returns)
+
+
+def _run_worker_task(task: _BootstrapTask) -> tuple[np.ndarray, ...]:
+    return _run_task(task, _WORKER_RETURNS[task.source])
+
+
+def _distribution_summary(values: np.ndarray) -> dict[str, float]:
+    summary = {
+        f"p{percentile}": float(value)
+        for percentile, value in zip(
+            BOOTSTRAP_PERCENTILES, np.percentile(values, BOOTSTRAP_PERCENTILES)
+        )
+    }
+    summary["mean"] = float(values.mean())
+    return summary
+
+
+def _plan_tasks(
+    source: str,
+    length: int,
+    *,
+    samples: int,
+    block_bars: int,
+    seed: np.random.SeedSequence,
+) -> list[_BootstrapTask]:
+    chunk = max(1, min(samples, _CHUNK_ELEMENTS // max(length, 1)))
+    sizes = [min(chunk, samples - start) for start in range(0, samples, chunk)]
+    return [
+        _BootstrapTask(source=source, samples=size, block_bars=block_bars, seed=child)
+        for size, child in zip(sizes, seed.spawn(len(sizes)))
+    ]
+
+
+def run_bootstrap(
+    *,
+    trade_returns: np.ndarray,
+    bar_returns: np.ndarray,
+    samples: int,
+    block_bars: int,
+    seed: int = 0,
+    max_workers: int = 1,
+) -> dict:
+    trade_returns = np.asarray(trade_returns, dtype=np.float64)
+    bar_returns = np.asarray(bar_returns, dtype=np.float64)
+    trade_seed, bar_seed = np.random.SeedSequence(seed).spawn(2)
+    tasks: list[_BootstrapTask] = []
+    if trade_returns.size:
+        tasks += _plan_tasks(
+            "trades",
+            trade_returns.size,
+            samples=samples,
+            block_bars=block_bars,
+            seed=trade_seed,
+        )
+    if bar_returns.size:
+        tasks += _plan_tasks(
+            "bars",
+            bar_returns.size,
+            samples=samples,
+            block_bars=block_bars,
+            seed=bar_seed,
+        )
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        sources = {"trades": trade_returns, "bars": bar_returns}
+        results = [_run_task(task, sources[task.source]) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(tasks)),
+            initializer=_init_bootstrap_worker,
+            initargs=(trade_returns, bar_returns),
+        ) as pool:
+            results = list(pool.map(_run_worker_task, tasks))
+
+    distributions: dict[str, dict | None] = {"trades": None, "bars": None}
+    for source in distributions:
+        chunks = [
+            result for task, result in zip(tasks, results) if task.source == source
+        ]
+        if not chunks:
+            continue
+        distributions[source] = {
+            "return": _distribution_summary(np.concatenate([c[0] for c in chunks])),
+            "max_drawdown": _distribution_summary(
+                np.concatenate([c[1] for c in chunks])
+            ),
+        }
+
+    p95_drawdowns = [
+        distribution["max_drawdown"]["p95"]
+        for distribution in distributions.values()
+        if distribution is not None
+    ]
+    return {
+        "samples": samples,
+        "block_bars": block_bars,
+        "seed": seed,
+        "trades": distributions["trades"],
+        "bars": distributions["bars"],
+        "p95_drawdown": max(p95_drawdowns) if p95_drawdowns else 0.0,
+    }
+
+
+def equity_bar_returns(equity: np.ndarray) -> np.ndarray:
+    values = np.asarray(equity, dtype=np.float64)
+    if values.size < 2:
+        return np.empty(0, dtype=np.float64)
+    return values[1:] / values[:-1] - 1.0
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.backtest.costs import FillCostModel
+from bitcoin_bot.backtest.simulator import (
+    EXIT_REASON_MAX_HOLDING,
+    MarketArrays,
+    SimulationResult,
+    TradeLog,
+    decide_from_indicators,
+    simulate_trades,
+    strategy_indicator_arrays,
+)
+from bitcoin_bot.config.models import BacktestSettings, RiskSettings, StrategySettings
+from bitcoin_bot.indicators.cache import ohlcv_content_hash
+from bitcoin_bot.indicators.generator import VOLUME_MA_WINDOW, volume_moving_average
+from bitcoin_bot.indicators.incremental import IncrementalIndicatorEngine
+
+BACKTEST_CHECKPOINT_VERSION = 1
+TAIL_INDICATOR_KEYS = ("ema_fast", "ema_slow", "rsi", "atr", "volume_ma")
+_TRADE_DTYPES = {
+    "entry_index": np.int64,
+    "exit_index": np.int64,
+    "direction": np.int8,
+    "exit_reason": np.int8,
+}
+
+
+@dataclass(slots=True)
+class SimulatorState:
+    bars: int
+    data_hash: str
+    settings_hash: str
+    resume_index: int
+    next_entry: int
+    balance: float
+    realized: float
+    indicators: IncrementalIndicatorEngine
+    tail: dict[str, np.ndarray]
+    trades: TradeLog
+    equity: np.ndarray
+
+
+def backtest_checkpoint_path(
+    cache_dir: str | Path,
+    *,
+    symbol: str,
+    product_type: str,
+    timeframe: str,
+    settings_hash: str,
+) -> Path:
+    name = f"{symbol}-{product_type}-{timeframe}-{settings_hash[:16]}.npz"
+    return Path(cache_dir) / "backtest" / name
+
+
+def checkpoint_settings_hash(
+    *,
+    strategy: StrategySettings,
+    risk: RiskSettings,
+    backtest: BacktestSettings,
+    cost_model: FillCostModel,
+) -> str:
+    payload = {
+        "version": BACKTEST_CHECKPOINT_VERSION,
+        "strategy": asdict(strategy),
+        "risk": asdict(risk),
+        "backtest": {
+            "initial_balance": backtest.initial_balance,
+            "cooldown_bars": backtest.cooldown_bars,
+            "max_holding_bars": backtest.max_holding_bars,
+        },
+        "costs": cost_model.describe(),
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def empty_trade_log() -> TradeLog:
+    return TradeLog(
+        **{
+            item.name: np.empty(0, dtype=_TRADE_DTYPES.get(item.name, np.float64))
+            for item in fields(TradeLog)
+        }
+    )
+
+
+def _concat_trades(first: TradeLog, second: TradeLog) -> TradeLog:
+    return TradeLog(
+        **{
+            item.name: np.concatenate(
+                [getattr(first, item.name), getattr(second, item.name)]
+            )
+            for item in fields(TradeLog)
+        }
+    )
+
+
+def _slice_trades(trades: TradeLog, stop: int) -> TradeLog:
+    return TradeLog(
+        **{item.name: getattr(trades, item.name)[:stop] for item in fields(TradeLog)}
+    )
+
+
+def _new_bar_indicators(
+    frame: pd.DataFrame, start: int, engine: IncrementalIndicatorEngine
+) -> dict[str, np.ndarray]:
+    rows = [
+        engine.update(high=high, low=low, close=close, timestamp=timestamp)
+        for high, low, close, timestamp in zip(
+            frame["high"].to_numpy(dtype=float)[start:].tolist(),
+            frame["low"].to_numpy(dtype=float)[start:].tolist(),
+            frame["close"].to_numpy(dtype=float)[start:].tolist(),
+            frame.index[start:],
+        )
+    ]
+    volume_start = max(start - VOLUME_MA_WINDOW + 1, 0)
+    volume_ma = volume_moving_average(
+        frame["volume"].iloc[volume_start:].astype(float)
+    ).to_numpy()
+    return {
+        "ema_fast": np.array([row["ema_fast"] for row in rows], dtype=np.float64),
+        "ema_slow": np.array([row["ema_slow"] for row in rows], dtype=np.float64),
+        "rsi": np.array([row["rsi"] for row in rows], dtype=np.float64),
+        "atr": np.array([row["atr"] for row in rows], dtype=np.float64),
+        "volume_ma": volume_ma[start - volume_start :],
+    }
+
+
+def _resumable(
+    state: SimulatorState | None, frame: pd.DataFrame, settings_hash: str
+) -> bool:
+    return (
+        state is not None
+        and state.settings_hash == settings_hash
+        and state.bars <= len(frame)
+        and ohlcv_content_hash(frame.iloc[: state.bars]) == state.data_hash
+    )
+
+
+def run_checkpointed_simulation(
+    frame: pd.DataFrame,
+    *,
+    strategy: StrategySettings,
+    risk: RiskSettings,
+    backtest: BacktestSettings,
+    cost_model: FillCostModel,
+    state: SimulatorState | None = None,
+) -> tuple[SimulationResult, SimulatorState, dict]:
+    bars = len(frame)
+    settings_hash = checkpoint_settings_hash(
+        strategy=strategy, risk=risk, backtest=backtest, cost_model=cost_model
+    )
+    windows = {
+        "ema_fast_window": strategy.ema_fast,
+        "ema_slow_window": strategy.ema_slow,
+        "rsi_window": strategy.rsi_period,
+        "atr_window": strategy.atr_period,
+    }
+    if state is not None and _resumable(state, frame, settings_hash):
+        mode = "resumed"
+        start = state.resume_index
+        engine = IncrementalIndicatorEngine.from_state(state.indicators.to_state())
+        new_bars = _new_bar_indicators(frame, state.bars, engine)
+        indicators = {
+            key: np.concatenate([state.tail[key], new_bars[key]])
+            for key in TAIL_INDICATOR_KEYS
+        }
+        next_entry = state.next_entry
+        balance = state.balance
+        realized = state.realized
+        prior_trades = state.trades
+        prior_equity = state.equity
+    else:
+        mode = "full"
+        start = 0
+        indicators = strategy_indicator_arrays(frame, strategy=strategy)
+        engine = IncrementalIndicatorEngine.from_history(frame, **windows)
+        next_entry = 0
+        balance = float(backtest.initial_balance)
+        realized = 0.0
+        prior_trades = empty_trade_log()
+        prior_equity = np.empty(0, dtype=np.float64)
+
+    segment = frame.iloc[start:]
+    decisions = decide_from_indicators(
+        segment, indicators, strategy=strategy, backtest=backtest
+    )
+    decisions.action[: max(next_entry - start, 0)] = 0
+    result = simulate_trades(
+        MarketArrays.from_frame(segment, indicators["atr"]),
+        decisions,
+        risk=risk,
+        backtest=backtest,
+        cost_model=cost_model,
+        balance=balance,
+        realized_offset=realized,
+    )
+    new_trades = result.trades
+    new_trades.entry_index += start
+    new_trades.exit_index += start
+
+    final_count = len(new_trades)
+    if final_count and (
+        new_trades.exit_reason[-1] == EXIT_REASON_MAX_HOLDING
+        and new_trades.entry_index[-1] + backtest.max_holding_bars > bars - 1
+    ):
+        final_count -= 1
+        resume_index = int(new_trades.entry_index[-1])
+        resume_entry = resume_index
+    else:
+        resume_index = max(bars - 1, start)
+        resume_entry = next_entry
+        if final_count:
+            resume_entry = int(new_trades.exit_index[-1]) + 1 + backtest.cooldown_bars
+    for pnl in new_trades.pnl[:final_count].tolist():
+        balance += pnl
+        realized += pnl
+
+    trades = _concat_trades(prior_trades, new_trades)
+    equity = np.concatenate([prior_equity, result.equity])
+    offset = resume_index - start
+    next_state = SimulatorState(
+        bars=bars,
+        data_hash=ohlcv_content_hash(frame),
+        settings_hash=settings_hash,
+        resume_index=resume_index,
+        next_entry=resume_entry,
+        balance=balance,
+        realized=realized,
+        indicators=engine,
+        tail={key: indicators[key][offset:].copy() for key in TAIL_INDICATOR_KEYS},
+        trades=_slice_trades(trades, len(prior_trades) + final_count),
+        equity=equity[:resume_index],
+    )
+    simulation = SimulationResult(
+        trades=trades,
+        equity=equity,
+        initial_balance=float(backtest.initial_balance),
+        final_balance=result.final_balance,
+    )
+    return simulation, next_state, {"mode": mode, "bars_processed": bars - start}
+
+
+def save_simulator_state(path: str | Path, state: SimulatorState) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    meta = {
+        "version": BACKTEST_CHECKPOINT_VERSION,
+        "bars": state.bars,
+        "data_hash": state.data_hash,
+        "settings_hash": state.settings_hash,
+        "resume_index": state.resume_index,
+        "next_entry": state.next_entry,
+        "balance": state.balance,
+        "realized": state.realized,
+        "indicators": state.indicators.to_state(),
+    }
+    arrays: dict[str, Any] = {
+        "meta": np.array(json.dumps(meta)),
+        "equity": state.equity,
+    }
+    arrays |= {f"tail_{key}": values for key, values in state.tail.items()}
+    arrays |= {
+        f"trade_{item.name}": getattr(state.trades, item.name)
+        for item in fields(TradeLog)
+    }
+    descriptor, temp = tempfile.mkstemp(
+        dir=target.parent, prefix=f"{target.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            np.savez(handle, **arrays)
+        os.replace(temp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp)
+        raise
+
+
+def load_simulator_state(path: str | Path) -> SimulatorState | None:
+    source = Path(path)
+    if not source.exists():
+        return None
+    try:
+        with np.load(source, allow_pickle=False) as payload:
+            meta = json.loads(str(payload["meta"]))
+            if meta.get("version") != BACKTEST_CHECKPOINT_VERSION:
+                return None
+            return SimulatorState(
+                bars=int(meta["bars"]),
+                data_hash=str(meta["data_hash"]),
+                settings_hash=str(meta["settings_hash"]),
+                resume_index=int(meta["resume_index"]),
+                next_entry=int(meta["next_entry"]),
+                balance=float(meta["balance"]),
+                realized=float(meta["realized"]),
+                indicators=IncrementalIndicatorEngine.from_state(meta["indicators"]),
+                tail={key: payload[f"tail_{key}"] for key in TAIL_INDICATOR_KEYS},
+                trades=TradeLog(
+                    **{
+                        item.name: payload[f"trade_{item.name}"]
+                        for item in fields(TradeLog)
+                    }
+                ),
+                equity=payload["equity"],
+            )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
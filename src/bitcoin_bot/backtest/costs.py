@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+from bitcoin_bot.config.models import BacktestSettings, ExchangeSettings
+
+if TYPE_CHECKING:
+    from bitcoin_bot.backtest.simulator import MarketArrays
+
+DEFAULT_FEE_BPS = {"spot": 5.0, "leverage": 0.0}
+
+
+@dataclass(slots=True)
+class FillCosts:
+    fee_rate: float
+    half_spread: np.ndarray
+    slippage_per_qty: np.ndarray
+
+
+class FillCostModel(Protocol):
+    def fill_costs(self, market: MarketArrays) -> FillCosts: ...
+
+    def describe(self) -> dict[str, float | str]: ...
+
+
+@dataclass(slots=True)
+class BpsFillCostModel:
+    fee_bps: float = 0.0
+    spread_range_fraction: float = 0.0
+    slippage_bps: float = 0.0
+
+    def fill_costs(self, market: MarketArrays) -> FillCosts:
+        bar_range = np.maximum(market.high - market.low, 0.0)
+        close = np.maximum(np.abs(market.close), 1e-9)
+        half_spread = 0.5 * self.spread_range_fraction * (bar_range / close)
+        if market.volume is None:
+            slippage_per_qty = np.zeros_like(market.close)
+        else:
+            volume = np.nan_to_num(market.volume, nan=0.0)
+            slippage_per_qty = np.divide(
+                self.slippage_bps / 10_000.0,
+                volume,
+                out=np.zeros_like(volume),
+                where=volume > 0.0,
+            )
+        return FillCosts(
+            fee_rate=self.fee_bps / 10_000.0,
+            half_spread=np.nan_to_num(half_spread, nan=0.0),
+            slippage_per_qty=slippage_per_qty,
+        )
+
+    def describe(self) -> dict[str, float | str]:
+        return {
+            "model": "bps",
+            "fee_bps": self.fee_bps,
+            "spread_range_fraction": self.spread_range_fraction,
+            "slippage_bps": self.slippage_bps,
+        }
+
+
+def fill_cost_model_from_settings(
+    exchange: ExchangeSettings, backtest: BacktestSettings
+) -> BpsFillCostModel:
+    fee_bps = backtest.fee_bps
+    if fee_bps is None:
+        fee_bps = DEFAULT_FEE_BPS.get(exchange.product_type, 0.0)
+    return BpsFillCostModel(
+        fee_bps=float(fee_bps),
+        spread_range_fraction=backtest.spread_range_fraction,
+        slippage_bps=backtest.slippage_bps,
+    )
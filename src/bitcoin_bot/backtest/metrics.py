@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from bitcoin_bot.backtest.simulator import TradeLog
+
+METRICS_CHUNK_BARS = 65_536
+
+
+@dataclass(slots=True)
+class MetricsAccumulator:
+    initial_balance: float
+    balance: float = field(init=False)
+    peak_equity: float = -math.inf
+    min_equity_ratio: float = math.inf
+    trade_count: int = 0
+    wins: int = 0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0
+    fees_paid: float = 0.0
+    slippage_cost: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.initial_balance = float(self.initial_balance)
+        self.balance = self.initial_balance
+
+    @property
+    def max_drawdown(self) -> float:
+        if math.isinf(self.min_equity_ratio):
+            return 0.0
+        return 1.0 - self.min_equity_ratio
+
+    def add_trade(
+        self,
+        *,
+        pnl: float,
+        trade_return: float,
+        fee: float = 0.0,
+        slippage: float = 0.0,
+    ) -> None:
+        self.balance += pnl
+        self.trade_count += 1
+        self.wins += int(pnl > 0.0)
+        if trade_return > 0.0:
+            self.gross_profit += trade_return
+        elif trade_return < 0.0:
+            self.gross_loss += trade_return
+        self.fees_paid += fee
+        self.slippage_cost += slippage
+
+    def update_trades(self, trades: TradeLog) -> None:
+        for pnl in trades.pnl.tolist():
+            self.balance += pnl
+        returns = trades.trade_return
+        self.trade_count += len(trades)
+        self.wins += int(np.count_nonzero(trades.pnl > 0.0))
+        self.gross_profit += float(returns[returns > 0.0].sum())
+        self.gross_loss += float(returns[returns < 0.0].sum())
+        self.fees_paid += float(trades.fees.sum())
+        self.slippage_cost += float(trades.slippage.sum())
+
+    def update_equity(self, equity: np.ndarray) -> None:
+        values = np.asarray(equity, dtype=np.float64)
+        buffer = np.empty(min(values.shape[0], METRICS_CHUNK_BARS), dtype=np.float64)
+        for start in range(0, values.shape[0], METRICS_CHUNK_BARS):
+            chunk = values[start : start + METRICS_CHUNK_BARS]
+            peaks = buffer[: chunk.shape[0]]
+            np.maximum.accumulate(chunk, out=peaks)
+            np.maximum(peaks, self.peak_equity, out=peaks)
+            self.peak_equity = float(peaks[-1])
+            np.divide(chunk, peaks, out=peaks)
+            self.min_equity_ratio = min(self.min_equity_ratio, float(peaks.min()))
+
+    def to_metrics(self) -> dict[str, float]:
+        if self.trade_count == 0:
+            return {
+                "return": 0.0,
+                "max_drawdown": 0.0,
+                "win_rate": 0.0,
+                "profit_factor": 0.0,
+                "trade_count": 0.0,
+                "fees_paid": 0.0,
+                "slippage_cost": 0.0,
+            }
+
+        gross_loss = abs(self.gross_loss)
+        return {
+            "return": (self.balance / self.initial_balance) - 1.0,
+            "max_drawdown": self.max_drawdown,
+            "win_rate": self.wins / self.trade_count,
+            "profit_factor": (
+                self.gross_profit / gross_loss
+                if gross_loss > 1e-12
+                else self.gross_profit
+            ),
+            "trade_count": float(self.trade_count),
+            "fees_paid": self.fees_paid,
+            "slippage_cost": self.slippage_cost,
+        }
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bitcoin_bot.backtest.costs import BpsFillCostModel, FillCostModel
+from bitcoin_bot.backtest.metrics import MetricsAccumulator
+from bitcoin_bot.config.models import BacktestSettings, RiskSettings, StrategySettings
+from bitcoin_bot.indicators.cache import IndicatorCache
+from bitcoin_bot.indicators.generator import generate_indicators, volume_moving_average
+from bitcoin_bot.strategy.batch import DecisionBatch, decide_action_batch
+from bitcoin_bot.strategy.core import DecisionHooks
+from bitcoin_bot.strategy.sizing import compute_order_qty
+
+EXIT_REASON_MAX_HOLDING = 0
+EXIT_REASON_STOP_LOSS = 1
+EXIT_REASON_TAKE_PROFIT = 2
+EXIT_REASON_NAMES = {
+    EXIT_REASON_MAX_HOLDING: "max_holding",
+    EXIT_REASON_STOP_LOSS: "stop_loss",
+    EXIT_REASON_TAKE_PROFIT: "take_profit",
+}
+_EXIT_PLAN_ELEMENT_BUDGET = 1 << 23
+
+
+@dataclass(slots=True)
+class MarketArrays:
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    atr: np.ndarray
+    volume: np.ndarray | None = None
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, atr: np.ndarray) -> MarketArrays:
+        return cls(
+            open=frame["open"].to_numpy(dtype=np.float64),
+            high=frame["high"].to_numpy(dtype=np.float64),
+            low=frame["low"].to_numpy(dtype=np.float64),
+            close=frame["close"].to_numpy(dtype=np.float64),
+            atr=np.asarray(atr, dtype=np.float64),
+            volume=frame["volume"].to_numpy(dtype=np.float64),
+        )
+
+
+@dataclass(slots=True)
+class TradeLog:
+    entry_index: np.ndarray
+    exit_index: np.ndarray
+    direction: np.ndarray
+    qty: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    pnl: np.ndarray
+    trade_return: np.ndarray
+    exit_reason: np.ndarray
+    fees: np.ndarray
+    slippage: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.entry_index.shape[0])
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    trades: TradeLog
+    equity: np.ndarray
+    initial_balance: float
+    final_balance: float
+
+
+@dataclass(slots=True)
+class _ExitPlan:
+    exit_index: np.ndarray
+    exit_price: np.ndarray
+    exit_reason: np.ndarray
+
+
+def _plan_exits(
+    market: MarketArrays,
+    *,
+    entry_index: np.ndarray,
+    direction: np.ndarray,
+    sl: np.ndarray,
+    tp: np.ndarray,
+    max_holding_bars: int,
+) -> _ExitPlan:
+    bars = market.close.shape[0]
+    padding = np.full(max_holding_bars, np.nan)
+    high_windows = sliding_window_view(
+        np.concatenate([market.high[1:], padding]), max_holding_bars
+    )
+    low_windows = sliding_window_view(
+        np.concatenate([market.low[1:], padding]), max_holding_bars
+    )
+
+    exit_index = np.empty(entry_index.shape[0], dtype=np.int64)
+    exit_price = np.empty(entry_index.shape[0], dtype=np.float64)
+    exit_reason = np.empty(entry_index.shape[0], dtype=np.int8)
+    chunk_size = max(1, _EXIT_PLAN_ELEMENT_BUDGET // max_holding_bars)
+    for start in range(0, entry_index.shape[0], chunk_size):
+        chunk = slice(start, start + chunk_size)
+        entries = entry_index[chunk]
+        is_long = (direction[chunk] > 0)[:, None]
+        stop = sl[chunk][:, None]
+        target = tp[chunk][:, None]
+        highs = high_windows[entries]
+        lows = low_windows[entries]
+
+        stop_hit = np.where(is_long, lows <= stop, highs >= stop)
+        target_hit = np.where(is_long, highs >= target, lows <= target)
+        any_hit = stop_hit | target_hit
+        has_hit = any_hit.any(axis=1)
+        first_hit = any_hit.argmax(axis=1)
+        rows = np.arange(entries.shape[0])
+        stopped = has_hit & stop_hit[rows, first_hit]
+
+        offsets = np.where(has_hit, first_hit + 1, max_holding_bars)
+        chunk_exit = np.minimum(entries + offsets, bars - 1)
+        bar_open = market.open[chunk_exit]
+        stop_fill = np.where(
+            is_long[:, 0],
+            np.minimum(bar_open, stop[:, 0]),
+            np.maximum(bar_open, stop[:, 0]),
+        )
+        exit_index[chunk] = chunk_exit
+        exit_price[chunk] = np.where(
+            stopped,
+            stop_fill,
+            np.where(has_hit, target[:, 0], market.close[chunk_exit]),
+        )
+        exit_reason[chunk] = np.where(
+            stopped,
+            EXIT_REASON_STOP_LOSS,
+            np.where(has_hit, EXIT_REASON_TAKE_PROFIT, EXIT_REASON_MAX_HOLDING),
+        )
+    return _ExitPlan(
+        exit_index=exit_index, exit_price=exit_price, exit_reason=exit_reason
+    )
+
+
+def _equity_curve(
+    market: MarketArrays,
+    trades: TradeLog,
+    initial_balance: float,
+    realized_offset: float = 0.0,
+) -> np.ndarray:
+    bars = market.close.shape[0]
+    realized = np.zeros(bars, dtype=np.float64)
+    realized[:1] = realized_offset
+    np.add.at(realized, trades.exit_index, trades.pnl)
+    position = np.zeros(bars, dtype=np.float64)
+    entry_price = np.zeros(bars, dtype=np.float64)
+    for entry, exit_, signed_qty, price in zip(
+        trades.entry_index.tolist(),
+        trades.exit_index.tolist(),
+        (trades.direction * trades.qty).tolist(),
+        trades.entry_price.tolist(),
+    ):
+        position[entry:exit_] = signed_qty
+        entry_price[entry:exit_] = price
+    return (
+        initial_balance + np.cumsum(realized) + position * (market.close - entry_price)
+    )
+
+
+def simulate_trades(
+    market: MarketArrays,
+    decisions: DecisionBatch,
+    *,
+    risk: RiskSettings,
+    backtest: BacktestSettings,
+    cost_model: FillCostModel | None = None,
+    balance: float | None = None,
+    realized_offset: float = 0.0,
+) -> SimulationResult:
+    bars = market.close.shape[0]
+    signal_index = np.flatnonzero(decisions.action[: max(bars - 1, 0)] != 0)
+    direction = decisions.action[signal_index].astype(np.int64)
+    plan = _plan_exits(
+        market,
+        entry_index=signal_index,
+        direction=direction,
+        sl=decisions.sl[signal_index],
+        tp=decisions.tp[signal_index],
+        max_holding_bars=backtest.max_holding_bars,
+    )
+
+    signals = signal_index.tolist()
+    directions = direction.tolist()
+    exit_indices = plan.exit_index.tolist()
+    exit_prices = plan.exit_price.tolist()
+    closes = market.close.tolist()
+    atrs = market.atr.tolist()
+    costs = (cost_model or BpsFillCostModel()).fill_costs(market)
+    half_spreads = costs.half_spread.tolist()
+    slippage_rates = costs.slippage_per_qty.tolist()
+
+    taken: list[int] = []
+    quantities: list[float] = []
+    entry_fills: list[float] = []
+    exit_fills: list[float] = []
+    pnls: list[float] = []
+    trade_returns: list[float] = []
+    fees: list[float] = []
+    slippages: list[float] = []
+    cash = float(backtest.initial_balance if balance is None else balance)
+    position = 0
+    while position < len(signals):
+        entry = signals[position]
+        qty, _ = compute_order_qty(
+            available_balance=cash,
+            close_price=closes[entry],
+            atr_value=atrs[entry],
+            max_position_size=risk.max_position_size,
+            position_risk_fraction=risk.position_risk_fraction,
+            min_order_qty=risk.min_order_qty,
+            qty_step=risk.qty_step,
+        )
+        if qty <= 0.0:
+            position += 1
+            continue
+        side = directions[position]
+        exit_ = exit_indices[position]
+        entry_impact = half_spreads[entry] + (slippage_rates[entry] * qty)
+        exit_impact = half_spreads[exit_] + (slippage_rates[exit_] * qty)
+        entry_fill = closes[entry] * (1.0 + (side * entry_impact))
+        exit_fill = exit_prices[position] * (1.0 - (side * exit_impact))
+        fee = costs.fee_rate * qty * (entry_fill + exit_fill)
+        gross = side * (exit_fill - entry_fill) * qty
+        pnl = gross - fee
+        taken.append(position)
+        quantities.append(qty)
+        entry_fills.append(entry_fill)
+        exit_fills.append(exit_fill)
+        pnls.append(pnl)
+        fees.append(fee)
+        slippages.append((side * (exit_prices[position] - closes[entry]) * qty) - gross)
+        trade_returns.append(pnl / cash)
+        cash += pnl
+        next_entry = exit_ + 1 + backtest.cooldown_bars
+        position = bisect_left(signals, next_entry, lo=position + 1)
+
+    selected = np.asarray(taken, dtype=np.int64)
+    trades = TradeLog(
+        entry_index=signal_index[selected],
+        exit_index=plan.exit_index[selected],
+        direction=direction[selected].astype(np.int8),
+        qty=np.asarray(quantities, dtype=np.float64),
+        entry_price=np.asarray(entry_fills, dtype=np.float64),
+        exit_price=np.asarray(exit_fills, dtype=np.float64),
+        pnl=np.asarray(pnls, dtype=np.float64),
+        trade_return=np.asarray(trade_returns, dtype=np.float64),
+        exit_reason=plan.exit_reason[selected],
+        fees=np.asarray(fees, dtype=np.float64),
+        slippage=np.asarray(slippages, dtype=np.float64),
+    )
+    return SimulationResult(
+        trades=trades,
+        equity=_equity_curve(
+            market, trades, float(backtest.initial_balance), realized_offset
+        ),
+        initial_balance=float(backtest.initial_balance),
+        final_balance=cash,
+    )
+
+
+def simulation_metrics(result: SimulationResult) -> dict[str, float]:
+    accumulator = MetricsAccumulator(initial_balance=result.initial_balance)
+    accumulator.update_trades(result.trades)
+    accumulator.update_equity(result.equity)
+    return accumulator.to_metrics()
+
+
+def bounded_metrics(raw_metrics: dict[str, float]) -> dict[str, float]:
+    metrics = {
+        "return": raw_metrics["return"],
+        "max_drawdown": min(max(raw_metrics["max_drawdown"], 0.0), 1.0),
+        "win_rate": min(max(raw_metrics["win_rate"], 0.0), 1.0),
+        "profit_factor": max(raw_metrics["profit_factor"], 0.0),
+        "trade_count": max(raw_metrics["trade_count"], 0.0),
+    }
+    if not math.isfinite(metrics["profit_factor"]):
+        metrics["profit_factor"] = 0.0
+    return metrics
+
+
+def strategy_indicator_arrays(
+    frame: pd.DataFrame,
+    *,
+    strategy: StrategySettings,
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
+) -> dict[str, np.ndarray]:
+    indicators = generate_indicators(
+        frame,
+        ema_fast_window=strategy.ema_fast,
+        ema_slow_window=strategy.ema_slow,
+        rsi_window=strategy.rsi_period,
+        atr_window=strategy.atr_period,
+        feature_flags={"slope_norm": False, "gap_norm": False},
+        backend="numpy",
+        cache=cache,
+        content_hash=content_hash,
+    )
+    return {
+        "ema_fast": indicators[f"ema_{strategy.ema_fast}"].to_numpy(),
+        "ema_slow": indicators[f"ema_{strategy.ema_slow}"].to_numpy(),
+        "rsi": indicators[f"rsi_{strategy.rsi_period}"].to_numpy(),
+        "atr": indicators[f"atr_{strategy.atr_period}"].to_numpy(),
+        "volume_ma": volume_moving_average(frame["volume"].astype(float)).to_numpy(),
+    }
+
+
+def decide_from_indicators(
+    frame: pd.DataFrame,
+    indicators: dict[str, np.ndarray],
+    *,
+    strategy: StrategySettings,
+    backtest: BacktestSettings,
+) -> DecisionBatch:
+    ema_fast = indicators["ema_fast"]
+    ema_slow = indicators["ema_slow"]
+    rsi = indicators["rsi"]
+    atr = indicators["atr"]
+    volume_ma = indicators["volume_ma"]
+    decisions = decide_action_batch(
+        close=frame["close"].to_numpy(dtype=np.float64),
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+        rsi=rsi,
+        atr=atr,
+        volume=frame["volume"].to_numpy(dtype=np.float64),
+        volume_ma=volume_ma,
+        hooks=DecisionHooks(
+            min_confidence=strategy.min_confidence,
+            max_holding_bars=backtest.max_holding_bars,
+            regime_max_atr_to_price_ratio=strategy.regime_max_atr_to_price_ratio,
+            regime_min_volume_ratio=strategy.regime_min_volume_ratio,
+        ),
+    )
+    ready = np.isfinite(ema_fast) & np.isfinite(ema_slow) & np.isfinite(rsi)
+    ready &= np.isfinite(atr) & np.isfinite(volume_ma)
+    decisions.action[~ready] = 0
+    return decisions
+
+
+def strategy_decisions(
+    frame: pd.DataFrame,
+    *,
+    strategy: StrategySettings,
+    backtest: BacktestSettings,
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
+) -> tuple[MarketArrays, DecisionBatch]:
+    indicators = strategy_indicator_arrays(
+        frame, strategy=strategy, cache=cache, content_hash=content_hash
+    )
+    decisions = decide_from_indicators(
+        frame, indicators, strategy=strategy, backtest=backtest
+    )
+    return MarketArrays.from_frame(frame, indicators["atr"]), decisions
+
+
+def simulate_strategy(
+    frame: pd.DataFrame,
+    *,
+    strategy: StrategySettings,
+    risk: RiskSettings,
+    backtest: BacktestSettings,
+    cost_model: FillCostModel | None = None,
+) -> SimulationResult:
+    market, decisions = strategy_decisions(frame, strategy=strategy, backtest=backtest)
+    return simulate_trades(
+        market, decisions, risk=risk, backtest=backtest, cost_model=cost_model
+    )
+
+
+def evaluate_strategy(
+    frame: pd.DataFrame,
+    *,
+    strategy: StrategySettings,
+    risk: RiskSettings,
+    backtest: BacktestSettings,
+    cost_model: FillCostModel | None = None,
+    entry_start: int = 0,
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
+) -> dict[str, float]:
+    market, decisions = strategy_decisions(
+        frame,
+        strategy=strategy,
+        backtest=backtest,
+        cache=cache,
+        content_hash=content_hash,
+    )
+    decisions.action[:entry_start] = 0
+    result = simulate_trades(
+        market, decisions, risk=risk, backtest=backtest, cost_model=cost_model
+    )
+    return bounded_metrics(simulation_metrics(result))
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.optimizer.search import ParamValue, SearchContext, evaluate_params
+
+
+@dataclass(slots=True)
+class WalkForwardFold:
+    index: int
+    train_start: int
+    train_end: int
+    test_end: int
+
+
+@dataclass(slots=True)
+class _FoldTask:
+    fold: WalkForwardFold
+    frame: pd.DataFrame
+    candidates: list[dict[str, ParamValue]]
+    context: SearchContext
+
+
+def walk_forward_folds(
+    rows: int, *, train_bars: int, test_bars: int, max_folds: int = 0
+) -> list[WalkForwardFold]:
+    folds: list[WalkForwardFold] = []
+    train_start = 0
+    while train_start + train_bars + test_bars <= rows:
+        train_end = train_start + train_bars
+        folds.append(
+            WalkForwardFold(
+                index=len(folds),
+                train_start=train_start,
+                train_end=train_end,
+                test_end=train_end + test_bars,
+            )
+        )
+        train_start += test_bars
+    if max_folds > 0:
+        folds = folds[-max_folds:]
+    return [replace(fold, index=index) for index, fold in enumerate(folds)]
+
+
+def default_walk_forward_candidates(
+    context: SearchContext,
+) -> list[dict[str, ParamValue]]:
+    strategy = context.strategy
+    candidates: list[dict[str, ParamValue]] = []
+    for scale in (1.0, 0.5, 2.0):
+        ema_fast = max(2, int(round(strategy.ema_fast * scale)))
+        ema_slow = max(ema_fast + 1, int(round(strategy.ema_slow * scale)))
+        for confidence_shift in (0.0, -0.15, 0.15):
+            candidate: dict[str, ParamValue] = {
+                "strategy.ema_fast": ema_fast,
+                "strategy.ema_slow": ema_slow,
+                "strategy.min_confidence": min(
+                    max(strategy.min_confidence + confidence_shift, 0.0), 1.0
+                ),
+            }
+            if candidate not in candidates:
+                candidates.append(candidate)
+    return candidates
+
+
+def _timestamp_at(frame: pd.DataFrame, position: int) -> str | None:
+    if "timestamp" not in frame.columns or position >= len(frame):
+        return None
+    return pd.Timestamp(frame["timestamp"].iloc[position]).isoformat()
+
+
+def _run_fold(task: _FoldTask) -> dict:
+    fold = task.fold
+    train_bars = fold.train_end - fold.train_start
+    train_frame = task.frame.iloc[:train_bars]
+
+    best_params = task.candidates[0]
+    best_score = float("-inf")
+    for candidate in task.candidates:
+        score = evaluate_params(train_frame, candidate, task.context)["score"]
+        if score > best_score:
+            best_params, best_score = candidate, score
+
+    test_trial = evaluate_params(
+        task.frame, best_params, task.context, entry_start=train_bars
+    )
+    return {
+        "fold": fold.index,
+        "train": {
+            "start": fold.train_start,
+            "end": fold.train_end,
+            "start_at": _timestamp_at(task.frame, 0),
+        },
+        "test": {
+            "start": fold.train_end,
+            "end": fold.test_end,
+            "start_at": _timestamp_at(task.frame, train_bars),
+        },
+        "params": test_trial["params"],
+        "candidates": len(task.candidates),
+        "train_score": best_score,
+        "test_score": test_trial["score"],
+        "test_metrics": test_trial["metrics"],
+    }
+
+
+def aggregate_walk_forward(fold_results: list[dict]) -> dict:
+    if not fold_results:
+        return {
+            "fold_count": 0,
+            "oos_score": None,
+            "oos_return": 0.0,
+            "oos_max_drawdown": 0.0,
+            "oos_trade_count": 0.0,
+        }
+
+    test_returns = np.array([fold["test_metrics"]["return"] for fold in fold_results])
+    return {
+        "fold_count": len(fold_results),
+        "oos_score": round(
+            float(np.mean([fold["test_score"] for fold in fold_results])), 6
+        ),
+        "oos_return": float(np.prod(1.0 + test_returns) - 1.0),
+        "oos_max_drawdown": max(
+            fold["test_metrics"]["max_drawdown"] for fold in fold_results
+        ),
+        "oos_trade_count": float(
+            sum(fold["test_metrics"]["trade_count"] for fold in fold_results)
+        ),
+    }
+
+
+def run_walk_forward(
+    frame: pd.DataFrame,
+    context: SearchContext,
+    *,
+    candidates: list[dict[str, ParamValue]] | None = None,
+    max_workers: int = 1,
+) -> dict:
+    backtest = context.backtest
+    folds = walk_forward_folds(
+        len(frame),
+        train_bars=backtest.walk_forward_train_bars,
+        test_bars=backtest.walk_forward_test_bars,
+        max_folds=backtest.walk_forward_max_folds,
+    )
+    resolved_candidates = candidates or default_walk_forward_candidates(context)
+    tasks = [
+        _FoldTask(
+            fold=fold,
+            frame=frame.iloc[fold.train_start : fold.test_end],
+            candidates=resolved_candidates,
+            context=context,
+        )
+        for fold in folds
+    ]
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        fold_results = [_run_fold(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+            fold_results = list(pool.map(_run_fold, tasks))
+
+    return {
+        "train_bars": backtest.walk_forward_train_bars,
+        "test_bars": backtest.walk_forward_test_bars,
+        "folds": fold_results,
+        "aggregate": aggregate_walk_forward(fold_results),
+    }
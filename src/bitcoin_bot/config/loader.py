@@ -6,6 +6,8 @@ from typing import Any
 import yaml
 
 from bitcoin_bot.config.models import (
+    BacktestRunSettings,
+    BacktestSettings,
     DataSettings,
     DiscordSettings,
     ExchangeSettings,
@@ -39,6 +41,14 @@ def load_runtime_config(config_path: str) -> RuntimeConfig:
     data = DataSettings(**_section(payload, "data"))
     strategy = StrategySettings(**_section(payload, "strategy"))
     risk = RiskSettings(**_section(payload, "risk"))
+    backtest_raw = dict(_section(payload, "backtest"))
+    runs_raw = backtest_raw.pop("runs", None) or []
+    if not isinstance(runs_raw, list):
+        raise ValueError("Config backtest.runs must be a list")
+    backtest = BacktestSettings(
+        **backtest_raw,
+        runs=[BacktestRunSettings(**item) for item in runs_raw],
+    )
     optimizer = OptimizerSettings(**_section(payload, "optimizer"))
 
     notify_raw = _section(payload, "notify")
@@ -54,6 +64,7 @@ def load_runtime_config(config_path: str) -> RuntimeConfig:
         data=data,
         strategy=strategy,
         risk=risk,
+        backtest=backtest,
         optimizer=optimizer,
         notify=notify,
         observability=observability,
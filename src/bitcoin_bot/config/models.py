@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 
 
 Mode = Literal["backtest", "paper", "live"]
 ProductType = Literal["spot", "leverage"]
+OptimizerScheduler = Literal["full", "successive_halving"]
+OptimizerSampler = Literal["random", "tpe"]
 
 
 @dataclass(slots=True)
@@ -27,6 +29,11 @@ class ExchangeSettings:
     ws_url: str = "wss://api.coin.z.com/ws"
     private_retry_max_attempts: int = 3
     private_retry_base_delay_seconds: float = 0.0
+    http_keep_alive: bool = True
+    rate_limit_enabled: bool = True
+    public_rate_limit_per_second: float = 6.0
+    private_rate_limit_per_second: float = 6.0
+    rate_limit_burst: int = 6
 
 
 @dataclass(slots=True)
@@ -35,6 +42,11 @@ class DataSettings:
     source_priority: list[str] = field(default_factory=lambda: ["api", "csv"])
     csv_path: str = "./data/sample_klines.csv"
     backtest_data_quality_mode: Literal["strict", "fallback"] = "fallback"
+    ohlcv_cache_enabled: bool = False
+    ohlcv_cache_max_entries: int = 8
+    csv_chunk_rows: int = 0
+    live_kline_store_enabled: bool = True
+    live_window_bars: int = 200
 
 
 @dataclass(slots=True)
@@ -62,10 +74,46 @@ class RiskSettings:
     qty_step: float = 0.001
 
 
+@dataclass(slots=True)
+class BacktestRunSettings:
+    symbol: str = "BTC_JPY"
+    product_type: ProductType = "spot"
+    overrides: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class BacktestSettings:
+    initial_balance: float = 1_000_000.0
+    cooldown_bars: int = 0
+    max_holding_bars: int = 12
+    fee_bps: float | None = None
+    spread_range_fraction: float = 0.1
+    slippage_bps: float = 5.0
+    walk_forward_enabled: bool = False
+    walk_forward_train_bars: int = 1440
+    walk_forward_test_bars: int = 360
+    walk_forward_max_folds: int = 0
+    bootstrap_samples: int = 0
+    bootstrap_block_bars: int = 60
+    bootstrap_seed: int = 0
+    checkpoint_enabled: bool = False
+    runs: list[BacktestRunSettings] = field(default_factory=list)
+
+
 @dataclass(slots=True)
 class OptimizerSettings:
-    enabled: bool = True
+    enabled: bool = False
     opt_trials: int = 50
+    max_workers: int = 1
+    seed: int = 0
+    sampler: OptimizerSampler = "random"
+    scheduler: OptimizerScheduler = "full"
+    halving_eta: int = 3
+    halving_min_fraction: float = 0.04
+    trial_store_enabled: bool = False
+    pareto_enabled: bool = False
+    indicator_cache_disk_enabled: bool = False
+    indicator_cache_max_disk_bytes: int = 1024 * 1024 * 1024
 
 
 @dataclass(slots=True)
@@ -100,6 +148,7 @@ class RuntimeConfig:
     data: DataSettings = field(default_factory=DataSettings)
     strategy: StrategySettings = field(default_factory=StrategySettings)
     risk: RiskSettings = field(default_factory=RiskSettings)
+    backtest: BacktestSettings = field(default_factory=BacktestSettings)
     optimizer: OptimizerSettings = field(default_factory=OptimizerSettings)
     notify: NotifySettings = field(default_factory=NotifySettings)
     observability: ObservabilitySettings = field(default_factory=ObservabilitySettings)
@@ -9,6 +9,9 @@ from bitcoin_bot.config.models import RuntimeConfig
 ALLOWED_MODES = {"backtest", "paper", "live"}
 ALLOWED_PRODUCT_TYPES = {"spot", "leverage"}
 ALLOWED_BACKTEST_DATA_QUALITY_MODES = {"strict", "fallback"}
+ALLOWED_OPTIMIZER_SAMPLERS = {"random", "tpe"}
+ALLOWED_OPTIMIZER_SCHEDULERS = {"full", "successive_halving"}
+ALLOWED_RUN_OVERRIDE_SECTIONS = {"data", "strategy", "risk", "backtest", "optimizer"}
 
 
 def validate_config(config: RuntimeConfig) -> RuntimeConfig:
@@ -48,6 +51,23 @@ def validate_config(config: RuntimeConfig) -> RuntimeConfig:
             f"{config.exchange.private_retry_base_delay_seconds}"
         )
 
+    if config.exchange.public_rate_limit_per_second <= 0.0:
+        raise ValueError(
+            "Invalid exchange.public_rate_limit_per_second: "
+            f"{config.exchange.public_rate_limit_per_second}"
+        )
+
+    if config.exchange.private_rate_limit_per_second <= 0.0:
+        raise ValueError(
+            "Invalid exchange.private_rate_limit_per_second: "
+            f"{config.exchange.private_rate_limit_per_second}"
+        )
+
+    if config.exchange.rate_limit_burst < 1:
+        raise ValueError(
+            f"Invalid exchange.rate_limit_burst: {config.exchange.rate_limit_burst}"
+        )
+
     if not (0.0 < config.strategy.regime_max_atr_to_price_ratio <= 1.0):
         raise ValueError(
             "Invalid strategy.regime_max_atr_to_price_ratio: "
@@ -69,6 +89,31 @@ def validate_config(config: RuntimeConfig) -> RuntimeConfig:
             f"{config.data.backtest_data_quality_mode}"
         )
 
+    if not isinstance(config.data.ohlcv_cache_enabled, bool):
+        raise ValueError(
+            f"Invalid data.ohlcv_cache_enabled: {config.data.ohlcv_cache_enabled}"
+        )
+
+    if config.data.ohlcv_cache_max_entries < 1:
+        raise ValueError(
+            "Invalid data.ohlcv_cache_max_entries: "
+            f"{config.data.ohlcv_cache_max_entries}"
+        )
+
+    if config.data.csv_chunk_rows < 0:
+        raise ValueError(f"Invalid data.csv_chunk_rows: {config.data.csv_chunk_rows}")
+
+    if not isinstance(config.data.live_kline_store_enabled, bool):
+        raise ValueError(
+            "Invalid data.live_kline_store_enabled: "
+            f"{config.data.live_kline_store_enabled}"
+        )
+
+    if config.data.live_window_bars < 1:
+        raise ValueError(
+            f"Invalid data.live_window_bars: {config.data.live_window_bars}"
+        )
+
     if not (0.0 < config.risk.position_risk_fraction <= 1.0):
         raise ValueError(
             f"Invalid risk.position_risk_fraction: {config.risk.position_risk_fraction}"
@@ -80,6 +125,122 @@ def validate_config(config: RuntimeConfig) -> RuntimeConfig:
     if config.risk.qty_step <= 0.0:
         raise ValueError(f"Invalid risk.qty_step: {config.risk.qty_step}")
 
+    if config.backtest.initial_balance <= 0.0:
+        raise ValueError(
+            f"Invalid backtest.initial_balance: {config.backtest.initial_balance}"
+        )
+
+    if config.backtest.cooldown_bars < 0:
+        raise ValueError(
+            f"Invalid backtest.cooldown_bars: {config.backtest.cooldown_bars}"
+        )
+
+    if config.backtest.max_holding_bars < 1:
+        raise ValueError(
+            f"Invalid backtest.max_holding_bars: {config.backtest.max_holding_bars}"
+        )
+
+    if config.backtest.fee_bps is not None and config.backtest.fee_bps < 0.0:
+        raise ValueError(f"Invalid backtest.fee_bps: {config.backtest.fee_bps}")
+
+    if not (0.0 <= config.backtest.spread_range_fraction <= 1.0):
+        raise ValueError(
+            "Invalid backtest.spread_range_fraction: "
+            f"{config.backtest.spread_range_fraction}"
+        )
+
+    if config.backtest.slippage_bps < 0.0:
+        raise ValueError(
+            f"Invalid backtest.slippage_bps: {config.backtest.slippage_bps}"
+        )
+
+    if config.backtest.walk_forward_train_bars < 1:
+        raise ValueError(
+            "Invalid backtest.walk_forward_train_bars: "
+            f"{config.backtest.walk_forward_train_bars}"
+        )
+
+    if config.backtest.walk_forward_test_bars < 1:
+        raise ValueError(
+            "Invalid backtest.walk_forward_test_bars: "
+            f"{config.backtest.walk_forward_test_bars}"
+        )
+
+    if config.backtest.walk_forward_max_folds < 0:
+        raise ValueError(
+            "Invalid backtest.walk_forward_max_folds: "
+            f"{config.backtest.walk_forward_max_folds}"
+        )
+
+    if config.backtest.bootstrap_samples < 0:
+        raise ValueError(
+            f"Invalid backtest.bootstrap_samples: {config.backtest.bootstrap_samples}"
+        )
+
+    if config.backtest.bootstrap_block_bars < 1:
+        raise ValueError(
+            "Invalid backtest.bootstrap_block_bars: "
+            f"{config.backtest.bootstrap_block_bars}"
+        )
+
+    for index, run in enumerate(config.backtest.runs):
+        if run.product_type not in ALLOWED_PRODUCT_TYPES:
+            raise ValueError(
+                f"Invalid backtest.runs[{index}].product_type: {run.product_type}"
+            )
+        for section, values in run.overrides.items():
+            settings = getattr(config, section, None)
+            if section not in ALLOWED_RUN_OVERRIDE_SECTIONS or not isinstance(
+                values, dict
+            ):
+                raise ValueError(f"Invalid backtest.runs[{index}].overrides: {section}")
+            for key in values:
+                if key == "runs" or not hasattr(settings, key):
+                    raise ValueError(
+                        f"Invalid backtest.runs[{index}].overrides: {section}.{key}"
+                    )
+        if run.symbol != config.exchange.symbol and "csv_path" not in run.overrides.get(
+            "data", {}
+        ):
+            raise ValueError(
+                f"Invalid backtest.runs[{index}].overrides: data.csv_path "
+                f"is required for {run.symbol}"
+            )
+
+    if config.optimizer.max_workers < 1:
+        raise ValueError(
+            f"Invalid optimizer.max_workers: {config.optimizer.max_workers}"
+        )
+
+    if config.optimizer.sampler not in ALLOWED_OPTIMIZER_SAMPLERS:
+        raise ValueError(f"Invalid optimizer.sampler: {config.optimizer.sampler}")
+
+    if config.optimizer.scheduler not in ALLOWED_OPTIMIZER_SCHEDULERS:
+        raise ValueError(f"Invalid optimizer.scheduler: {config.optimizer.scheduler}")
+
+    if (
+        config.optimizer.scheduler == "successive_halving"
+        and config.optimizer.sampler != "random"
+    ):
+        raise ValueError(f"Invalid optimizer.sampler: {config.optimizer.sampler}")
+
+    if config.optimizer.halving_eta < 2:
+        raise ValueError(
+            f"Invalid optimizer.halving_eta: {config.optimizer.halving_eta}"
+        )
+
+    if not (0.0 < config.optimizer.halving_min_fraction <= 1.0):
+        raise ValueError(
+            "Invalid optimizer.halving_min_fraction: "
+            f"{config.optimizer.halving_min_fraction}"
+        )
+
+    if config.optimizer.indicator_cache_max_disk_bytes < 0:
+        raise ValueError(
+            "Invalid optimizer.indicator_cache_max_disk_bytes: "
+            f"{config.optimizer.indicator_cache_max_disk_bytes}"
+        )
+
     config.optimizer.opt_trials = max(1, min(500, config.optimizer.opt_trials))
 
     Path(config.paths.artifacts_dir).mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from bitcoin_bot.data.kline_store import (
+    KlineStore,
+    klines_to_ohlcv_frame,
+    timeframe_to_timedelta,
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _utc_day_partitions(
+    start: datetime, end: datetime
+) -> list[tuple[datetime, datetime]]:
+    partitions: list[tuple[datetime, datetime]] = []
+    cursor = _as_utc(start)
+    final = _as_utc(end)
+    while cursor <= final:
+        boundary = datetime(cursor.year, cursor.month, cursor.day, tzinfo=UTC)
+        boundary += timedelta(days=1)
+        partitions.append((cursor, min(boundary - timedelta(milliseconds=1), final)))
+        cursor = boundary
+    return partitions
+
+
+def kline_backfill_partitions(
+    adapter: Any,
+    *,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+) -> list[tuple[datetime, datetime]]:
+    partitioner = getattr(adapter, "kline_partitions", None)
+    if callable(partitioner):
+        return list(partitioner(timeframe, start, end))
+    return _utc_day_partitions(start, end)
+
+
+def backfill_klines(
+    *,
+    adapter: Any,
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    cache_dir: str,
+    provider: str = "gmo",
+    max_workers: int = 4,
+) -> dict:
+    partitions = kline_backfill_partitions(
+        adapter, timeframe=timeframe, start=start, end=end
+    )
+    bar_interval = timeframe_to_timedelta(timeframe)
+
+    def _fetch_partition(partition: tuple[datetime, datetime]) -> Any:
+        partition_start, partition_end = partition
+        limit = (partition_end - partition_start) // bar_interval + 1
+        return adapter.fetch_klines(
+            symbol, timeframe, partition_start, partition_end, limit
+        )
+
+    store = KlineStore(
+        cache_dir=cache_dir, symbol=symbol, timeframe=timeframe, provider=provider
+    )
+    stored_until = store.last_timestamp()
+    failed_partitions: list[str] = []
+    deferred: list[pd.DataFrame] = []
+    fetched_bars = 0
+    written_bars = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = executor.map(_fetch_partition, partitions)
+        for (partition_start, _), klines in zip(partitions, results):
+            if getattr(klines, "error", None) is not None:
+                failed_partitions.append(partition_start.isoformat())
+                continue
+            fetched_bars += len(klines)
+            if not klines:
+                continue
+            frame = klines_to_ohlcv_frame(
+                klines, provider=provider, symbol=symbol, timeframe=timeframe
+            )
+            if stored_until is None or frame.index.min() > stored_until:
+                written_bars += store.append_frame(frame)
+                stored_until = store.last_timestamp()
+            else:
+                deferred.append(frame)
+    if deferred:
+        written_bars += store.merge_frame(pd.concat(deferred))
+
+    return {
+        "status": "degraded" if failed_partitions else "success",
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "partitions": len(partitions),
+        "fetched_bars": fetched_bars,
+        "written_bars": written_bars,
+        "failed_partitions": failed_partitions,
+        "cache_entry_dir": str(store.entry_dir),
+    }
+
+
+def load_backfilled_ohlcv(
+    cache_dir: str | Path,
+    *,
+    symbol: str,
+    timeframe: str,
+    start: datetime,
+    end: datetime,
+    provider: str = "gmo",
+) -> pd.DataFrame | None:
+    stored = KlineStore(
+        cache_dir=str(cache_dir), symbol=symbol, timeframe=timeframe, provider=provider
+    ).load()
+    if stored is None:
+        return None
+    window = stored.loc[pd.Timestamp(_as_utc(start)) : pd.Timestamp(_as_utc(end))]
+    if window.empty:
+        return None
+    return window
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.data.ohlcv import normalize_ohlcv_frame
+from bitcoin_bot.data.ohlcv_cache import (
+    KLINE_STORE_FINGERPRINT,
+    KLINE_STORE_SOURCE_ID,
+    OhlcvCacheWriter,
+    kline_store_entry_dir,
+    read_ohlcv_cache,
+)
+from bitcoin_bot.exchange.protocol import NormalizedKline
+
+_TIMEFRAME_PATTERN = re.compile(r"^(\d+)\s*(s|sec|m|min|h|hour|d|day|w|week)$")
+_TIMEFRAME_UNITS = {
+    "s": "seconds",
+    "sec": "seconds",
+    "m": "minutes",
+    "min": "minutes",
+    "h": "hours",
+    "hour": "hours",
+    "d": "days",
+    "day": "days",
+    "w": "weeks",
+    "week": "weeks",
+}
+
+
+def timeframe_to_timedelta(timeframe: str) -> timedelta:
+    matched = _TIMEFRAME_PATTERN.match(timeframe.strip().lower())
+    if matched is None:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    amount, unit = matched.groups()
+    return timedelta(**{_TIMEFRAME_UNITS[unit]: int(amount)})
+
+
+def klines_to_ohlcv_frame(
+    klines: Sequence[NormalizedKline],
+    *,
+    provider: str,
+    symbol: str,
+    timeframe: str,
+) -> pd.DataFrame:
+    return normalize_ohlcv_frame(
+        {
+            "timestamp": pd.to_datetime(
+                [kline.timestamp for kline in klines], utc=True
+            ),
+            "open": np.array([kline.open for kline in klines], dtype=float),
+            "high": np.array([kline.high for kline in klines], dtype=float),
+            "low": np.array([kline.low for kline in klines], dtype=float),
+            "close": np.array([kline.close for kline in klines], dtype=float),
+            "volume": np.array([kline.volume for kline in klines], dtype=float),
+        },
+        provider=provider,
+        symbol=symbol,
+        timeframe=timeframe,
+        missing_policy="drop",
+    )
+
+
+@dataclass(slots=True)
+class KlineStore:
+    cache_dir: str
+    symbol: str
+    timeframe: str
+    provider: str = "gmo"
+
+    @property
+    def entry_dir(self) -> Path:
+        return kline_store_entry_dir(
+            self.cache_dir,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            provider=self.provider,
+        )
+
+    def tail(self, rows: int) -> pd.DataFrame | None:
+        return read_ohlcv_cache(
+            self.entry_dir,
+            fingerprint=KLINE_STORE_FINGERPRINT,
+            tail_rows=rows,
+        )
+
+    def load(self) -> pd.DataFrame | None:
+        return read_ohlcv_cache(self.entry_dir, fingerprint=KLINE_STORE_FINGERPRINT)
+
+    def last_timestamp(self) -> pd.Timestamp | None:
+        last_row = self.tail(1)
+        if last_row is None or last_row.empty:
+            return None
+        return pd.Timestamp(last_row.index[-1])
+
+    def _write(self, frame: pd.DataFrame, *, append: bool) -> None:
+        writer = OhlcvCacheWriter(
+            entry_dir=self.entry_dir,
+            source_id=KLINE_STORE_SOURCE_ID,
+            fingerprint=KLINE_STORE_FINGERPRINT,
+            attrs={
+                "provider": self.provider,
+                "symbol": self.symbol,
+                "timeframe": self.timeframe,
+                "missing_policy": "drop",
+            },
+            append=append,
+        )
+        try:
+            writer.append(frame)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+
+    def append_frame(self, frame: pd.DataFrame) -> int:
+        if frame.empty:
+            return 0
+
+        candidates = frame.sort_index(kind="stable")
+        candidates = candidates[~candidates.index.duplicated(keep="last")]
+        last_timestamp = self.last_timestamp()
+        if last_timestamp is not None:
+            candidates = candidates[candidates.index > last_timestamp]
+        if candidates.empty:
+            return 0
+
+        self._write(candidates, append=True)
+        return len(candidates)
+
+    def merge_frame(self, frame: pd.DataFrame) -> int:
+        if frame.empty:
+            return 0
+        existing = self.load()
+        if existing is None or existing.empty:
+            return self.append_frame(frame)
+        if frame.index.min() > existing.index[-1]:
+            return self.append_frame(frame)
+
+        added = frame[~frame.index.isin(existing.index)]
+        added = added[~added.index.duplicated(keep="last")]
+        if added.empty:
+            return 0
+        merged = pd.concat([existing, added]).sort_index(kind="stable")
+        self._write(merged, append=False)
+        return len(added)
+
+    def append_klines(self, klines: Sequence[NormalizedKline]) -> int:
+        if not klines:
+            return 0
+        return self.append_frame(
+            klines_to_ohlcv_frame(
+                klines,
+                provider=self.provider,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+            )
+        )
@@ -1,45 +1,77 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import tempfile
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Literal
+from typing import Literal, cast
 
+import numpy as np
 import pandas as pd
 
+from bitcoin_bot.data.ohlcv_cache import (
+    KLINE_STORE_FINGERPRINT,
+    OhlcvCacheWriter,
+    csv_source_fingerprint,
+    kline_store_entry_dir,
+    ohlcv_cache_entry_dir,
+    prune_ohlcv_cache,
+    read_ohlcv_cache,
+    write_ohlcv_cache,
+)
+
 REQUIRED_OHLCV_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
 MissingPolicy = Literal["drop", "ffill"]
 
 
-def normalize_ohlcv(
-    rows: Sequence[dict[str, object]],
+def _column_length(data: pd.DataFrame | Mapping[str, object]) -> int:
+    if isinstance(data, pd.DataFrame):
+        return len(data)
+    for column in REQUIRED_OHLCV_COLUMNS:
+        if column in data:
+            return len(np.asarray(data[column]))
+    return 0
+
+
+def _coerce_ohlcv_columns(
+    data: pd.DataFrame | Mapping[str, object],
+) -> dict[str, pd.Series]:
+    length = _column_length(data)
+    raw_timestamps = data["timestamp"] if "timestamp" in data else np.full(length, None)
+    timestamps = pd.Series(
+        pd.to_datetime(np.asarray(raw_timestamps), errors="coerce", utc=True)
+    )
+    values: dict[str, pd.Series] = {"timestamp": timestamps}
+    for numeric_column in REQUIRED_OHLCV_COLUMNS[1:]:
+        raw_values = (
+            data[numeric_column] if numeric_column in data else np.full(length, np.nan)
+        )
+        values[numeric_column] = pd.Series(
+            pd.to_numeric(np.asarray(raw_values), errors="coerce")
+        )
+    return values
+
+
+def _build_ohlcv_frame(
+    values: dict[str, pd.Series],
     *,
     provider: str,
     symbol: str,
     timeframe: str,
-    missing_policy: MissingPolicy = "drop",
+    missing_policy: MissingPolicy,
 ) -> pd.DataFrame:
-    frame = pd.DataFrame(list(rows))
-    if frame.empty:
-        frame = pd.DataFrame(columns=REQUIRED_OHLCV_COLUMNS)
-
-    for column in REQUIRED_OHLCV_COLUMNS:
-        if column not in frame.columns:
-            frame[column] = pd.NA
-
-    frame = frame[REQUIRED_OHLCV_COLUMNS].copy()
-    frame["timestamp"] = pd.to_datetime(frame["timestamp"], errors="coerce", utc=True)
-    for numeric_column in REQUIRED_OHLCV_COLUMNS[1:]:
-        frame[numeric_column] = pd.to_numeric(frame[numeric_column], errors="coerce")
-
-    if missing_policy == "drop":
-        frame = frame.dropna(subset=REQUIRED_OHLCV_COLUMNS)
-    elif missing_policy == "ffill":
-        frame = frame.ffill().dropna(subset=REQUIRED_OHLCV_COLUMNS)
-    else:
-        raise ValueError(f"Unsupported missing_policy: {missing_policy}")
+    valid = np.ones(len(values["timestamp"]), dtype=bool)
+    for series in values.values():
+        valid &= series.notna().to_numpy()
+    if not valid.all():
+        values = {column: series[valid] for column, series in values.items()}
 
-    frame = frame.set_index("timestamp", drop=False)
+    index = pd.DatetimeIndex(values["timestamp"], name="timestamp")
+    frame = pd.DataFrame(
+        {"timestamp": index}
+        | {column: values[column].to_numpy() for column in REQUIRED_OHLCV_COLUMNS[1:]},
+        index=index,
+    )
     frame.attrs["provider"] = provider
     frame.attrs["symbol"] = symbol
     frame.attrs["timeframe"] = timeframe
@@ -47,6 +79,100 @@ def normalize_ohlcv(
     return frame
 
 
+def normalize_ohlcv_frame(
+    data: pd.DataFrame | Mapping[str, object],
+    *,
+    provider: str,
+    symbol: str,
+    timeframe: str,
+    missing_policy: MissingPolicy = "drop",
+) -> pd.DataFrame:
+    if missing_policy not in {"drop", "ffill"}:
+        raise ValueError(f"Unsupported missing_policy: {missing_policy}")
+
+    values = _coerce_ohlcv_columns(data)
+    if missing_policy == "ffill":
+        values = {column: series.ffill() for column, series in values.items()}
+
+    return _build_ohlcv_frame(
+        values,
+        provider=provider,
+        symbol=symbol,
+        timeframe=timeframe,
+        missing_policy=missing_policy,
+    )
+
+
+def iter_ohlcv_csv_chunks(
+    csv_path: str | Path,
+    *,
+    chunk_rows: int,
+    provider: str,
+    symbol: str,
+    timeframe: str,
+    missing_policy: MissingPolicy = "drop",
+) -> Iterator[pd.DataFrame]:
+    if missing_policy not in {"drop", "ffill"}:
+        raise ValueError(f"Unsupported missing_policy: {missing_policy}")
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >=1, got {chunk_rows}")
+
+    def _iter_chunks() -> Iterator[pd.DataFrame]:
+        carry: dict[str, pd.Series] | None = None
+        with pd.read_csv(csv_path, chunksize=chunk_rows) as reader:
+            for raw_chunk in reader:
+                values = _coerce_ohlcv_columns(raw_chunk)
+                if missing_policy == "ffill":
+                    if carry is not None:
+                        values = {
+                            column: pd.concat(
+                                [carry[column], series], ignore_index=True
+                            )
+                            .ffill()
+                            .iloc[1:]
+                            .reset_index(drop=True)
+                            for column, series in values.items()
+                        }
+                    else:
+                        values = {
+                            column: series.ffill() for column, series in values.items()
+                        }
+                    if len(values["timestamp"]) > 0:
+                        carry = {
+                            column: series.iloc[-1:]
+                            for column, series in values.items()
+                        }
+
+                frame = _build_ohlcv_frame(
+                    values,
+                    provider=provider,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    missing_policy=missing_policy,
+                )
+                if not frame.empty:
+                    yield frame
+
+    return _iter_chunks()
+
+
+def normalize_ohlcv(
+    rows: Sequence[dict[str, object]],
+    *,
+    provider: str,
+    symbol: str,
+    timeframe: str,
+    missing_policy: MissingPolicy = "drop",
+) -> pd.DataFrame:
+    return normalize_ohlcv_frame(
+        pd.DataFrame(list(rows)),
+        provider=provider,
+        symbol=symbol,
+        timeframe=timeframe,
+        missing_policy=missing_policy,
+    )
+
+
 def validate_ohlcv_row(row: dict[str, object]) -> bool:
     frame = normalize_ohlcv(
         [row],
@@ -90,41 +216,207 @@ def _synthetic_ohlcv(*, symbol: str, timeframe: str) -> pd.DataFrame:
     )
 
 
-def load_ohlcv_for_backtest(
+class _CsvReadError(Exception):
+    pass
+
+
+def _checked_csv_chunks(
+    csv_path: Path,
     *,
-    csv_path: str,
+    chunk_rows: int,
+    provider: str,
     symbol: str,
     timeframe: str,
-    provider: str = "csv",
-    missing_policy: MissingPolicy = "drop",
-    backtest_data_quality_mode: Literal["strict", "fallback"] = "fallback",
-) -> tuple[pd.DataFrame, str, str | None]:
-    if backtest_data_quality_mode not in {"strict", "fallback"}:
-        raise ValueError(
-            f"Unsupported backtest_data_quality_mode: {backtest_data_quality_mode}"
+    missing_policy: MissingPolicy,
+) -> Iterator[pd.DataFrame]:
+    chunks = iter_ohlcv_csv_chunks(
+        csv_path,
+        chunk_rows=chunk_rows,
+        provider=provider,
+        symbol=symbol,
+        timeframe=timeframe,
+        missing_policy=missing_policy,
+    )
+    while True:
+        try:
+            chunk = next(chunks, None)
+        except (OSError, ValueError) as exc:
+            raise _CsvReadError(str(exc)) from exc
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _concat_ohlcv_chunks(
+    chunks: Iterator[pd.DataFrame], *, attrs: dict[str, object]
+) -> pd.DataFrame:
+    frames = list(chunks)
+    if not frames:
+        return normalize_ohlcv_frame(
+            pd.DataFrame(),
+            provider=str(attrs["provider"]),
+            symbol=str(attrs["symbol"]),
+            timeframe=str(attrs["timeframe"]),
+            missing_policy=cast(MissingPolicy, attrs["missing_policy"]),
         )
+    frame = pd.concat(frames)
+    frame.attrs.update(attrs)
+    return frame
 
-    def _strict_or_fallback(reason: str) -> tuple[pd.DataFrame, str, str | None]:
-        if backtest_data_quality_mode == "strict":
-            raise ValueError(f"backtest_data_quality_error:{reason}")
-        return (
-            _synthetic_ohlcv(symbol=symbol, timeframe=timeframe),
-            "synthetic_fallback",
-            reason,
+
+def _spill_ohlcv_chunks(
+    chunks: Iterator[pd.DataFrame],
+    *,
+    entry_dir: Path,
+    source_id: str,
+    fingerprint: dict[str, int],
+    attrs: dict[str, object],
+    evictable: bool,
+) -> pd.DataFrame:
+    writer = OhlcvCacheWriter(
+        entry_dir=entry_dir,
+        source_id=source_id,
+        fingerprint=fingerprint,
+        attrs=attrs,
+        evictable=evictable,
+    )
+    try:
+        for chunk in chunks:
+            writer.append(chunk)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+    frame = read_ohlcv_cache(entry_dir, fingerprint=fingerprint)
+    if frame is None:
+        raise OSError("ohlcv_cache_unreadable_after_write")
+    return frame
+
+
+def _load_ohlcv_csv_chunks(
+    csv_path: Path,
+    *,
+    chunk_rows: int,
+    cache_entry_dir: Path | None,
+    fingerprint: dict[str, int],
+    provider: str,
+    symbol: str,
+    timeframe: str,
+    missing_policy: MissingPolicy,
+) -> pd.DataFrame:
+    attrs: dict[str, object] = {
+        "provider": provider,
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "missing_policy": missing_policy,
+    }
+
+    def _chunks() -> Iterator[pd.DataFrame]:
+        return _checked_csv_chunks(
+            csv_path,
+            chunk_rows=chunk_rows,
+            provider=provider,
+            symbol=symbol,
+            timeframe=timeframe,
+            missing_policy=missing_policy,
         )
 
-    path = Path(csv_path)
+    try:
+        if cache_entry_dir is not None:
+            return _spill_ohlcv_chunks(
+                _chunks(),
+                entry_dir=cache_entry_dir,
+                source_id=str(csv_path.resolve()),
+                fingerprint=fingerprint,
+                attrs=attrs,
+                evictable=True,
+            )
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as spill_dir:
+            return _spill_ohlcv_chunks(
+                _chunks(),
+                entry_dir=Path(spill_dir),
+                source_id=str(csv_path.resolve()),
+                fingerprint=fingerprint,
+                attrs=attrs,
+                evictable=False,
+            )
+    except OSError:
+        return _concat_ohlcv_chunks(_chunks(), attrs=attrs)
+
+
+def _load_kline_store_source(
+    kline_store_dir: str | None, *, symbol: str, timeframe: str
+) -> pd.DataFrame | None:
+    if kline_store_dir is None:
+        return None
+    stored = read_ohlcv_cache(
+        kline_store_entry_dir(kline_store_dir, symbol=symbol, timeframe=timeframe),
+        fingerprint=KLINE_STORE_FINGERPRINT,
+    )
+    if stored is None or len(stored) < 2:
+        return None
+    return stored
+
+
+def _load_csv_source(
+    path: Path,
+    *,
+    symbol: str,
+    timeframe: str,
+    provider: str,
+    missing_policy: MissingPolicy,
+    cache_dir: str | None,
+    chunk_rows: int | None,
+    cache_max_entries: int | None,
+) -> tuple[pd.DataFrame | None, str | None]:
     if not path.exists():
-        return _strict_or_fallback("csv_not_found")
+        return None, "csv_not_found"
+
+    cache_entry_dir: Path | None = None
+    fingerprint: dict[str, int] = {}
+    if cache_dir is not None:
+        fingerprint = csv_source_fingerprint(path)
+        cache_entry_dir = ohlcv_cache_entry_dir(
+            cache_dir,
+            source_id=str(path.resolve()),
+            provider=provider,
+            symbol=symbol,
+            timeframe=timeframe,
+            missing_policy=missing_policy,
+        )
+        cached = read_ohlcv_cache(cache_entry_dir, fingerprint=fingerprint)
+        if cached is not None and len(cached) >= 2:
+            return cached, None
+
+    if chunk_rows is not None and chunk_rows > 0:
+        try:
+            frame = _load_ohlcv_csv_chunks(
+                path,
+                chunk_rows=chunk_rows,
+                cache_entry_dir=cache_entry_dir,
+                fingerprint=fingerprint,
+                provider=provider,
+                symbol=symbol,
+                timeframe=timeframe,
+                missing_policy=missing_policy,
+            )
+        except _CsvReadError:
+            return None, "csv_read_error"
+
+        if len(frame) < 2:
+            return None, "insufficient_rows"
+        if cache_dir is not None and cache_max_entries is not None:
+            prune_ohlcv_cache(cache_dir, max_entries=cache_max_entries)
+        return frame, None
 
     try:
         csv_frame = pd.read_csv(path)
     except Exception:
-        return _strict_or_fallback("csv_read_error")
+        return None, "csv_read_error"
 
-    rows = csv_frame.to_dict("records")
-    frame = normalize_ohlcv(
-        rows,
+    frame = normalize_ohlcv_frame(
+        csv_frame,
         provider=provider,
         symbol=symbol,
         timeframe=timeframe,
@@ -132,6 +424,74 @@ def load_ohlcv_for_backtest(
     )
 
     if len(frame) < 2:
-        return _strict_or_fallback("insufficient_rows")
+        return None, "insufficient_rows"
+
+    if cache_entry_dir is not None:
+        try:
+            write_ohlcv_cache(
+                frame,
+                entry_dir=cache_entry_dir,
+                source_id=str(path.resolve()),
+                fingerprint=fingerprint,
+                evictable=True,
+            )
+        except OSError:
+            pass
+        if cache_dir is not None and cache_max_entries is not None:
+            prune_ohlcv_cache(cache_dir, max_entries=cache_max_entries)
+
+    return frame, None
+
 
-    return frame, "csv", None
+def load_ohlcv_for_backtest(
+    *,
+    csv_path: str,
+    symbol: str,
+    timeframe: str,
+    provider: str = "csv",
+    missing_policy: MissingPolicy = "drop",
+    backtest_data_quality_mode: Literal["strict", "fallback"] = "fallback",
+    cache_dir: str | None = None,
+    chunk_rows: int | None = None,
+    cache_max_entries: int | None = None,
+    source_priority: Sequence[str] = ("csv",),
+    kline_store_dir: str | None = None,
+) -> tuple[pd.DataFrame, str, str | None]:
+    if backtest_data_quality_mode not in {"strict", "fallback"}:
+        raise ValueError(
+            f"Unsupported backtest_data_quality_mode: {backtest_data_quality_mode}"
+        )
+
+    reason = "no_data_source"
+    for source in source_priority:
+        if source == "api":
+            stored = _load_kline_store_source(
+                kline_store_dir, symbol=symbol, timeframe=timeframe
+            )
+            if stored is not None:
+                fallback_reason = None if reason == "no_data_source" else reason
+                return stored, "kline_store", fallback_reason
+        elif source == "csv":
+            frame, csv_reason = _load_csv_source(
+                Path(csv_path),
+                symbol=symbol,
+                timeframe=timeframe,
+                provider=provider,
+                missing_policy=missing_policy,
+                cache_dir=cache_dir,
+                chunk_rows=chunk_rows,
+                cache_max_entries=cache_max_entries,
+            )
+            if frame is not None:
+                return frame, "csv", None
+            reason = csv_reason or reason
+            if backtest_data_quality_mode == "strict":
+                raise ValueError(f"backtest_data_quality_error:{reason}")
+
+    if backtest_data_quality_mode == "strict":
+        raise ValueError(f"backtest_data_quality_error:{reason}")
+    return (
+        _synthetic_ohlcv(symbol=symbol, timeframe=timeframe),
+        "synthetic_fallback",
+        reason,
+    )
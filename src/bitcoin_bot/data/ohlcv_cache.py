@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.utils.io import atomic_dump_json
+
+OHLCV_CACHE_FORMAT_VERSION = 1
+_META_FILENAME = "meta.json"
+_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+_FRAME_ATTR_KEYS = ("provider", "symbol", "timeframe", "missing_policy")
+KLINE_STORE_SOURCE_ID = "kline_store"
+KLINE_STORE_FINGERPRINT: dict[str, int] = {"store_version": 1}
+
+
+def csv_source_fingerprint(csv_path: str | Path) -> dict[str, int]:
+    stat = Path(csv_path).stat()
+    return {"mtime_ns": int(stat.st_mtime_ns), "size": int(stat.st_size)}
+
+
+def ohlcv_cache_entry_dir(
+    cache_dir: str | Path,
+    *,
+    source_id: str,
+    provider: str,
+    symbol: str,
+    timeframe: str,
+    missing_policy: str,
+) -> Path:
+    key_text = "|".join([source_id, provider, symbol, timeframe, missing_policy])
+    digest = hashlib.sha256(key_text.encode("utf-8")).hexdigest()[:32]
+    return Path(cache_dir) / "ohlcv" / digest
+
+
+def kline_store_entry_dir(
+    cache_dir: str | Path, *, symbol: str, timeframe: str, provider: str = "gmo"
+) -> Path:
+    return ohlcv_cache_entry_dir(
+        cache_dir,
+        source_id=KLINE_STORE_SOURCE_ID,
+        provider=provider,
+        symbol=symbol,
+        timeframe=timeframe,
+        missing_policy="drop",
+    )
+
+
+def _column_path(entry_dir: Path, column: str) -> Path:
+    return entry_dir / f"{column}.bin"
+
+
+def _timestamp_values(frame: pd.DataFrame) -> np.ndarray:
+    timestamps = pd.DatetimeIndex(frame["timestamp"]).as_unit("ns")
+    return timestamps.asi8
+
+
+class OhlcvCacheWriter:
+    def __init__(
+        self,
+        *,
+        entry_dir: str | Path,
+        source_id: str,
+        fingerprint: dict[str, int],
+        attrs: dict[str, object],
+        dtypes: dict[str, str] | None = None,
+        append: bool = False,
+        evictable: bool = False,
+    ) -> None:
+        self.entry_dir = Path(entry_dir)
+        self.source_id = source_id
+        self.fingerprint = fingerprint
+        self.attrs = attrs
+        self.evictable = evictable
+        self.dtypes = {"timestamp": "<i8"} | (
+            dtypes or {column: "<f8" for column in _VALUE_COLUMNS}
+        )
+        self.rows = 0
+        self._handles: dict[str, BinaryIO] = {}
+        self._temp_paths: dict[str, Path] = {}
+
+        self.entry_dir.mkdir(parents=True, exist_ok=True)
+        existing = _load_meta(self.entry_dir) if append else None
+        if existing is not None and existing.get("fingerprint") == fingerprint:
+            self.rows = int(existing.get("rows", 0))
+            self.dtypes = dict(existing.get("dtypes", self.dtypes))
+            for column in ("timestamp", *_VALUE_COLUMNS):
+                column_path = _column_path(self.entry_dir, column)
+                column_path.touch(exist_ok=True)
+                handle = column_path.open("r+b")
+                handle.truncate(self.rows * np.dtype(self.dtypes[column]).itemsize)
+                handle.seek(0, 2)
+                self._handles[column] = handle
+            return
+
+        for column in ("timestamp", *_VALUE_COLUMNS):
+            temp_path = _column_path(self.entry_dir, column).with_suffix(".bin.tmp")
+            self._temp_paths[column] = temp_path
+            self._handles[column] = temp_path.open("wb")
+
+    def append(self, frame: pd.DataFrame) -> None:
+        if frame.empty:
+            return
+        arrays: dict[str, np.ndarray] = {"timestamp": _timestamp_values(frame)}
+        for column in _VALUE_COLUMNS:
+            arrays[column] = frame[column].to_numpy()
+        for column, values in arrays.items():
+            np.ascontiguousarray(values, dtype=np.dtype(self.dtypes[column])).tofile(
+                self._handles[column]
+            )
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        if self._temp_paths:
+            (self.entry_dir / _META_FILENAME).unlink(missing_ok=True)
+            for column, temp_path in self._temp_paths.items():
+                temp_path.replace(_column_path(self.entry_dir, column))
+        atomic_dump_json(
+            str(self.entry_dir / _META_FILENAME),
+            {
+                "format_version": OHLCV_CACHE_FORMAT_VERSION,
+                "source_id": self.source_id,
+                "fingerprint": self.fingerprint,
+                "rows": self.rows,
+                "dtypes": self.dtypes,
+                "attrs": self.attrs,
+                "evictable": self.evictable,
+            },
+        )
+
+    def abort(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        for temp_path in self._temp_paths.values():
+            temp_path.unlink(missing_ok=True)
+
+
+def write_ohlcv_cache(
+    frame: pd.DataFrame,
+    *,
+    entry_dir: str | Path,
+    source_id: str,
+    fingerprint: dict[str, int],
+    evictable: bool = False,
+) -> None:
+    writer = OhlcvCacheWriter(
+        entry_dir=entry_dir,
+        source_id=source_id,
+        fingerprint=fingerprint,
+        attrs={key: frame.attrs.get(key) for key in _FRAME_ATTR_KEYS},
+        dtypes={
+            column: frame[column].to_numpy().dtype.str for column in _VALUE_COLUMNS
+        },
+        evictable=evictable,
+    )
+    try:
+        writer.append(frame)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+
+def _load_meta(entry_dir: Path) -> dict | None:
+    meta_path = entry_dir / _META_FILENAME
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict):
+        return None
+    if meta.get("format_version") != OHLCV_CACHE_FORMAT_VERSION:
+        return None
+    return meta
+
+
+def prune_ohlcv_cache(cache_dir: str | Path, *, max_entries: int) -> int:
+    root = Path(cache_dir) / "ohlcv"
+    if not root.is_dir():
+        return 0
+    entries: list[tuple[int, Path]] = []
+    for entry_dir in root.iterdir():
+        meta = _load_meta(entry_dir)
+        if meta is None or not meta.get("evictable", False):
+            continue
+        with contextlib.suppress(OSError):
+            entries.append(((entry_dir / _META_FILENAME).stat().st_mtime_ns, entry_dir))
+    entries.sort(reverse=True)
+    for _, entry_dir in entries[max(max_entries, 0) :]:
+        shutil.rmtree(entry_dir, ignore_errors=True)
+    return max(len(entries) - max(max_entries, 0), 0)
+
+
+def read_ohlcv_cache(
+    entry_dir: str | Path,
+    *,
+    fingerprint: dict[str, int],
+    tail_rows: int | None = None,
+) -> pd.DataFrame | None:
+    source = Path(entry_dir)
+    meta = _load_meta(source)
+    if meta is None or meta.get("fingerprint") != fingerprint:
+        return None
+
+    rows = int(meta.get("rows", 0))
+    offset = 0 if tail_rows is None else max(rows - max(tail_rows, 0), 0)
+    dtypes = meta.get("dtypes", {})
+    arrays: dict[str, np.ndarray] = {}
+    for column in ("timestamp", *_VALUE_COLUMNS):
+        column_path = _column_path(source, column)
+        dtype = np.dtype(dtypes.get(column, "<f8"))
+        if not column_path.exists():
+            return None
+        if column_path.stat().st_size < rows * dtype.itemsize:
+            return None
+        if rows - offset == 0:
+            arrays[column] = np.empty(0, dtype=dtype)
+        else:
+            arrays[column] = np.memmap(
+                column_path,
+                dtype=dtype,
+                mode="r",
+                offset=offset * dtype.itemsize,
+                shape=(rows - offset,),
+            )
+
+    timestamps = pd.DatetimeIndex(
+        pd.to_datetime(np.asarray(arrays["timestamp"]), utc=True), name="timestamp"
+    )
+    frame = pd.DataFrame(
+        {"timestamp": timestamps}
+        | {column: np.asarray(arrays[column]) for column in _VALUE_COLUMNS},
+        index=timestamps,
+        copy=False,
+    )
+    for key, value in dict(meta.get("attrs", {})).items():
+        frame.attrs[key] = value
+    if meta.get("evictable", False):
+        with contextlib.suppress(OSError):
+            os.utime(source / _META_FILENAME)
+    return frame
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TypeVar, cast
+
+from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
+from bitcoin_bot.exchange.protocol import (
+    AsyncExchangeProtocol,
+    ErrorAwareList,
+    NormalizedAccountEvent,
+    NormalizedBalance,
+    NormalizedError,
+    NormalizedKline,
+    NormalizedOrder,
+    NormalizedOrderEvent,
+    NormalizedOrderState,
+    NormalizedPosition,
+    NormalizedTicker,
+    ProductType,
+)
+
+TEvent = TypeVar("TEvent")
+_STREAM_END = object()
+
+
+async def _iterate_in_thread(
+    factory: Callable[[], Iterator[TEvent]],
+) -> AsyncIterator[TEvent]:
+    iterator = factory()
+    try:
+        while True:
+            item = await asyncio.to_thread(next, iterator, _STREAM_END)
+            if item is _STREAM_END:
+                return
+            yield cast(TEvent, item)
+    finally:
+        with contextlib.suppress(ValueError):
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+
+@dataclass(slots=True)
+class AsyncGMOAdapter(AsyncExchangeProtocol):
+    adapter: GMOAdapter
+
+    @property
+    def product_type(self) -> ProductType:
+        return self.adapter.product_type
+
+    def normalize_error(
+        self,
+        *,
+        source_code: str | None,
+        message: str,
+    ) -> NormalizedError:
+        return self.adapter.normalize_error(source_code=source_code, message=message)
+
+    async def fetch_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        limit: int,
+    ) -> ErrorAwareList[NormalizedKline]:
+        return await asyncio.to_thread(
+            self.adapter.fetch_klines,
+            symbol=symbol,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            limit=limit,
+        )
+
+    async def fetch_ticker(self, symbol: str) -> NormalizedTicker | NormalizedError:
+        return await asyncio.to_thread(self.adapter.fetch_ticker, symbol)
+
+    async def fetch_balances(
+        self, account_type: str
+    ) -> list[NormalizedBalance] | NormalizedError:
+        return await asyncio.to_thread(self.adapter.fetch_balances, account_type)
+
+    async def fetch_positions(self, symbol: str) -> ErrorAwareList[NormalizedPosition]:
+        return await asyncio.to_thread(self.adapter.fetch_positions, symbol)
+
+    async def place_order(self, order_request: NormalizedOrder) -> NormalizedOrderState:
+        return await asyncio.to_thread(self.adapter.place_order, order_request)
+
+    async def cancel_order(self, order_id: str) -> NormalizedOrderState:
+        return await asyncio.to_thread(self.adapter.cancel_order, order_id)
+
+    async def fetch_order(self, order_id: str) -> NormalizedOrderState:
+        return await asyncio.to_thread(self.adapter.fetch_order, order_id)
+
+    def stream_order_events(
+        self,
+    ) -> AsyncIterator[NormalizedOrderEvent | NormalizedError]:
+        return _iterate_in_thread(self.adapter.stream_order_events)
+
+    def stream_account_events(
+        self,
+    ) -> AsyncIterator[NormalizedAccountEvent | NormalizedError]:
+        return _iterate_in_thread(self.adapter.stream_account_events)
@@ -9,13 +9,15 @@ import secrets
 import socket
 import ssl
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+from http.client import HTTPException
 from time import sleep, time
 from typing import Callable, Iterator, TypeVar
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode, urlparse
 from urllib.request import Request, urlopen
 
+from bitcoin_bot.exchange.http_pool import HttpConnectionPool
 from bitcoin_bot.exchange.protocol import (
     ErrorAwareList,
     NormalizedAccountEvent,
@@ -31,10 +33,28 @@ from bitcoin_bot.exchange.protocol import (
     ProductType,
     ReadFailureInfo,
 )
+from bitcoin_bot.exchange.rate_limit import GMORateLimiter
 
 
 TStreamEvent = TypeVar("TStreamEvent")
 
+GMO_KLINE_INTERVALS = {
+    "1m": "1min",
+    "5m": "5min",
+    "10m": "10min",
+    "15m": "15min",
+    "30m": "30min",
+    "1h": "1hour",
+    "4h": "4hour",
+    "8h": "8hour",
+    "12h": "12hour",
+    "1d": "1day",
+    "1w": "1week",
+}
+_GMO_YEARLY_KLINE_INTERVALS = {"4hour", "8hour", "12hour", "1day", "1week", "1month"}
+# GMO kline dates roll over at 06:00 JST (21:00 UTC).
+_GMO_KLINE_DATE_OFFSET = timedelta(hours=3)
+
 
 @dataclass(slots=True)
 class GMOAdapter(ExchangeProtocol):
@@ -47,6 +67,8 @@ class GMOAdapter(ExchangeProtocol):
     private_retry_base_delay_seconds: float = 0.0
     order_stream_source_factory: Callable[[], Iterator[dict]] | None = None
     account_stream_source_factory: Callable[[], Iterator[dict]] | None = None
+    connection_pool: HttpConnectionPool | None = None
+    rate_limiter: GMORateLimiter | None = None
 
     def _to_float(self, value: object) -> float | None:
         if isinstance(value, (int, float)):
@@ -118,6 +140,8 @@ class GMOAdapter(ExchangeProtocol):
         body: dict[str, object] | None = None,
         auth: bool = False,
     ) -> dict | NormalizedError:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(private=auth)
         query = urlencode(params or {})
         path_with_query = f"{path}?{query}" if query else path
         url = f"{self.api_base_url}{path_with_query}"
@@ -138,6 +162,15 @@ class GMOAdapter(ExchangeProtocol):
                 )
             headers.update(auth_headers)
 
+        if self.connection_pool is not None:
+            return self._request_json_pooled(
+                self.connection_pool,
+                method=method,
+                url=url,
+                headers=headers,
+                data=body_text.encode("utf-8") if body is not None else None,
+            )
+
         request = Request(
             url=url,
             headers=headers,
@@ -152,6 +185,34 @@ class GMOAdapter(ExchangeProtocol):
         except (URLError, TimeoutError) as exc:
             return self.normalize_error(source_code="NETWORK_TIMEOUT", message=str(exc))
 
+    def rate_limit_wait_ms(self, *, private: bool) -> float:
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.would_wait_ms(private=private)
+
+    def _request_json_pooled(
+        self,
+        pool: HttpConnectionPool,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: bytes | None,
+    ) -> dict | NormalizedError:
+        try:
+            response = pool.request(
+                method,
+                url,
+                body=data,
+                headers=headers,
+                timeout=self.timeout_seconds,
+            )
+        except (OSError, HTTPException) as exc:
+            return self.normalize_error(source_code="NETWORK_TIMEOUT", message=str(exc))
+        if response.status >= 400:
+            return self._normalize_http_error(response.status, response.error_message())
+        return json.loads(response.body.decode("utf-8"))
+
     def _request_json_private_with_retry(
         self,
         *,
@@ -191,13 +252,91 @@ class GMOAdapter(ExchangeProtocol):
     def _to_datetime(self, value: object) -> datetime | None:
         if isinstance(value, datetime):
             return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return datetime.fromtimestamp(float(value) / 1000.0, tz=UTC)
         if isinstance(value, str):
+            if value.isdigit():
+                return datetime.fromtimestamp(int(value) / 1000.0, tz=UTC)
             try:
                 return datetime.fromisoformat(value)
             except ValueError:
                 return None
         return None
 
+    def _as_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+    def _kline_date_keys(
+        self, interval: str, start: datetime, end: datetime
+    ) -> list[str]:
+        first = self._as_utc(start) + _GMO_KLINE_DATE_OFFSET
+        last = max(self._as_utc(end) + _GMO_KLINE_DATE_OFFSET, first)
+        if interval in _GMO_YEARLY_KLINE_INTERVALS:
+            return [f"{year:04d}" for year in range(first.year, last.year + 1)]
+
+        keys: list[str] = []
+        day = first.date()
+        while day <= last.date():
+            keys.append(day.strftime("%Y%m%d"))
+            day += timedelta(days=1)
+        return keys
+
+    def kline_partitions(
+        self,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        interval = GMO_KLINE_INTERVALS.get(timeframe, timeframe)
+        partitions: list[tuple[datetime, datetime]] = []
+        cursor = self._as_utc(start)
+        final = self._as_utc(end)
+        while cursor <= final:
+            local = cursor + _GMO_KLINE_DATE_OFFSET
+            if interval in _GMO_YEARLY_KLINE_INTERVALS:
+                boundary_local = datetime(local.year + 1, 1, 1, tzinfo=UTC)
+            else:
+                boundary_local = datetime(
+                    local.year, local.month, local.day, tzinfo=UTC
+                ) + timedelta(days=1)
+            boundary = boundary_local - _GMO_KLINE_DATE_OFFSET
+            partitions.append(
+                (cursor, min(boundary - timedelta(milliseconds=1), final))
+            )
+            cursor = boundary
+        return partitions
+
+    def _parse_kline_row(self, row: object) -> NormalizedKline | None:
+        if not isinstance(row, dict):
+            return None
+        timestamp = self._to_datetime(
+            row.get("timestamp") or row.get("openTime") or row.get("time")
+        )
+        open_price = self._to_float(row.get("open"))
+        high_price = self._to_float(row.get("high"))
+        low_price = self._to_float(row.get("low"))
+        close_price = self._to_float(row.get("close"))
+        volume = self._to_float(row.get("volume"))
+        if (
+            timestamp is None
+            or open_price is None
+            or high_price is None
+            or low_price is None
+            or close_price is None
+            or volume is None
+        ):
+            return None
+        return NormalizedKline(
+            timestamp=timestamp,
+            open=open_price,
+            high=high_price,
+            low=low_price,
+            close=close_price,
+            volume=volume,
+        )
+
     def _iter_with_reconnect(
         self,
         *,
@@ -537,58 +676,45 @@ class GMOAdapter(ExchangeProtocol):
         limit: int,
     ) -> ErrorAwareList[NormalizedKline]:
         if self.use_http:
-            payload = self._request_json(
-                method="GET",
-                path="/public/v1/klines",
-                params={
-                    "symbol": symbol,
-                    "interval": timeframe,
-                    "limit": str(limit),
-                },
-            )
-            if isinstance(payload, NormalizedError):
-                return ErrorAwareList(error=self._failure_info_from_error(payload))
-
-            klines_raw = payload.get("data", [])
-            if not isinstance(klines_raw, list):
-                return ErrorAwareList(
-                    error=ReadFailureInfo(
-                        category="validation",
-                        retryable=False,
-                        source_code="INVALID_RESPONSE",
-                        message="klines_data_is_not_list",
-                    )
-                )
-
+            interval = GMO_KLINE_INTERVALS.get(timeframe, timeframe)
             normalized: list[NormalizedKline] = []
-            for row in klines_raw:
-                timestamp = self._to_datetime(
-                    row.get("timestamp") or row.get("openTime") or row.get("time")
+            for date_key in self._kline_date_keys(interval, start, end):
+                payload = self._request_json(
+                    method="GET",
+                    path="/public/v1/klines",
+                    params={
+                        "symbol": symbol,
+                        "interval": interval,
+                        "date": date_key,
+                        "limit": str(limit),
+                    },
                 )
-                open_price = self._to_float(row.get("open"))
-                high_price = self._to_float(row.get("high"))
-                low_price = self._to_float(row.get("low"))
-                close_price = self._to_float(row.get("close"))
-                volume = self._to_float(row.get("volume"))
-                if (
-                    timestamp is None
-                    or open_price is None
-                    or high_price is None
-                    or low_price is None
-                    or close_price is None
-                    or volume is None
-                ):
-                    continue
-                normalized.append(
-                    NormalizedKline(
-                        timestamp=timestamp,
-                        open=open_price,
-                        high=high_price,
-                        low=low_price,
-                        close=close_price,
-                        volume=volume,
+                if isinstance(payload, NormalizedError):
+                    return ErrorAwareList(error=self._failure_info_from_error(payload))
+
+                klines_raw = payload.get("data", [])
+                if not isinstance(klines_raw, list):
+                    return ErrorAwareList(
+                        error=ReadFailureInfo(
+                            category="validation",
+                            retryable=False,
+                            source_code="INVALID_RESPONSE",
+                            message="klines_data_is_not_list",
+                        )
                     )
-                )
+
+                for row in klines_raw:
+                    kline = self._parse_kline_row(row)
+                    if kline is None:
+                        continue
+                    if kline.timestamp.tzinfo is not None:
+                        kline_time = self._as_utc(kline.timestamp)
+                        if not (self._as_utc(start) <= kline_time <= self._as_utc(end)):
+                            continue
+                    normalized.append(kline)
+
+            if limit > 0:
+                normalized = normalized[-limit:]
             return ErrorAwareList(normalized)
         return ErrorAwareList()
 
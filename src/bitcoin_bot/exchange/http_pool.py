@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import select
+import ssl
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPSConnection,
+    RemoteDisconnected,
+)
+from time import monotonic
+from typing import Self
+from urllib.parse import urlsplit
+
+HostKey = tuple[str, str, int]
+ConnectionFactory = Callable[[str, str, int, float], HTTPConnection]
+_STALE_CONNECTION_ERRORS = (
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    RemoteDisconnected,
+)
+_RETRY_AFTER_SEND_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    status: int
+    reason: str
+    body: bytes
+
+    def error_message(self) -> str:
+        return f"HTTP Error {self.status}: {self.reason}"
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    connection: HTTPConnection
+    idle_since: float
+    reused: bool = False
+
+
+@dataclass(slots=True)
+class HttpPoolStats:
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+    reconnects: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "reconnects": self.reconnects,
+        }
+
+
+def _default_connection_factory(
+    scheme: str, host: str, port: int, timeout: float
+) -> HTTPConnection:
+    if scheme == "https":
+        return HTTPSConnection(
+            host, port, timeout=timeout, context=ssl.create_default_context()
+        )
+    return HTTPConnection(host, port, timeout=timeout)
+
+
+def _is_dropped(connection: HTTPConnection) -> bool:
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0.0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class HttpConnectionPool:
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float = 5.0,
+        max_idle_per_host: int = 4,
+        max_idle_seconds: float = 30.0,
+        connection_factory: ConnectionFactory | None = None,
+    ) -> None:
+        if max_idle_per_host < 1:
+            raise ValueError(
+                f"Invalid http pool max_idle_per_host: {max_idle_per_host}"
+            )
+        self.timeout_seconds = timeout_seconds
+        self.max_idle_per_host = max_idle_per_host
+        self.max_idle_seconds = max_idle_seconds
+        self.stats = HttpPoolStats()
+        self._factory = connection_factory or _default_connection_factory
+        self._idle: dict[HostKey, list[_PooledConnection]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._idle.values())
+
+    def close(self) -> None:
+        with self._lock:
+            pooled = [item for items in self._idle.values() for item in items]
+            self._idle.clear()
+        for item in pooled:
+            item.connection.close()
+
+    def _acquire(self, key: HostKey, timeout: float) -> _PooledConnection:
+        now = monotonic()
+        while True:
+            with self._lock:
+                items = self._idle.get(key)
+                pooled = items.pop() if items else None
+            if pooled is None:
+                break
+            if now - pooled.idle_since > self.max_idle_seconds or _is_dropped(
+                pooled.connection
+            ):
+                pooled.connection.close()
+                with self._lock:
+                    self.stats.discarded += 1
+                continue
+            pooled.connection.timeout = timeout
+            if pooled.connection.sock is not None:
+                pooled.connection.sock.settimeout(timeout)
+            pooled.reused = True
+            with self._lock:
+                self.stats.reused += 1
+            return pooled
+
+        scheme, host, port = key
+        connection = self._factory(scheme, host, port, timeout)
+        with self._lock:
+            self.stats.created += 1
+        return _PooledConnection(connection=connection, idle_since=now)
+
+    def _release(self, key: HostKey, pooled: _PooledConnection) -> None:
+        pooled.idle_since = monotonic()
+        with self._lock:
+            items = self._idle.setdefault(key, [])
+            if len(items) < self.max_idle_per_host:
+                items.append(pooled)
+                return
+        pooled.connection.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported http pool url: {url}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request_headers = {"Connection": "keep-alive", **(headers or {})}
+        wait = self.timeout_seconds if timeout is None else timeout
+
+        for attempt in range(2):
+            pooled = self._acquire(key, wait)
+            connection = pooled.connection
+            sent = False
+            try:
+                connection.request(method, target, body=body, headers=request_headers)
+                sent = True
+                response = connection.getresponse()
+                payload = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                retry = pooled.reused and attempt == 0
+                if not retry or (sent and method not in _RETRY_AFTER_SEND_METHODS):
+                    raise
+                with self._lock:
+                    self.stats.reconnects += 1
+                continue
+            except (OSError, HTTPException):
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, pooled)
+            return HttpResponse(
+                status=response.status, reason=response.reason, body=payload
+            )
+        raise ConnectionError("http_pool_reconnect_failed")
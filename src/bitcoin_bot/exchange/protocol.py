@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     Any,
+    AsyncIterator,
     Generic,
     Iterable,
     Iterator,
@@ -183,3 +184,48 @@ class ExchangeProtocol(Protocol):
     def stream_account_events(
         self,
     ) -> Iterator[NormalizedAccountEvent | NormalizedError]: ...
+
+
+@runtime_checkable
+class AsyncExchangeProtocol(Protocol):
+    def normalize_error(
+        self,
+        *,
+        source_code: str | None,
+        message: str,
+    ) -> NormalizedError: ...
+
+    async def fetch_klines(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        limit: int,
+    ) -> ErrorAwareList[NormalizedKline]: ...
+
+    async def fetch_ticker(self, symbol: str) -> NormalizedTicker | NormalizedError: ...
+
+    async def fetch_balances(
+        self, account_type: str
+    ) -> list[NormalizedBalance] | NormalizedError: ...
+
+    async def fetch_positions(
+        self, symbol: str
+    ) -> ErrorAwareList[NormalizedPosition]: ...
+
+    async def place_order(
+        self, order_request: NormalizedOrder
+    ) -> NormalizedOrderState: ...
+
+    async def cancel_order(self, order_id: str) -> NormalizedOrderState: ...
+
+    async def fetch_order(self, order_id: str) -> NormalizedOrderState: ...
+
+    def stream_order_events(
+        self,
+    ) -> AsyncIterator[NormalizedOrderEvent | NormalizedError]: ...
+
+    def stream_account_events(
+        self,
+    ) -> AsyncIterator[NormalizedAccountEvent | NormalizedError]: ...
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from time import monotonic, sleep
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    rate_per_second: float
+    capacity: float
+    clock: Callable[[], float] = monotonic
+    sleeper: Callable[[float], None] = sleep
+    tokens: float = field(init=False)
+    updated_at: float = field(init=False)
+    _lock: threading.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate_per_second <= 0.0:
+            raise ValueError(
+                f"Invalid token bucket rate_per_second: {self.rate_per_second}"
+            )
+        if self.capacity < 1.0:
+            raise ValueError(f"Invalid token bucket capacity: {self.capacity}")
+        self.tokens = float(self.capacity)
+        self.updated_at = self.clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        elapsed = max(now - self.updated_at, 0.0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_second)
+        self.updated_at = now
+
+    def would_wait_ms(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill()
+            deficit = tokens - self.tokens
+        return max(deficit, 0.0) / self.rate_per_second * 1000.0
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                return False
+            self.tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            wait_seconds = max(-self.tokens, 0.0) / self.rate_per_second
+        if wait_seconds > 0.0:
+            self.sleeper(wait_seconds)
+        return wait_seconds
+
+
+@dataclass(slots=True)
+class GMORateLimiter:
+    public: TokenBucket
+    private: TokenBucket
+
+    @classmethod
+    def from_rates(
+        cls,
+        *,
+        public_per_second: float,
+        private_per_second: float,
+        burst: float,
+    ) -> GMORateLimiter:
+        return cls(
+            public=TokenBucket(rate_per_second=public_per_second, capacity=burst),
+            private=TokenBucket(rate_per_second=private_per_second, capacity=burst),
+        )
+
+    def bucket(self, *, private: bool) -> TokenBucket:
+        return self.private if private else self.public
+
+    def would_wait_ms(self, *, private: bool) -> float:
+        return self.bucket(private=private).would_wait_ms()
+
+    def acquire(self, *, private: bool) -> float:
+        return self.bucket(private=private).acquire()
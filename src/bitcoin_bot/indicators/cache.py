@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from secrets import token_hex
+
+import numpy as np
+import pandas as pd
+
+INDICATOR_CACHE_FORMAT_VERSION = 1
+DEFAULT_INDICATOR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_INDICATOR_CACHE_MAX_DISK_BYTES = 1024 * 1024 * 1024
+_CONTENT_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def ohlcv_content_hash(frame: pd.DataFrame) -> str:
+    digest = hashlib.sha256()
+    digest.update(str(len(frame)).encode("utf-8"))
+    if isinstance(frame.index, pd.DatetimeIndex):
+        digest.update(frame.index.as_unit("ns").asi8.tobytes())
+    for column in _CONTENT_COLUMNS:
+        if column not in frame.columns:
+            continue
+        digest.update(column.encode("utf-8"))
+        values = frame[column].to_numpy(dtype=np.float64)
+        digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+
+def indicator_cache_key(
+    content_hash: str,
+    name: str,
+    window: int | tuple[int, ...],
+    feature_flags: Mapping[str, bool] | None = None,
+) -> str:
+    key_payload = {
+        "version": INDICATOR_CACHE_FORMAT_VERSION,
+        "content": content_hash,
+        "name": name,
+        "window": list(window) if isinstance(window, tuple) else window,
+        "feature_flags": dict(sorted(dict(feature_flags or {}).items())),
+    }
+    key_text = json.dumps(key_payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(key_text.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class IndicatorCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    disk_writes: int = 0
+
+    def merge(self, other: IndicatorCacheStats) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+        self.disk_hits += other.disk_hits
+        self.disk_writes += other.disk_writes
+
+    def to_dict(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_hits": self.disk_hits,
+            "disk_writes": self.disk_writes,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+class IndicatorCache:
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_INDICATOR_CACHE_MAX_BYTES,
+        cache_dir: str | Path | None = None,
+        max_disk_bytes: int = DEFAULT_INDICATOR_CACHE_MAX_DISK_BYTES,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"Invalid indicator cache max_bytes: {max_bytes}")
+        if max_disk_bytes < 0:
+            raise ValueError(
+                f"Invalid indicator cache max_disk_bytes: {max_disk_bytes}"
+            )
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._disk_bytes: int | None = None
+        self.disk_dir = None if cache_dir is None else Path(cache_dir) / "indicators"
+        self.stats = IndicatorCacheStats()
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / f"{key}.npy"
+
+    def _remember(self, key: str, values: np.ndarray) -> None:
+        if values.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = values
+        self._bytes += values.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.stats.evictions += 1
+
+    def _read_disk(self, key: str) -> np.ndarray | None:
+        disk_path = self._disk_path(key)
+        if disk_path is None or not disk_path.exists():
+            return None
+        try:
+            values = np.load(disk_path, allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(disk_path)
+        values.flags.writeable = False
+        return values
+
+    def _prune_disk(self) -> None:
+        if self.disk_dir is None:
+            return
+        entries: list[tuple[int, int, Path]] = []
+        for path in self.disk_dir.glob("*.npy"):
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                total -= size
+        self._disk_bytes = total
+
+    def _write_disk(self, key: str, values: np.ndarray) -> None:
+        disk_path = self._disk_path(key)
+        if disk_path is None:
+            return
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = disk_path.with_name(f"{disk_path.stem}.{token_hex(4)}.tmp")
+            with temp.open("wb") as handle:
+                np.save(handle, values, allow_pickle=False)
+            temp.replace(disk_path)
+        except OSError:
+            return
+        self.stats.disk_writes += 1
+        if self._disk_bytes is None:
+            self._prune_disk()
+            return
+        self._disk_bytes += values.nbytes
+        if self._disk_bytes > self.max_disk_bytes:
+            self._prune_disk()
+
+    def get(
+        self,
+        content_hash: str,
+        name: str,
+        window: int | tuple[int, ...],
+        feature_flags: Mapping[str, bool] | None = None,
+    ) -> np.ndarray | None:
+        key = indicator_cache_key(content_hash, name, window, feature_flags)
+        values = self._entries.get(key)
+        if values is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return values
+        values = self._read_disk(key)
+        if values is not None:
+            self._remember(key, values)
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            return values
+        self.stats.misses += 1
+        return None
+
+    def put(
+        self,
+        content_hash: str,
+        name: str,
+        window: int | tuple[int, ...],
+        values: np.ndarray,
+        feature_flags: Mapping[str, bool] | None = None,
+    ) -> np.ndarray:
+        key = indicator_cache_key(content_hash, name, window, feature_flags)
+        stored = np.array(values, dtype=np.float64, copy=True)
+        stored.flags.writeable = False
+        self._remember(key, stored)
+        self._write_disk(key, stored)
+        return stored
+
+    def get_or_compute(
+        self,
+        content_hash: str,
+        name: str,
+        window: int | tuple[int, ...],
+        compute: Callable[[], np.ndarray],
+        feature_flags: Mapping[str, bool] | None = None,
+    ) -> np.ndarray:
+        values = self.get(content_hash, name, window, feature_flags)
+        if values is not None:
+            return values
+        return self.put(content_hash, name, window, compute(), feature_flags)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
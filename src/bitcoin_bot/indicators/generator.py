@@ -1,9 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import partial
+from typing import Literal
 
+import numpy as np
 import pandas as pd
 
+from bitcoin_bot.indicators.cache import IndicatorCache, ohlcv_content_hash
+
+VOLUME_MA_WINDOW = 20
+IndicatorBackend = Literal["pandas", "numpy"]
+INDICATOR_BACKENDS = ("pandas", "numpy")
+
 
 def _rsi(series: pd.Series, period: int) -> pd.Series:
     delta = series.diff()
@@ -23,6 +33,171 @@ def _atr(frame: pd.DataFrame, period: int) -> pd.Series:
     return true_range.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
 
 
+def _ewm_mean_array(values: np.ndarray, *, min_periods: int, **window) -> np.ndarray:
+    series = pd.Series(values, copy=False)
+    return series.ewm(adjust=False, min_periods=min_periods, **window).mean().to_numpy()
+
+
+def _safe_divide(
+    numerator: np.ndarray, denominator: np.ndarray, fill: float
+) -> np.ndarray:
+    out = np.full(numerator.shape, fill, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0.0)
+    return out
+
+
+def _gain_loss_arrays(close: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    delta = np.empty_like(close)
+    delta[:1] = np.nan
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    gain = np.where(delta < 0.0, 0.0, delta)
+    loss = -np.where(delta > 0.0, 0.0, delta)
+    return gain, loss
+
+
+def _rsi_from_gain_loss(gain: np.ndarray, loss: np.ndarray, period: int) -> np.ndarray:
+    avg_gain = _ewm_mean_array(gain, alpha=1 / period, min_periods=period)
+    avg_loss = _ewm_mean_array(loss, alpha=1 / period, min_periods=period)
+    rs = _safe_divide(avg_gain, avg_loss, np.nan)
+    rsi = np.empty_like(rs)
+    np.add(rs, 1.0, out=rsi)
+    np.divide(100.0, rsi, out=rsi)
+    np.subtract(100.0, rsi, out=rsi)
+    return rsi
+
+
+def _true_range_array(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray
+) -> np.ndarray:
+    true_range = high - low
+    previous_close = close[:-1]
+    np.fmax(true_range[1:], np.abs(high[1:] - previous_close), out=true_range[1:])
+    np.fmax(true_range[1:], np.abs(low[1:] - previous_close), out=true_range[1:])
+    return true_range
+
+
+def _cached_array(
+    cache: IndicatorCache | None,
+    content_hash: str,
+    name: str,
+    window: int | tuple[int, ...],
+    compute: Callable[[], np.ndarray],
+    feature_flags: Mapping[str, bool] | None = None,
+) -> np.ndarray:
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(content_hash, name, window, compute, feature_flags)
+
+
+def _resolve_content_hash(
+    frame: pd.DataFrame, cache: IndicatorCache | None, content_hash: str | None
+) -> str:
+    if cache is None:
+        return ""
+    return ohlcv_content_hash(frame) if content_hash is None else content_hash
+
+
+def _slope_norm_array(ema_fast: np.ndarray, atr: np.ndarray) -> np.ndarray:
+    slope = np.empty_like(ema_fast)
+    slope[:1] = np.nan
+    np.subtract(ema_fast[1:], ema_fast[:-1], out=slope[1:])
+    slope_norm = _safe_divide(slope, atr, 0.0)
+    slope_norm[np.isnan(slope_norm)] = 0.0
+    return slope_norm
+
+
+def _gap_norm_array(
+    ema_fast: np.ndarray, ema_slow: np.ndarray, close: np.ndarray
+) -> np.ndarray:
+    gap_norm = _safe_divide(ema_fast - ema_slow, close, 0.0)
+    gap_norm[np.isnan(gap_norm)] = 0.0
+    return gap_norm
+
+
+def _generate_indicator_arrays(
+    frame: pd.DataFrame,
+    *,
+    ema_fast_window: int,
+    ema_slow_window: int,
+    rsi_window: int,
+    atr_window: int,
+    slope_enabled: bool,
+    gap_enabled: bool,
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
+) -> dict[str, np.ndarray]:
+    close = frame["close"].to_numpy(dtype=np.float64)
+    high = frame["high"].to_numpy(dtype=np.float64)
+    low = frame["low"].to_numpy(dtype=np.float64)
+    content_hash = _resolve_content_hash(frame, cache, content_hash)
+    flags = {"slope_norm": slope_enabled, "gap_norm": gap_enabled}
+
+    ema_fast = _cached_array(
+        cache,
+        content_hash,
+        "ema",
+        ema_fast_window,
+        lambda: _ewm_mean_array(
+            close, span=ema_fast_window, min_periods=ema_fast_window
+        ),
+    )
+    ema_slow = _cached_array(
+        cache,
+        content_hash,
+        "ema",
+        ema_slow_window,
+        lambda: _ewm_mean_array(
+            close, span=ema_slow_window, min_periods=ema_slow_window
+        ),
+    )
+    atr = _cached_array(
+        cache,
+        content_hash,
+        "atr",
+        atr_window,
+        lambda: _ewm_mean_array(
+            _true_range_array(high, low, close),
+            alpha=1 / atr_window,
+            min_periods=atr_window,
+        ),
+    )
+    rsi = _cached_array(
+        cache,
+        content_hash,
+        "rsi",
+        rsi_window,
+        lambda: _rsi_from_gain_loss(*_gain_loss_arrays(close), rsi_window),
+    )
+    arrays = {
+        f"ema_{ema_fast_window}": ema_fast,
+        f"ema_{ema_slow_window}": ema_slow,
+        f"rsi_{rsi_window}": rsi,
+        f"atr_{atr_window}": atr,
+    }
+
+    if slope_enabled:
+        arrays["slope_norm"] = _cached_array(
+            cache,
+            content_hash,
+            "slope_norm",
+            (ema_fast_window, atr_window),
+            lambda: _slope_norm_array(ema_fast, atr),
+            flags,
+        )
+
+    if gap_enabled:
+        arrays["gap_norm"] = _cached_array(
+            cache,
+            content_hash,
+            "gap_norm",
+            (ema_fast_window, ema_slow_window),
+            lambda: _gap_norm_array(ema_fast, ema_slow, close),
+            flags,
+        )
+
+    return arrays
+
+
 def generate_indicators(
     frame: pd.DataFrame,
     *,
@@ -31,7 +206,14 @@ def generate_indicators(
     rsi_window: int = 14,
     atr_window: int = 14,
     feature_flags: Mapping[str, bool] | None = None,
+    backend: IndicatorBackend = "pandas",
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
 ) -> pd.DataFrame:
+    if backend not in INDICATOR_BACKENDS:
+        raise ValueError(f"Unsupported indicator backend: {backend}")
+    if cache is not None and backend != "numpy":
+        raise ValueError("Indicator cache requires the numpy backend")
     flags = dict(feature_flags or {})
     slope_enabled = bool(flags.get("slope_norm", True))
     gap_enabled = bool(flags.get("gap_norm", True))
@@ -52,6 +234,22 @@ def generate_indicators(
     if conflicts:
         raise ValueError(f"Indicator columns already exist: {conflicts}")
 
+    if backend == "numpy":
+        arrays = _generate_indicator_arrays(
+            result,
+            ema_fast_window=ema_fast_window,
+            ema_slow_window=ema_slow_window,
+            rsi_window=rsi_window,
+            atr_window=atr_window,
+            slope_enabled=slope_enabled,
+            gap_enabled=gap_enabled,
+            cache=cache,
+            content_hash=content_hash,
+        )
+        for column, values in arrays.items():
+            result[column] = values if values.flags.writeable else values.copy()
+        return result
+
     result[ema_fast_column] = (
         result["close"]
         .ewm(
@@ -86,5 +284,110 @@ def generate_indicators(
     return result
 
 
+@dataclass(slots=True)
+class IndicatorGrid:
+    ema_windows: tuple[int, ...]
+    rsi_windows: tuple[int, ...]
+    atr_windows: tuple[int, ...]
+    ema: np.ndarray
+    rsi: np.ndarray
+    atr: np.ndarray
+
+    def select(
+        self,
+        *,
+        ema_fast_window: int,
+        ema_slow_window: int,
+        rsi_window: int,
+        atr_window: int,
+    ) -> dict[str, np.ndarray]:
+        return {
+            "ema_fast": self.ema[:, self.ema_windows.index(ema_fast_window)],
+            "ema_slow": self.ema[:, self.ema_windows.index(ema_slow_window)],
+            "rsi": self.rsi[:, self.rsi_windows.index(rsi_window)],
+            "atr": self.atr[:, self.atr_windows.index(atr_window)],
+        }
+
+
+def _grid_windows(windows: Iterable[int], name: str) -> tuple[int, ...]:
+    resolved = tuple(sorted({int(window) for window in windows}))
+    if not resolved or resolved[0] < 1:
+        raise ValueError(f"Invalid {name}: {resolved}")
+    return resolved
+
+
+def generate_indicator_grid(
+    frame: pd.DataFrame,
+    *,
+    ema_windows: Iterable[int],
+    rsi_windows: Iterable[int],
+    atr_windows: Iterable[int],
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
+) -> IndicatorGrid:
+    ema_grid_windows = _grid_windows(ema_windows, "ema_windows")
+    rsi_grid_windows = _grid_windows(rsi_windows, "rsi_windows")
+    atr_grid_windows = _grid_windows(atr_windows, "atr_windows")
+
+    close = frame["close"].to_numpy(dtype=np.float64)
+    high = frame["high"].to_numpy(dtype=np.float64)
+    low = frame["low"].to_numpy(dtype=np.float64)
+    gain, loss = _gain_loss_arrays(close)
+    true_range = _true_range_array(high, low, close)
+    content_hash = _resolve_content_hash(frame, cache, content_hash)
+
+    bars = len(close)
+    ema = np.empty((bars, len(ema_grid_windows)), dtype=np.float64, order="F")
+    rsi = np.empty((bars, len(rsi_grid_windows)), dtype=np.float64, order="F")
+    atr = np.empty((bars, len(atr_grid_windows)), dtype=np.float64, order="F")
+    for position, window in enumerate(ema_grid_windows):
+        ema[:, position] = _cached_array(
+            cache,
+            content_hash,
+            "ema",
+            window,
+            partial(_ewm_mean_array, close, span=window, min_periods=window),
+        )
+    for position, window in enumerate(rsi_grid_windows):
+        rsi[:, position] = _cached_array(
+            cache,
+            content_hash,
+            "rsi",
+            window,
+            partial(_rsi_from_gain_loss, gain, loss, window),
+        )
+    for position, window in enumerate(atr_grid_windows):
+        atr[:, position] = _cached_array(
+            cache,
+            content_hash,
+            "atr",
+            window,
+            partial(_ewm_mean_array, true_range, alpha=1 / window, min_periods=window),
+        )
+
+    return IndicatorGrid(
+        ema_windows=ema_grid_windows,
+        rsi_windows=rsi_grid_windows,
+        atr_windows=atr_grid_windows,
+        ema=ema,
+        rsi=rsi,
+        atr=atr,
+    )
+
+
+def volume_moving_average(
+    volume: pd.Series, window: int = VOLUME_MA_WINDOW
+) -> pd.Series:
+    values = volume.to_numpy(dtype=np.float64)
+    averages = np.full(values.shape[0], np.nan)
+    count = values.shape[0] - window + 1
+    if count > 0:
+        total = values[:count].copy()
+        for offset in range(1, window):
+            total += values[offset : offset + count]
+        averages[window - 1 :] = total / window
+    return pd.Series(averages, index=volume.index, name=volume.name)
+
+
 def indicator_columns() -> list[str]:
     return ["ema_12", "ema_26", "rsi_14", "atr_14", "slope_norm", "gap_norm"]
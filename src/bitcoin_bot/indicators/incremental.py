@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.utils.io import atomic_dump_json
+
+INDICATOR_STATE_VERSION = 1
+_EWM_STATE_KEYS = ("ema_fast", "ema_slow", "avg_gain", "avg_loss", "atr")
+
+
+def _ewm_com(*, span: int | None = None, alpha: float | None = None) -> float:
+    if span is not None:
+        return (span - 1) / 2.0
+    if alpha is not None:
+        return (1.0 - alpha) / alpha
+    raise ValueError("span or alpha is required")
+
+
+def _ewm_alpha(*, span: int | None = None, alpha: float | None = None) -> float:
+    return 1.0 / (1.0 + _ewm_com(span=span, alpha=alpha))
+
+
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    if math.isnan(avg_gain) or math.isnan(avg_loss) or avg_loss == 0:
+        return math.nan
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+@dataclass(slots=True)
+class EwmState:
+    alpha: float
+    min_periods: int
+    weighted: float = math.nan
+    old_wt: float = 1.0
+    nobs: int = 0
+
+    def update(self, value: float) -> float:
+        is_observation = not math.isnan(value)
+        self.nobs += int(is_observation)
+        if not math.isnan(self.weighted):
+            self.old_wt *= 1.0 - self.alpha
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = (
+                        self.old_wt * self.weighted + self.alpha * value
+                    ) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif is_observation:
+            self.weighted = value
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.nobs >= max(self.min_periods, 1):
+            return self.weighted
+        return math.nan
+
+    def to_state(self) -> dict[str, float | int]:
+        return {"weighted": self.weighted, "old_wt": self.old_wt, "nobs": self.nobs}
+
+    def restore(self, state: dict) -> None:
+        self.weighted = float(state["weighted"])
+        self.old_wt = float(state["old_wt"])
+        self.nobs = int(state["nobs"])
+
+
+@dataclass(slots=True)
+class IncrementalIndicatorEngine:
+    ema_fast_window: int = 12
+    ema_slow_window: int = 26
+    rsi_window: int = 14
+    atr_window: int = 14
+    prev_close: float = math.nan
+    prev_ema_fast: float = math.nan
+    last_timestamp: pd.Timestamp | None = None
+    bars: int = 0
+    ema_fast: EwmState = field(init=False)
+    ema_slow: EwmState = field(init=False)
+    avg_gain: EwmState = field(init=False)
+    avg_loss: EwmState = field(init=False)
+    atr: EwmState = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.ema_fast = EwmState(
+            alpha=_ewm_alpha(span=self.ema_fast_window),
+            min_periods=self.ema_fast_window,
+        )
+        self.ema_slow = EwmState(
+            alpha=_ewm_alpha(span=self.ema_slow_window),
+            min_periods=self.ema_slow_window,
+        )
+        rsi_alpha = _ewm_alpha(alpha=1 / self.rsi_window)
+        self.avg_gain = EwmState(alpha=rsi_alpha, min_periods=self.rsi_window)
+        self.avg_loss = EwmState(alpha=rsi_alpha, min_periods=self.rsi_window)
+        self.atr = EwmState(
+            alpha=_ewm_alpha(alpha=1 / self.atr_window),
+            min_periods=self.atr_window,
+        )
+
+    @property
+    def windows(self) -> dict[str, int]:
+        return {
+            "ema_fast_window": self.ema_fast_window,
+            "ema_slow_window": self.ema_slow_window,
+            "rsi_window": self.rsi_window,
+            "atr_window": self.atr_window,
+        }
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "ema_fast": self.ema_fast.value,
+            "ema_slow": self.ema_slow.value,
+            "rsi": _rsi_value(self.avg_gain.value, self.avg_loss.value),
+            "atr": self.atr.value,
+        }
+
+    def update(
+        self,
+        *,
+        high: float,
+        low: float,
+        close: float,
+        timestamp: pd.Timestamp | None = None,
+    ) -> dict[str, float]:
+        delta = close - self.prev_close
+        gain = 0.0 if delta < 0.0 else delta
+        loss = -(0.0 if delta > 0.0 else delta)
+        true_range = high - low
+        if not math.isnan(self.prev_close):
+            true_range = max(
+                true_range, abs(high - self.prev_close), abs(low - self.prev_close)
+            )
+
+        ema_fast = self.ema_fast.update(close)
+        ema_slow = self.ema_slow.update(close)
+        avg_gain = self.avg_gain.update(gain)
+        avg_loss = self.avg_loss.update(loss)
+        atr = self.atr.update(true_range)
+        rsi = _rsi_value(avg_gain, avg_loss)
+
+        slope_norm = 0.0
+        if not math.isnan(atr) and atr != 0:
+            slope = ema_fast - self.prev_ema_fast
+            if not math.isnan(slope):
+                slope_norm = slope / atr
+        gap_norm = 0.0
+        if close != 0:
+            gap = ema_fast - ema_slow
+            if not math.isnan(gap):
+                gap_norm = gap / close
+
+        self.prev_close = close
+        self.prev_ema_fast = ema_fast
+        self.bars += 1
+        if timestamp is not None:
+            self.last_timestamp = pd.Timestamp(timestamp)
+        return {
+            "ema_fast": ema_fast,
+            "ema_slow": ema_slow,
+            "rsi": rsi,
+            "atr": atr,
+            "slope_norm": slope_norm,
+            "gap_norm": gap_norm,
+        }
+
+    def update_frame(self, frame: pd.DataFrame) -> dict[str, float] | None:
+        latest: dict[str, float] | None = None
+        highs = frame["high"].to_numpy(dtype=float)
+        lows = frame["low"].to_numpy(dtype=float)
+        closes = frame["close"].to_numpy(dtype=float)
+        for position, timestamp in enumerate(frame.index):
+            latest = self.update(
+                high=float(highs[position]),
+                low=float(lows[position]),
+                close=float(closes[position]),
+                timestamp=timestamp,
+            )
+        return latest
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        *,
+        ema_fast_window: int = 12,
+        ema_slow_window: int = 26,
+        rsi_window: int = 14,
+        atr_window: int = 14,
+    ) -> IncrementalIndicatorEngine:
+        engine = cls(
+            ema_fast_window=ema_fast_window,
+            ema_slow_window=ema_slow_window,
+            rsi_window=rsi_window,
+            atr_window=atr_window,
+        )
+        engine.update_frame(frame)
+        return engine
+
+    @classmethod
+    def from_history(
+        cls,
+        frame: pd.DataFrame,
+        *,
+        ema_fast_window: int = 12,
+        ema_slow_window: int = 26,
+        rsi_window: int = 14,
+        atr_window: int = 14,
+    ) -> IncrementalIndicatorEngine:
+        engine = cls(
+            ema_fast_window=ema_fast_window,
+            ema_slow_window=ema_slow_window,
+            rsi_window=rsi_window,
+            atr_window=atr_window,
+        )
+        high = frame["high"].to_numpy(dtype=np.float64)
+        low = frame["low"].to_numpy(dtype=np.float64)
+        close = frame["close"].to_numpy(dtype=np.float64)
+        if (
+            len(frame) < 2
+            or not (np.isfinite(high).all() and np.isfinite(low).all())
+            or not np.isfinite(close).all()
+        ):
+            engine.update_frame(frame)
+            return engine
+
+        delta = np.diff(close, prepend=np.nan)
+        true_range = high - low
+        np.fmax(true_range[1:], np.abs(high[1:] - close[:-1]), out=true_range[1:])
+        np.fmax(true_range[1:], np.abs(low[1:] - close[:-1]), out=true_range[1:])
+        rsi_com = _ewm_com(alpha=1 / rsi_window)
+        inputs = {
+            "ema_fast": (close, _ewm_com(span=ema_fast_window)),
+            "ema_slow": (close, _ewm_com(span=ema_slow_window)),
+            "avg_gain": (np.where(delta < 0.0, 0.0, delta), rsi_com),
+            "avg_loss": (-np.where(delta > 0.0, 0.0, delta), rsi_com),
+            "atr": (true_range, _ewm_com(alpha=1 / atr_window)),
+        }
+        for key, (values, com) in inputs.items():
+            weighted = (
+                pd.Series(values, copy=False)
+                .ewm(com=com, adjust=False, min_periods=1)
+                .mean()
+                .to_numpy()
+            )
+            getattr(engine, key).restore(
+                {
+                    "weighted": weighted[-1],
+                    "old_wt": 1.0,
+                    "nobs": int(np.isfinite(values).sum()),
+                }
+            )
+        engine.prev_close = float(close[-1])
+        engine.prev_ema_fast = engine.ema_fast.value
+        engine.last_timestamp = pd.Timestamp(frame.index[-1])
+        engine.bars = len(frame)
+        return engine
+
+    def to_state(self) -> dict:
+        return {
+            "version": INDICATOR_STATE_VERSION,
+            "windows": self.windows,
+            "prev_close": self.prev_close,
+            "prev_ema_fast": self.prev_ema_fast,
+            "last_timestamp": (
+                None if self.last_timestamp is None else self.last_timestamp.isoformat()
+            ),
+            "bars": self.bars,
+        } | {key: getattr(self, key).to_state() for key in _EWM_STATE_KEYS}
+
+    @classmethod
+    def from_state(cls, state: dict) -> IncrementalIndicatorEngine:
+        if state.get("version") != INDICATOR_STATE_VERSION:
+            raise ValueError(
+                f"Unsupported indicator state version: {state.get('version')}"
+            )
+        windows = state["windows"]
+        engine = cls(
+            ema_fast_window=int(windows["ema_fast_window"]),
+            ema_slow_window=int(windows["ema_slow_window"]),
+            rsi_window=int(windows["rsi_window"]),
+            atr_window=int(windows["atr_window"]),
+        )
+        engine.prev_close = float(state["prev_close"])
+        engine.prev_ema_fast = float(state["prev_ema_fast"])
+        last_timestamp = state.get("last_timestamp")
+        engine.last_timestamp = (
+            None if last_timestamp is None else pd.Timestamp(last_timestamp)
+        )
+        engine.bars = int(state["bars"])
+        for key in _EWM_STATE_KEYS:
+            getattr(engine, key).restore(state[key])
+        return engine
+
+
+def save_indicator_state(path: str | Path, engine: IncrementalIndicatorEngine) -> None:
+    atomic_dump_json(str(path), engine.to_state())
+
+
+def load_indicator_state(
+    path: str | Path,
+    *,
+    ema_fast_window: int,
+    ema_slow_window: int,
+    rsi_window: int,
+    atr_window: int,
+) -> IncrementalIndicatorEngine | None:
+    state_path = Path(path)
+    if not state_path.exists():
+        return None
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        engine = IncrementalIndicatorEngine.from_state(state)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    expected = {
+        "ema_fast_window": ema_fast_window,
+        "ema_slow_window": ema_slow_window,
+        "rsi_window": rsi_window,
+        "atr_window": atr_window,
+    }
+    if engine.windows != expected:
+        return None
+    return engine
@@ -10,6 +10,7 @@ from bitcoin_bot.config.validator import validate_config
 from bitcoin_bot.pipeline.backtest_runner import run_backtest
 from bitcoin_bot.pipeline.live_runner import run_live
 from bitcoin_bot.pipeline.paper_runner import run_paper
+from bitcoin_bot.pipeline.portfolio_runner import run_portfolio_backtest
 from bitcoin_bot.telemetry.reporters import emit_run_complete
 
 
@@ -19,7 +20,9 @@ def run(mode: Mode, config_path: str) -> dict:
     runtime_config.runtime.mode = mode
     validated = validate_config(runtime_config)
 
-    if validated.runtime.mode == "backtest":
+    if validated.runtime.mode == "backtest" and validated.backtest.runs:
+        pipeline = run_portfolio_backtest(validated)
+    elif validated.runtime.mode == "backtest":
         pipeline = run_backtest(validated)
     elif validated.runtime.mode == "paper":
         pipeline = run_paper(validated)
@@ -37,7 +40,7 @@ def run(mode: Mode, config_path: str) -> dict:
         artifacts_dir=validated.paths.artifacts_dir,
         discord_enabled=validated.notify.discord.enabled,
         optimizer_enabled=validated.optimizer.enabled,
-        opt_trials_executed=validated.optimizer.opt_trials,
+        opt_trials_executed=int(pipeline.get("opt_trials_executed", 0)),
     )
 
 
@@ -112,11 +112,22 @@ def default_gate_result() -> dict:
     return {"accept": None, "reasons": []}
 
 
-def evaluate_optimization_gates(score: float | None) -> dict:
+def evaluate_optimization_gates(
+    score: float | None,
+    *,
+    p95_drawdown: float | None = None,
+    max_p95_drawdown: float | None = None,
+) -> dict:
     if score is None:
         return {"accept": False, "reasons": ["score_missing"]}
 
-    if score >= 0.0:
-        return {"accept": True, "reasons": []}
-
-    return {"accept": False, "reasons": ["score_below_threshold"]}
+    reasons: list[str] = []
+    if score < 0.0:
+        reasons.append("score_below_threshold")
+    if (
+        p95_drawdown is not None
+        and max_p95_drawdown is not None
+        and p95_drawdown > max_p95_drawdown
+    ):
+        reasons.append("p95_drawdown_exceeded")
+    return {"accept": not reasons, "reasons": reasons}
@@ -26,6 +26,7 @@ def build_optimization_snapshot(
     opt_trials: int,
     score: float | None = None,
     salvage: dict | None = None,
+    robustness: dict | None = None,
 ) -> dict:
     if not enabled:
         return {
@@ -36,7 +37,13 @@ def build_optimization_snapshot(
             "salvage": salvage,
         }
 
-    gates = evaluate_optimization_gates(score)
+    gates = evaluate_optimization_gates(
+        score,
+        p95_drawdown=None if robustness is None else robustness.get("p95_drawdown"),
+        max_p95_drawdown=(
+            None if robustness is None else robustness.get("max_p95_drawdown")
+        ),
+    )
     return {
         "enabled": True,
         "trials": opt_trials,
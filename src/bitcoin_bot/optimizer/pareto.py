@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+
+ObjectiveGoal = Literal["max", "min"]
+
+PARETO_OBJECTIVES: tuple[tuple[str, ObjectiveGoal], ...] = (
+    ("return", "max"),
+    ("max_drawdown", "min"),
+    ("profit_factor", "max"),
+)
+
+
+def pareto_front_mask(values: np.ndarray) -> np.ndarray:
+    points = np.asarray(values, dtype=np.float64)
+    mask = np.zeros(points.shape[0], dtype=bool)
+    if points.shape[0] == 0:
+        return mask
+
+    order = np.lexsort(
+        tuple(-points[:, column] for column in reversed(range(points.shape[1])))
+    )
+    front = np.empty_like(points)
+    front_size = 0
+    for index in order:
+        point = points[index]
+        current = front[:front_size]
+        dominated = np.any(
+            np.all(current >= point, axis=1) & np.any(current > point, axis=1)
+        )
+        if dominated:
+            continue
+        front[front_size] = point
+        front_size += 1
+        mask[index] = True
+    return mask
+
+
+def pareto_front(
+    trials: list[dict],
+    objectives: tuple[tuple[str, ObjectiveGoal], ...] = PARETO_OBJECTIVES,
+) -> list[dict]:
+    candidates = [trial for trial in trials if not trial.get("pruned", False)]
+    if not candidates:
+        return []
+
+    values = np.array(
+        [
+            [
+                trial["metrics"][metric] if goal == "max" else -trial["metrics"][metric]
+                for metric, goal in objectives
+            ]
+            for trial in candidates
+        ],
+        dtype=np.float64,
+    )
+    mask = pareto_front_mask(values)
+    front = [trial for trial, keep in zip(candidates, mask) if keep]
+    return sorted(
+        front, key=lambda trial: trial["metrics"][objectives[0][0]], reverse=True
+    )
+
+
+def build_pareto_payload(
+    trials: list[dict],
+    objectives: tuple[tuple[str, ObjectiveGoal], ...] = PARETO_OBJECTIVES,
+) -> dict:
+    front = pareto_front(trials, objectives)
+    return {
+        "objectives": [{"metric": metric, "goal": goal} for metric, goal in objectives],
+        "trial_count": len(trials),
+        "front_size": len(front),
+        "front": [
+            {
+                "trial": trial.get("trial"),
+                "params": trial["params"],
+                "metrics": trial["metrics"],
+                "score": trial["score"],
+            }
+            for trial in front
+        ],
+    }
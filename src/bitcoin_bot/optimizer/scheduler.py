@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+
+import pandas as pd
+
+from bitcoin_bot.indicators.generator import VOLUME_MA_WINDOW
+from bitcoin_bot.optimizer.search import (
+    ParamValue,
+    SearchContext,
+    SearchEvaluator,
+    SearchResult,
+    apply_params,
+    evaluate_param_batch,
+    sample_trial_params,
+    select_best_trial,
+)
+from bitcoin_bot.optimizer.trial_store import TrialStore
+
+WARMUP_MARGIN_BARS = 50
+
+
+def halving_fractions(*, eta: int, min_fraction: float) -> list[float]:
+    fractions: list[float] = []
+    fraction = min_fraction
+    while fraction < 1.0 - 1e-9:
+        fractions.append(fraction)
+        fraction *= eta
+    fractions.append(1.0)
+    return fractions
+
+
+def rung_warmup_bars(batch: list[dict[str, ParamValue]], context: SearchContext) -> int:
+    longest = VOLUME_MA_WINDOW
+    for params in batch:
+        strategy, _ = apply_params(params, strategy=context.strategy, risk=context.risk)
+        longest = max(
+            longest,
+            strategy.ema_fast,
+            strategy.ema_slow,
+            strategy.rsi_period,
+            strategy.atr_period,
+        )
+    return longest + WARMUP_MARGIN_BARS
+
+
+def run_successive_halving(
+    frame: pd.DataFrame,
+    context: SearchContext,
+    *,
+    trials: int,
+    seed: int = 0,
+    max_workers: int = 1,
+    eta: int = 3,
+    min_fraction: float = 0.04,
+    store: TrialStore | None = None,
+) -> SearchResult:
+    batch = sample_trial_params(context, trials=trials, seed=seed)
+    rows = len(frame)
+    fractions = halving_fractions(eta=eta, min_fraction=min_fraction)
+    warmup_bars = rung_warmup_bars(batch, context)
+
+    latest: dict[int, dict] = {}
+    survivors = list(range(len(batch)))
+    rungs: list[dict] = []
+    bar_evaluations = 0
+    with SearchEvaluator(frame, context, max_workers=max_workers) as evaluator:
+        for rung, fraction in enumerate(fractions):
+            bars = (
+                rows
+                if fraction >= 1.0
+                else min(rows, max(int(rows * fraction), warmup_bars, 2))
+            )
+            results = evaluate_param_batch(
+                evaluator,
+                [batch[index] for index in survivors],
+                bars=bars,
+                store=store,
+            )
+            bar_evaluations += bars * len(survivors)
+            for index, trial in zip(survivors, results):
+                trial.update(trial=index, rung=rung, bars=bars, pruned=False)
+                latest[index] = trial
+
+            ranked = sorted(
+                survivors, key=lambda index: latest[index]["score"], reverse=True
+            )
+            is_last = rung == len(fractions) - 1
+            keep = len(ranked) if is_last else max(1, math.ceil(len(ranked) / eta))
+            pruned = ranked[keep:]
+            for index in pruned:
+                latest[index]["pruned"] = True
+            rungs.append(
+                {
+                    "rung": rung,
+                    "fraction": fraction,
+                    "bars": bars,
+                    "evaluated": len(survivors),
+                    "kept": keep,
+                    "score_cutoff": latest[ranked[keep - 1]]["score"],
+                    "pruned_trials": sorted(pruned),
+                }
+            )
+            survivors = sorted(ranked[:keep])
+
+    trials_by_index = [latest[index] for index in range(len(batch))]
+    full_bar_evaluations = rows * len(batch)
+    salvage = {
+        "scheduler": "successive_halving",
+        "eta": eta,
+        "min_fraction": min_fraction,
+        "warmup_bars": warmup_bars,
+        "rungs": rungs,
+        "bar_evaluations": bar_evaluations,
+        "full_bar_evaluations": full_bar_evaluations,
+        "savings_ratio": (
+            full_bar_evaluations / bar_evaluations if bar_evaluations else 0.0
+        ),
+    }
+    finalists = [trial for trial in trials_by_index if not trial["pruned"]]
+    return SearchResult(
+        trials=trials_by_index,
+        best=select_best_trial(finalists),
+        salvage=salvage,
+        cache_stats=evaluator.cache_stats,
+    )
@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Literal, Protocol, Self
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.backtest.costs import BpsFillCostModel, FillCostModel
+from bitcoin_bot.backtest.simulator import evaluate_strategy
+from bitcoin_bot.config.models import BacktestSettings, RiskSettings, StrategySettings
+from bitcoin_bot.indicators.cache import (
+    DEFAULT_INDICATOR_CACHE_MAX_DISK_BYTES,
+    IndicatorCache,
+    IndicatorCacheStats,
+    ohlcv_content_hash,
+)
+from bitcoin_bot.optimizer.gates import evaluate_optimization_gates
+from bitcoin_bot.optimizer.orchestrator import score_from_backtest_metrics
+from bitcoin_bot.optimizer.trial_store import TrialStore
+
+ParamKind = Literal["int", "float", "categorical"]
+ParamValue = int | float | str | bool
+ParamSection = Literal["strategy", "risk"]
+
+SHARED_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+_WORKER_CACHE_BYTES = 64 * 1024 * 1024
+_SIMULATOR_BACKTEST_FIELDS = ("initial_balance", "cooldown_bars", "max_holding_bars")
+
+
+@dataclass(slots=True)
+class _SearchWorkerState:
+    shared: SharedMemory
+    frame: pd.DataFrame
+    context: SearchContext
+    cache: IndicatorCache
+
+
+_WORKER_STATE: _SearchWorkerState | None = None
+
+
+@dataclass(slots=True)
+class ParameterSpec:
+    section: ParamSection
+    name: str
+    low: float = 0.0
+    high: float = 0.0
+    kind: ParamKind = "float"
+    choices: tuple[ParamValue, ...] = ()
+    condition: tuple[str, tuple[ParamValue, ...]] | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.section}.{self.name}"
+
+    def is_active(self, params: dict[str, ParamValue]) -> bool:
+        if self.condition is None:
+            return True
+        parent, allowed = self.condition
+        return parent in params and params[parent] in allowed
+
+
+DEFAULT_SEARCH_SPACE = (
+    ParameterSpec("strategy", "ema_fast", 4, 30, "int"),
+    ParameterSpec("strategy", "ema_slow", 10, 120, "int"),
+    ParameterSpec("strategy", "min_confidence", 0.2, 0.9),
+    ParameterSpec("strategy", "regime_max_atr_to_price_ratio", 0.01, 0.3),
+    ParameterSpec("strategy", "regime_min_volume_ratio", 0.0, 1.0),
+    ParameterSpec("risk", "position_risk_fraction", 0.002, 0.03),
+)
+
+
+class TrialSampler(Protocol):
+    def sample(self) -> dict[str, ParamValue]: ...
+
+    def tell(self, params: dict[str, ParamValue], score: float) -> None: ...
+
+
+class RandomSampler:
+    def __init__(
+        self,
+        space: tuple[ParameterSpec, ...] = DEFAULT_SEARCH_SPACE,
+        *,
+        seed: int = 0,
+    ) -> None:
+        self.space = tuple(space)
+        self._rng = np.random.default_rng(seed)
+
+    def tell(self, params: dict[str, ParamValue], score: float) -> None:
+        return None
+
+    def sample(self) -> dict[str, ParamValue]:
+        params: dict[str, ParamValue] = {}
+        for spec in self.space:
+            if not spec.is_active(params):
+                continue
+            if spec.kind == "categorical":
+                params[spec.key] = spec.choices[
+                    int(self._rng.integers(len(spec.choices)))
+                ]
+            elif spec.kind == "int":
+                params[spec.key] = int(
+                    self._rng.integers(int(spec.low), int(spec.high) + 1)
+                )
+            else:
+                params[spec.key] = float(self._rng.uniform(spec.low, spec.high))
+        return params
+
+
+@dataclass(slots=True)
+class SearchContext:
+    strategy: StrategySettings
+    risk: RiskSettings
+    backtest: BacktestSettings
+    cost_model: FillCostModel | None = None
+    space: tuple[ParameterSpec, ...] = DEFAULT_SEARCH_SPACE
+    cache_dir: str | None = None
+    cache_max_disk_bytes: int = DEFAULT_INDICATOR_CACHE_MAX_DISK_BYTES
+
+    def indicator_cache(self) -> IndicatorCache:
+        return IndicatorCache(
+            max_bytes=_WORKER_CACHE_BYTES,
+            cache_dir=self.cache_dir,
+            max_disk_bytes=self.cache_max_disk_bytes,
+        )
+
+
+@dataclass(slots=True)
+class SearchResult:
+    trials: list[dict]
+    best: dict | None
+    salvage: dict | None = None
+    cache_stats: IndicatorCacheStats | None = None
+
+    @property
+    def trials_executed(self) -> int:
+        return len(self.trials)
+
+    def to_summary(self, top_n: int = 5) -> dict:
+        ranked = sorted(self.trials, key=lambda trial: trial["score"], reverse=True)
+        return {
+            "trials_executed": self.trials_executed,
+            "cached_trials": sum(1 for trial in self.trials if trial.get("cached")),
+            "best": self.best,
+            "top_trials": ranked[:top_n],
+            "indicator_cache": (
+                None if self.cache_stats is None else self.cache_stats.to_dict()
+            ),
+        }
+
+
+def apply_params(
+    params: dict[str, ParamValue],
+    *,
+    strategy: StrategySettings,
+    risk: RiskSettings,
+) -> tuple[StrategySettings, RiskSettings]:
+    updates: dict[str, dict[str, Any]] = {"strategy": {}, "risk": {}}
+    for key, value in params.items():
+        section, _, name = key.partition(".")
+        if section not in updates or not name:
+            raise ValueError(f"Invalid search parameter: {key}")
+        updates[section][name] = value
+
+    tuned_strategy = replace(strategy, **updates["strategy"])
+    if tuned_strategy.ema_slow <= tuned_strategy.ema_fast:
+        tuned_strategy.ema_slow = tuned_strategy.ema_fast + 1
+    return tuned_strategy, replace(risk, **updates["risk"])
+
+
+def current_params(
+    space: tuple[ParameterSpec, ...],
+    *,
+    strategy: StrategySettings,
+    risk: RiskSettings,
+) -> dict[str, ParamValue]:
+    sections = {"strategy": strategy, "risk": risk}
+    params: dict[str, ParamValue] = {}
+    for spec in space:
+        if spec.is_active(params):
+            params[spec.key] = getattr(sections[spec.section], spec.name)
+    return params
+
+
+def evaluate_params(
+    frame: pd.DataFrame,
+    params: dict[str, ParamValue],
+    context: SearchContext,
+    *,
+    entry_start: int = 0,
+    cache: IndicatorCache | None = None,
+    content_hash: str | None = None,
+) -> dict:
+    strategy, risk = apply_params(params, strategy=context.strategy, risk=context.risk)
+    metrics = evaluate_strategy(
+        frame,
+        strategy=strategy,
+        risk=risk,
+        backtest=context.backtest,
+        cost_model=context.cost_model,
+        entry_start=entry_start,
+        cache=cache,
+        content_hash=content_hash,
+    )
+    score = score_from_backtest_metrics(metrics)
+    return {
+        "params": current_params(context.space, strategy=strategy, risk=risk),
+        "score": score,
+        "metrics": metrics,
+        "gates": evaluate_optimization_gates(score),
+    }
+
+
+def share_ohlcv_frame(frame: pd.DataFrame) -> tuple[SharedMemory, tuple[int, int]]:
+    shape = (len(SHARED_OHLCV_COLUMNS), len(frame))
+    shared = SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    values = np.ndarray(shape, dtype=np.float64, buffer=shared.buf)
+    for position, column in enumerate(SHARED_OHLCV_COLUMNS):
+        values[position] = frame[column].to_numpy(dtype=np.float64)
+    return shared, shape
+
+
+def attach_ohlcv_frame(
+    name: str, shape: tuple[int, int]
+) -> tuple[SharedMemory, pd.DataFrame]:
+    shared = SharedMemory(name=name)
+    values = np.ndarray(shape, dtype=np.float64, buffer=shared.buf)
+    values.flags.writeable = False
+    frame = pd.DataFrame(
+        {
+            column: values[position]
+            for position, column in enumerate(SHARED_OHLCV_COLUMNS)
+        },
+        copy=False,
+    )
+    return shared, frame
+
+
+def _init_search_worker(
+    name: str, shape: tuple[int, int], context: SearchContext
+) -> None:
+    global _WORKER_STATE
+    shared, frame = attach_ohlcv_frame(name, shape)
+    _WORKER_STATE = _SearchWorkerState(
+        shared=shared,
+        frame=frame,
+        context=context,
+        cache=context.indicator_cache(),
+    )
+
+
+def _run_search_trial(
+    task: tuple[dict[str, ParamValue], int, str],
+) -> tuple[dict, IndicatorCacheStats]:
+    state = _WORKER_STATE
+    if state is None:
+        raise RuntimeError("search worker is not initialized")
+    params, bars, content_hash = task
+    trial = evaluate_params(
+        state.frame.iloc[:bars],
+        params,
+        state.context,
+        cache=state.cache,
+        content_hash=content_hash,
+    )
+    stats = state.cache.stats
+    state.cache.stats = IndicatorCacheStats()
+    return trial, stats
+
+
+def trial_key(
+    params: dict[str, ParamValue], context: SearchContext, *, entry_start: int = 0
+) -> str:
+    strategy, risk = apply_params(params, strategy=context.strategy, risk=context.risk)
+    payload = {
+        "strategy": asdict(strategy),
+        "risk": asdict(risk),
+        "backtest": {
+            name: getattr(context.backtest, name) for name in _SIMULATOR_BACKTEST_FIELDS
+        },
+        "costs": (context.cost_model or BpsFillCostModel()).describe(),
+        "entry_start": entry_start,
+    }
+    key_text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(key_text.encode("utf-8")).hexdigest()
+
+
+class SearchEvaluator:
+    def __init__(
+        self, frame: pd.DataFrame, context: SearchContext, *, max_workers: int = 1
+    ) -> None:
+        self.frame = frame
+        self.context = context
+        self.max_workers = max_workers
+        self._cache = context.indicator_cache()
+        self._worker_stats = IndicatorCacheStats()
+        self._content_hashes: dict[int, str] = {}
+        self._shared: SharedMemory | None = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def cache_stats(self) -> IndicatorCacheStats:
+        stats = IndicatorCacheStats()
+        stats.merge(self._cache.stats)
+        stats.merge(self._worker_stats)
+        return stats
+
+    def content_hash(self, bars: int) -> str:
+        if bars not in self._content_hashes:
+            self._content_hashes[bars] = ohlcv_content_hash(self.frame.iloc[:bars])
+        return self._content_hashes[bars]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared.unlink()
+            self._shared = None
+
+    def _worker_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._shared, shape = share_ohlcv_frame(self.frame)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_search_worker,
+                initargs=(self._shared.name, shape, self.context),
+            )
+        return self._pool
+
+    def iter_evaluations(
+        self, batch: list[dict[str, ParamValue]], *, bars: int
+    ) -> Iterator[dict]:
+        content_hash = self.content_hash(bars)
+        if self.max_workers <= 1 or len(batch) <= 1:
+            frame = self.frame.iloc[:bars]
+            for params in batch:
+                yield evaluate_params(
+                    frame,
+                    params,
+                    self.context,
+                    cache=self._cache,
+                    content_hash=content_hash,
+                )
+            return
+
+        tasks = [(params, bars, content_hash) for params in batch]
+        for trial, stats in self._worker_pool().map(_run_search_trial, tasks):
+            self._worker_stats.merge(stats)
+            yield trial
+
+
+def evaluate_param_batch(
+    evaluator: SearchEvaluator,
+    batch: list[dict[str, ParamValue]],
+    *,
+    bars: int | None = None,
+    store: TrialStore | None = None,
+) -> list[dict]:
+    resolved_bars = len(evaluator.frame) if bars is None else bars
+    if store is None:
+        return list(evaluator.iter_evaluations(batch, bars=resolved_bars))
+
+    data_hash = evaluator.content_hash(resolved_bars)
+    keys = [trial_key(params, evaluator.context) for params in batch]
+    stored = store.get_many(data_hash, keys)
+    pending = {key: params for key, params in zip(keys, batch) if key not in stored}
+    fresh: dict[str, dict] = {}
+    evaluations = evaluator.iter_evaluations(list(pending.values()), bars=resolved_bars)
+    for key, trial in zip(pending, evaluations):
+        store.put_many(data_hash, [(key, trial)])
+        fresh[key] = trial
+
+    results: list[dict] = []
+    for key in keys:
+        if key in fresh:
+            results.append({**fresh[key], "cached": False})
+            continue
+        record = stored[key]
+        results.append(
+            {
+                "params": record["params"],
+                "score": record["score"],
+                "metrics": record["metrics"],
+                "gates": evaluate_optimization_gates(record["score"]),
+                "cached": True,
+            }
+        )
+    return results
+
+
+def select_best_trial(trials: list[dict]) -> dict | None:
+    if not trials:
+        return None
+    accepted = [trial for trial in trials if trial.get("gates", {}).get("accept")]
+    return max(accepted or trials, key=lambda trial: trial["score"])
+
+
+def sample_trial_params(
+    context: SearchContext, *, trials: int, seed: int = 0
+) -> list[dict[str, ParamValue]]:
+    sampler = RandomSampler(context.space, seed=seed)
+    batch = [
+        current_params(context.space, strategy=context.strategy, risk=context.risk)
+    ]
+    batch.extend(sampler.sample() for _ in range(max(trials, 1) - 1))
+    return batch
+
+
+def run_parameter_search(
+    frame: pd.DataFrame,
+    context: SearchContext,
+    *,
+    trials: int,
+    seed: int = 0,
+    max_workers: int = 1,
+    store: TrialStore | None = None,
+    sampler: TrialSampler | None = None,
+    batch_size: int | None = None,
+) -> SearchResult:
+    resolved_sampler = sampler or RandomSampler(context.space, seed=seed)
+    total = max(trials, 1)
+    step = total if batch_size is None else max(batch_size, 1)
+    pending = [
+        current_params(context.space, strategy=context.strategy, risk=context.risk)
+    ]
+
+    results: list[dict] = []
+    with SearchEvaluator(frame, context, max_workers=max_workers) as evaluator:
+        while len(results) < total:
+            count = min(step, total - len(results))
+            batch = pending[:count]
+            batch.extend(resolved_sampler.sample() for _ in range(count - len(batch)))
+            pending = []
+            for trial in evaluate_param_batch(evaluator, batch, store=store):
+                trial["trial"] = len(results)
+                resolved_sampler.tell(trial["params"], trial["score"])
+                results.append(trial)
+    return SearchResult(
+        trials=results,
+        best=select_best_trial(results),
+        cache_stats=evaluator.cache_stats,
+    )
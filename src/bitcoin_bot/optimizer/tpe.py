@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from bitcoin_bot.optimizer.search import (
+    DEFAULT_SEARCH_SPACE,
+    ParameterSpec,
+    ParamValue,
+    RandomSampler,
+)
+
+_BANDWIDTH_SCALE = 0.2
+_MIN_BANDWIDTH_FRACTION = 0.01
+_LOG_SQRT_2PI = 0.5 * math.log(2.0 * math.pi)
+
+
+def _parzen_components(
+    values: list[ParamValue], *, low: float, high: float
+) -> tuple[np.ndarray, np.ndarray]:
+    width = high - low
+    observed = np.asarray(values, dtype=np.float64)
+    bandwidth = max(
+        _BANDWIDTH_SCALE * width * (observed.shape[0] + 1) ** -0.2,
+        _MIN_BANDWIDTH_FRACTION * width,
+    )
+    mus = np.append(observed, 0.5 * (low + high))
+    sigmas = np.append(np.full(observed.shape[0], bandwidth), width)
+    return mus, sigmas
+
+
+def _log_mixture_density(
+    values: np.ndarray, mus: np.ndarray, sigmas: np.ndarray
+) -> np.ndarray:
+    z = (values[:, None] - mus[None, :]) / sigmas[None, :]
+    log_pdf = -0.5 * z * z - np.log(sigmas)[None, :] - _LOG_SQRT_2PI
+    peak = log_pdf.max(axis=1)
+    return (
+        peak + np.log(np.exp(log_pdf - peak[:, None]).sum(axis=1)) - math.log(mus.size)
+    )
+
+
+class TPESampler:
+    def __init__(
+        self,
+        space: tuple[ParameterSpec, ...] = DEFAULT_SEARCH_SPACE,
+        *,
+        seed: int = 0,
+        n_startup_trials: int = 10,
+        gamma: float = 0.25,
+        n_ei_candidates: int = 24,
+    ) -> None:
+        self.space = tuple(space)
+        self.n_startup_trials = n_startup_trials
+        self.gamma = gamma
+        self.n_ei_candidates = n_ei_candidates
+        self._rng = np.random.default_rng(seed)
+        self._startup = RandomSampler(self.space, seed=seed)
+        self._history: list[tuple[dict[str, ParamValue], float]] = []
+
+    def tell(self, params: dict[str, ParamValue], score: float) -> None:
+        self._history.append((dict(params), float(score)))
+
+    def sample(self) -> dict[str, ParamValue]:
+        if len(self._history) < self.n_startup_trials:
+            return self._startup.sample()
+
+        ranked = sorted(self._history, key=lambda item: item[1], reverse=True)
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = [params for params, _ in ranked[:n_good]]
+        bad = [params for params, _ in ranked[n_good:]]
+
+        params: dict[str, ParamValue] = {}
+        for spec in self.space:
+            if not spec.is_active(params):
+                continue
+            good_values = [trial[spec.key] for trial in good if spec.key in trial]
+            bad_values = [trial[spec.key] for trial in bad if spec.key in trial]
+            if spec.kind == "categorical":
+                params[spec.key] = self._sample_categorical(
+                    spec, good_values, bad_values
+                )
+            else:
+                params[spec.key] = self._sample_numeric(spec, good_values, bad_values)
+        return params
+
+    def _sample_numeric(
+        self,
+        spec: ParameterSpec,
+        good_values: list[ParamValue],
+        bad_values: list[ParamValue],
+    ) -> int | float:
+        low, high = float(spec.low), float(spec.high)
+        if spec.kind == "int":
+            low, high = low - 0.5, high + 0.5
+        good_mus, good_sigmas = _parzen_components(good_values, low=low, high=high)
+        bad_mus, bad_sigmas = _parzen_components(bad_values, low=low, high=high)
+
+        components = self._rng.integers(good_mus.size, size=self.n_ei_candidates)
+        candidates = np.clip(
+            self._rng.normal(good_mus[components], good_sigmas[components]), low, high
+        )
+        improvement = _log_mixture_density(
+            candidates, good_mus, good_sigmas
+        ) - _log_mixture_density(candidates, bad_mus, bad_sigmas)
+        value = float(candidates[int(np.argmax(improvement))])
+        if spec.kind == "int":
+            return int(min(max(round(value), int(spec.low)), int(spec.high)))
+        return value
+
+    def _sample_categorical(
+        self,
+        spec: ParameterSpec,
+        good_values: list[ParamValue],
+        bad_values: list[ParamValue],
+    ) -> ParamValue:
+        choices = list(spec.choices)
+        good_counts = np.ones(len(choices))
+        bad_counts = np.ones(len(choices))
+        for value in good_values:
+            good_counts[choices.index(value)] += 1.0
+        for value in bad_values:
+            bad_counts[choices.index(value)] += 1.0
+        good_probs = good_counts / good_counts.sum()
+        bad_probs = bad_counts / bad_counts.sum()
+
+        candidates = self._rng.choice(
+            len(choices), size=self.n_ei_candidates, p=good_probs
+        )
+        improvement = np.log(good_probs[candidates]) - np.log(bad_probs[candidates])
+        return choices[int(candidates[int(np.argmax(improvement))])]
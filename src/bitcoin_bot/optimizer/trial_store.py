@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    data_hash TEXT NOT NULL,
+    trial_key TEXT NOT NULL,
+    params TEXT NOT NULL,
+    score REAL NOT NULL,
+    metrics TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (data_hash, trial_key)
+);
+CREATE INDEX IF NOT EXISTS trials_by_score ON trials (data_hash, score DESC);
+CREATE INDEX IF NOT EXISTS trials_by_global_score ON trials (score DESC);
+"""
+_LOOKUP_CHUNK = 500
+
+
+def trial_store_path(cache_dir: str | Path) -> Path:
+    return Path(cache_dir) / "optimizer" / "trials.sqlite3"
+
+
+def _record(row: sqlite3.Row) -> dict:
+    return {
+        "data_hash": row["data_hash"],
+        "trial_key": row["trial_key"],
+        "params": json.loads(row["params"]),
+        "score": row["score"],
+        "metrics": json.loads(row["metrics"]),
+        "created_at": row["created_at"],
+    }
+
+
+class TrialStore:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> TrialStore:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return int(
+            self._connection.execute("SELECT COUNT(*) FROM trials").fetchone()[0]
+        )
+
+    def get_many(self, data_hash: str, trial_keys: list[str]) -> dict[str, dict]:
+        found: dict[str, dict] = {}
+        unique_keys = list(dict.fromkeys(trial_keys))
+        for start in range(0, len(unique_keys), _LOOKUP_CHUNK):
+            chunk = unique_keys[start : start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self._connection.execute(
+                "SELECT * FROM trials WHERE data_hash = ? "
+                f"AND trial_key IN ({placeholders})",
+                (data_hash, *chunk),
+            )
+            for row in rows:
+                found[row["trial_key"]] = _record(row)
+        return found
+
+    def put_many(self, data_hash: str, trials: list[tuple[str, dict]]) -> None:
+        created_at = datetime.now(UTC).isoformat()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO trials "
+                "(data_hash, trial_key, params, score, metrics, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        data_hash,
+                        trial_key,
+                        json.dumps(trial["params"], sort_keys=True),
+                        float(trial["score"]),
+                        json.dumps(trial["metrics"], sort_keys=True),
+                        created_at,
+                    )
+                    for trial_key, trial in trials
+                ],
+            )
+
+    def top_trials(self, k: int, *, data_hash: str | None = None) -> list[dict]:
+        if data_hash is None:
+            rows = self._connection.execute(
+                "SELECT * FROM trials ORDER BY score DESC LIMIT ?", (k,)
+            )
+        else:
+            rows = self._connection.execute(
+                "SELECT * FROM trials WHERE data_hash = ? ORDER BY score DESC LIMIT ?",
+                (data_hash, k),
+            )
+        return [_record(row) for row in rows]
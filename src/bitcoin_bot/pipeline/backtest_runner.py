@@ -1,11 +1,37 @@
 from __future__ import annotations
 
-import math
+import pandas as pd
 
+from bitcoin_bot.backtest.bootstrap import equity_bar_returns, run_bootstrap
+from bitcoin_bot.backtest.checkpoint import (
+    backtest_checkpoint_path,
+    checkpoint_settings_hash,
+    load_simulator_state,
+    run_checkpointed_simulation,
+    save_simulator_state,
+)
+from bitcoin_bot.backtest.costs import FillCostModel, fill_cost_model_from_settings
+from bitcoin_bot.backtest.simulator import (
+    SimulationResult,
+    bounded_metrics,
+    simulate_strategy,
+    simulation_metrics,
+)
+from bitcoin_bot.backtest.walk_forward import run_walk_forward
 from bitcoin_bot.config.models import RuntimeConfig
 from bitcoin_bot.data.ohlcv import load_ohlcv_for_backtest
 from bitcoin_bot.optimizer.orchestrator import score_from_backtest_metrics
-
+from bitcoin_bot.optimizer.pareto import build_pareto_payload
+from bitcoin_bot.optimizer.scheduler import run_successive_halving
+from bitcoin_bot.optimizer.search import (
+    SearchContext,
+    SearchResult,
+    apply_params,
+    run_parameter_search,
+    sample_trial_params,
+)
+from bitcoin_bot.optimizer.tpe import TPESampler
+from bitcoin_bot.optimizer.trial_store import TrialStore, trial_store_path
 
 REPLAY_SUMMARY_KEYS = (
     "mode",
@@ -19,51 +45,201 @@ REPLAY_SUMMARY_KEYS = (
 )
 
 
-def run_backtest(config: RuntimeConfig) -> dict:
-    frame, data_source, fallback_reason = load_ohlcv_for_backtest(
+def _run_optimizer(
+    frame: pd.DataFrame,
+    context: SearchContext,
+    config: RuntimeConfig,
+    *,
+    store: TrialStore | None = None,
+) -> SearchResult:
+    if config.optimizer.scheduler == "successive_halving":
+        return run_successive_halving(
+            frame,
+            context,
+            trials=config.optimizer.opt_trials,
+            seed=config.optimizer.seed,
+            max_workers=config.optimizer.max_workers,
+            eta=config.optimizer.halving_eta,
+            min_fraction=config.optimizer.halving_min_fraction,
+            store=store,
+        )
+    if config.optimizer.sampler == "tpe":
+        return run_parameter_search(
+            frame,
+            context,
+            trials=config.optimizer.opt_trials,
+            max_workers=config.optimizer.max_workers,
+            store=store,
+            sampler=TPESampler(context.space, seed=config.optimizer.seed),
+            batch_size=config.optimizer.max_workers,
+        )
+    return run_parameter_search(
+        frame,
+        context,
+        trials=config.optimizer.opt_trials,
+        seed=config.optimizer.seed,
+        max_workers=config.optimizer.max_workers,
+        store=store,
+    )
+
+
+def _run_robustness(
+    frame: pd.DataFrame,
+    config: RuntimeConfig,
+    *,
+    baseline: SimulationResult,
+    cost_model: FillCostModel,
+    search: SearchResult | None,
+) -> dict:
+    params = {} if search is None or search.best is None else search.best["params"]
+    selected = baseline
+    if params:
+        strategy, risk = apply_params(
+            params, strategy=config.strategy, risk=config.risk
+        )
+        selected = simulate_strategy(
+            frame,
+            strategy=strategy,
+            risk=risk,
+            backtest=config.backtest,
+            cost_model=cost_model,
+        )
+    robustness = run_bootstrap(
+        trade_returns=selected.trades.trade_return,
+        bar_returns=equity_bar_returns(selected.equity),
+        samples=config.backtest.bootstrap_samples,
+        block_bars=config.backtest.bootstrap_block_bars,
+        seed=config.backtest.bootstrap_seed,
+        max_workers=config.optimizer.max_workers,
+    )
+    robustness["params"] = params
+    robustness["max_p95_drawdown"] = config.risk.max_drawdown
+    return robustness
+
+
+def _run_checkpointed_simulation(
+    frame: pd.DataFrame, config: RuntimeConfig, cost_model: FillCostModel
+) -> tuple[SimulationResult, dict]:
+    path = backtest_checkpoint_path(
+        config.paths.cache_dir,
+        symbol=config.exchange.symbol,
+        product_type=config.exchange.product_type,
+        timeframe=config.data.timeframe,
+        settings_hash=checkpoint_settings_hash(
+            strategy=config.strategy,
+            risk=config.risk,
+            backtest=config.backtest,
+            cost_model=cost_model,
+        ),
+    )
+    simulation, state, checkpoint = run_checkpointed_simulation(
+        frame,
+        strategy=config.strategy,
+        risk=config.risk,
+        backtest=config.backtest,
+        cost_model=cost_model,
+        state=load_simulator_state(path),
+    )
+    save_simulator_state(path, state)
+    return simulation, checkpoint
+
+
+def load_backtest_frame(config: RuntimeConfig) -> tuple[pd.DataFrame, str, str | None]:
+    return load_ohlcv_for_backtest(
         csv_path=config.data.csv_path,
         symbol=config.exchange.symbol,
         timeframe=config.data.timeframe,
         backtest_data_quality_mode=config.data.backtest_data_quality_mode,
+        cache_dir=config.paths.cache_dir if config.data.ohlcv_cache_enabled else None,
+        chunk_rows=config.data.csv_chunk_rows or None,
+        cache_max_entries=config.data.ohlcv_cache_max_entries,
+        source_priority=config.data.source_priority,
+        kline_store_dir=config.paths.cache_dir,
     )
 
-    closes = frame["close"].astype(float)
-    close_returns = closes.pct_change().dropna()
 
-    if close_returns.empty:
-        return_metric = 0.0
-        max_drawdown = 0.0
-        win_rate = 0.0
-        profit_factor = 0.0
-        trade_count = 0.0
+def run_backtest(config: RuntimeConfig) -> dict:
+    frame, data_source, fallback_reason = load_backtest_frame(config)
+    result, _ = run_backtest_on_frame(
+        config, frame, data_source=data_source, fallback_reason=fallback_reason
+    )
+    return result
+
+
+def run_backtest_on_frame(
+    config: RuntimeConfig,
+    frame: pd.DataFrame,
+    *,
+    data_source: str,
+    fallback_reason: str | None,
+) -> tuple[dict, SimulationResult]:
+    cost_model = fill_cost_model_from_settings(config.exchange, config.backtest)
+    checkpoint = None
+    if config.backtest.checkpoint_enabled:
+        simulation, checkpoint = _run_checkpointed_simulation(frame, config, cost_model)
     else:
-        return_metric = float((closes.iloc[-1] / closes.iloc[0]) - 1.0)
-        equity_curve = (1.0 + close_returns).cumprod()
-        drawdown_series = (equity_curve / equity_curve.cummax()) - 1.0
-        max_drawdown = abs(float(drawdown_series.min()))
-
-        positive_returns = close_returns[close_returns > 0.0]
-        negative_returns = close_returns[close_returns < 0.0]
-        win_rate = float((close_returns > 0.0).mean())
-        gross_profit = float(positive_returns.sum())
-        gross_loss = abs(float(negative_returns.sum()))
-        profit_factor = (
-            gross_profit / gross_loss if gross_loss > 1e-12 else gross_profit
+        simulation = simulate_strategy(
+            frame,
+            strategy=config.strategy,
+            risk=config.risk,
+            backtest=config.backtest,
+            cost_model=cost_model,
         )
-        trade_count = float((close_returns.abs() > 0.0).sum())
-
-    metrics = {
-        "return": return_metric,
-        "max_drawdown": min(max(max_drawdown, 0.0), 1.0),
-        "win_rate": min(max(win_rate, 0.0), 1.0),
-        "profit_factor": max(profit_factor, 0.0),
-        "trade_count": max(trade_count, 0.0),
-    }
+    raw_metrics = simulation_metrics(simulation)
+    metrics = bounded_metrics(raw_metrics)
+    optimization_score = score_from_backtest_metrics(metrics)
+
+    context = SearchContext(
+        strategy=config.strategy,
+        risk=config.risk,
+        backtest=config.backtest,
+        cost_model=cost_model,
+        cache_dir=(
+            config.paths.cache_dir
+            if config.optimizer.indicator_cache_disk_enabled
+            else None
+        ),
+        cache_max_disk_bytes=config.optimizer.indicator_cache_max_disk_bytes,
+    )
+    search = None
+    if config.optimizer.enabled:
+        if config.optimizer.trial_store_enabled:
+            with TrialStore(trial_store_path(config.paths.cache_dir)) as store:
+                search = _run_optimizer(frame, context, config, store=store)
+        else:
+            search = _run_optimizer(frame, context, config)
+        if search.best is not None:
+            optimization_score = search.best["score"]
 
-    if not math.isfinite(metrics["profit_factor"]):
-        metrics["profit_factor"] = 0.0
+    walk_forward = None
+    if config.backtest.walk_forward_enabled:
+        walk_forward = run_walk_forward(
+            frame,
+            context,
+            candidates=(
+                sample_trial_params(
+                    context,
+                    trials=config.optimizer.opt_trials,
+                    seed=config.optimizer.seed,
+                )
+                if config.optimizer.enabled
+                else None
+            ),
+            max_workers=config.optimizer.max_workers,
+        )
+        optimization_score = walk_forward["aggregate"]["oos_score"]
+
+    robustness = None
+    if config.backtest.bootstrap_samples > 0:
+        robustness = _run_robustness(
+            frame,
+            config,
+            baseline=simulation,
+            cost_model=cost_model,
+            search=search,
+        )
 
-    return {
+    result = {
         "status": "success",
         "summary": {
             "mode": "backtest",
@@ -72,10 +248,30 @@ def run_backtest(config: RuntimeConfig) -> dict:
             "data_source": data_source,
             "data_points": int(len(frame)),
             "data_fallback_reason": fallback_reason,
+            "initial_balance": simulation.initial_balance,
+            "final_balance": simulation.final_balance,
+            "fill_costs": {
+                **cost_model.describe(),
+                "fees_paid": raw_metrics["fees_paid"],
+                "slippage_cost": raw_metrics["slippage_cost"],
+            },
             **metrics,
+            **({"optimizer": search.to_summary()} if search is not None else {}),
+            **({"walk_forward": walk_forward} if walk_forward is not None else {}),
+            **({"robustness": robustness} if robustness is not None else {}),
+            **({"checkpoint": checkpoint} if checkpoint is not None else {}),
         },
-        "optimization_score": score_from_backtest_metrics(metrics),
+        "optimization_score": optimization_score,
+        "opt_trials_executed": 0 if search is None else search.trials_executed,
+        "optimization_salvage": None if search is None else search.salvage,
+        "robustness": robustness,
+        "pareto_front": (
+            build_pareto_payload(search.trials)
+            if search is not None and config.optimizer.pareto_enabled
+            else None
+        ),
     }
+    return result, simulation
 
 
 def extract_replay_summary(pipeline_result: dict) -> dict:
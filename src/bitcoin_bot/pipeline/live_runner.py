@@ -1,21 +1,36 @@
 from __future__ import annotations
 
 import math
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import cast
 from typing import Protocol
 from typing import Any
 
+import pandas as pd
+
 from bitcoin_bot.config.models import RuntimeConfig
+from bitcoin_bot.data.backfill import kline_backfill_partitions
+from bitcoin_bot.data.kline_store import KlineStore, timeframe_to_timedelta
+from bitcoin_bot.data.ohlcv import load_ohlcv_for_backtest
 from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
+from bitcoin_bot.exchange.http_pool import HttpConnectionPool
 from bitcoin_bot.exchange.protocol import (
     NormalizedError,
     NormalizedOrder,
     NormalizedOrderState,
     ProductType,
 )
+from bitcoin_bot.exchange.rate_limit import GMORateLimiter
+from bitcoin_bot.indicators.generator import VOLUME_MA_WINDOW, volume_moving_average
+from bitcoin_bot.indicators.incremental import (
+    IncrementalIndicatorEngine,
+    load_indicator_state,
+    save_indicator_state,
+)
 from bitcoin_bot.optimizer.gates import evaluate_risk_guards
 from bitcoin_bot.strategy.core import DecisionHooks, IndicatorInput, decide_action
+from bitcoin_bot.strategy.sizing import compute_order_qty
 from bitcoin_bot.telemetry.reason_codes import (
     REASON_CODE_EXECUTE_ORDERS_DISABLED,
     REASON_CODE_LIVE_HTTP_DISABLED,
@@ -69,46 +84,6 @@ def _resolve_available_balance(
     return 1_000_000.0
 
 
-def _compute_order_qty(
-    *,
-    available_balance: float,
-    close_price: float,
-    atr_value: float,
-    max_position_size: float,
-    position_risk_fraction: float,
-    min_order_qty: float,
-    qty_step: float,
-) -> tuple[float, dict[str, float]]:
-    close = max(close_price, 1e-9)
-    atr = max(atr_value, 1e-9)
-    risk_budget = available_balance * max(position_risk_fraction, 0.0)
-    qty_by_risk = risk_budget / atr
-
-    max_notional = available_balance * max(max_position_size, 0.0)
-    qty_by_cap = max_notional / close
-
-    raw_qty = min(qty_by_risk, qty_by_cap)
-    safe_step = max(qty_step, 1e-9)
-    rounded_qty = math.floor(raw_qty / safe_step) * safe_step
-    rounded_qty = round(max(rounded_qty, 0.0), 8)
-
-    final_qty = rounded_qty if rounded_qty >= min_order_qty else 0.0
-    sizing = {
-        "available_balance": available_balance,
-        "close": close,
-        "atr": atr,
-        "risk_budget": risk_budget,
-        "qty_by_risk": qty_by_risk,
-        "qty_by_cap": qty_by_cap,
-        "raw_qty": raw_qty,
-        "rounded_qty": rounded_qty,
-        "final_qty": final_qty,
-        "min_order_qty": min_order_qty,
-        "qty_step": safe_step,
-    }
-    return final_qty, sizing
-
-
 def _extract_order_error_info(
     order_state: NormalizedOrderState,
 ) -> tuple[str | None, bool | None]:
@@ -244,17 +219,196 @@ def _default_risk_snapshot() -> dict[str, float]:
     }
 
 
+def _refresh_kline_store(
+    *,
+    store: KlineStore,
+    adapter: Any,
+    config: RuntimeConfig,
+) -> int:
+    fetch_klines = getattr(adapter, "fetch_klines", None)
+    if not callable(fetch_klines):
+        return 0
+
+    now = datetime.now(UTC)
+    bar_interval = timeframe_to_timedelta(config.data.timeframe)
+    window_bars = config.data.live_window_bars
+    last_timestamp = store.last_timestamp()
+    if last_timestamp is None:
+        requests = [(now - (bar_interval * window_bars), now, window_bars)]
+    else:
+        start = last_timestamp.to_pydatetime() + bar_interval
+        if start + bar_interval > now:
+            return 0
+        requests = [
+            (
+                partition_start,
+                partition_end,
+                (partition_end - partition_start) // bar_interval + 1,
+            )
+            for partition_start, partition_end in kline_backfill_partitions(
+                adapter, timeframe=config.data.timeframe, start=start, end=now
+            )
+        ]
+
+    appended = 0
+    for partition_start, partition_end, limit in requests:
+        klines = fetch_klines(
+            config.exchange.symbol,
+            config.data.timeframe,
+            partition_start,
+            partition_end,
+            limit,
+        )
+        if getattr(klines, "error", None) is not None or not isinstance(klines, list):
+            break
+        closed_klines = [
+            kline
+            for kline in klines
+            if kline.timestamp.tzinfo is None or kline.timestamp + bar_interval <= now
+        ]
+        appended += store.append_klines(closed_klines)
+    return appended
+
+
+def _advance_indicator_engine(
+    *,
+    store: KlineStore,
+    frame: pd.DataFrame,
+    config: RuntimeConfig,
+) -> IncrementalIndicatorEngine | None:
+    windows = {
+        "ema_fast_window": config.strategy.ema_fast,
+        "ema_slow_window": config.strategy.ema_slow,
+        "rsi_window": config.strategy.rsi_period,
+        "atr_window": config.strategy.atr_period,
+    }
+    state_path = store.entry_dir / "indicator_state.json"
+    engine = load_indicator_state(state_path, **windows)
+    if engine is not None and engine.last_timestamp in frame.index:
+        engine.update_frame(frame[frame.index > engine.last_timestamp])
+    else:
+        history = store.load()
+        if history is None:
+            return None
+        engine = IncrementalIndicatorEngine.from_history(history, **windows)
+    if engine.last_timestamp != frame.index[-1]:
+        return None
+    try:
+        save_indicator_state(state_path, engine)
+    except OSError:
+        pass
+    return engine
+
+
+def _load_market_snapshot(
+    *,
+    config: RuntimeConfig,
+    adapter: Any,
+) -> tuple[dict[str, float], dict[str, object]]:
+    market_summary: dict[str, object] = {"source": "default", "bars": 0, "appended": 0}
+    if not config.data.live_kline_store_enabled:
+        return {}, market_summary
+
+    store = KlineStore(
+        cache_dir=config.paths.cache_dir,
+        symbol=config.exchange.symbol,
+        timeframe=config.data.timeframe,
+    )
+    try:
+        if store.last_timestamp() is None and Path(config.data.csv_path).exists():
+            seed_frame, _, _ = load_ohlcv_for_backtest(
+                csv_path=config.data.csv_path,
+                symbol=config.exchange.symbol,
+                timeframe=config.data.timeframe,
+                backtest_data_quality_mode="strict",
+                cache_dir=(
+                    config.paths.cache_dir if config.data.ohlcv_cache_enabled else None
+                ),
+                cache_max_entries=config.data.ohlcv_cache_max_entries,
+            )
+            store.append_frame(seed_frame)
+        appended = _refresh_kline_store(store=store, adapter=adapter, config=config)
+        frame = store.tail(config.data.live_window_bars)
+    except (OSError, ValueError):
+        return {}, market_summary
+
+    market_summary["appended"] = appended
+    if frame is None:
+        return {}, market_summary
+    market_summary["bars"] = int(len(frame))
+
+    required_bars = max(
+        config.strategy.ema_slow,
+        config.strategy.rsi_period + 1,
+        config.strategy.atr_period,
+        VOLUME_MA_WINDOW,
+    )
+    if len(frame) < required_bars:
+        return {}, market_summary
+
+    engine = _advance_indicator_engine(store=store, frame=frame, config=config)
+    if engine is None:
+        return {}, market_summary
+    latest = frame.iloc[-1]
+    values = (
+        {"close": latest["close"]}
+        | engine.snapshot()
+        | {
+            "volume": latest["volume"],
+            "volume_ma": volume_moving_average(frame["volume"]).iloc[-1],
+        }
+    )
+    resolved: dict[str, float] = {}
+    for key, value in values.items():
+        if pd.isna(value) or not math.isfinite(float(value)):
+            return {}, market_summary
+        resolved[key] = float(value)
+
+    market_summary["source"] = "kline_store"
+    return resolved, market_summary
+
+
+def _live_http_active(config: RuntimeConfig) -> bool:
+    return (
+        config.runtime.mode == "live"
+        and config.runtime.execute_orders
+        and config.runtime.live_http_enabled
+    )
+
+
 def run_live(
     config: RuntimeConfig,
     risk_snapshot: dict[str, float] | None = None,
     exchange_adapter: OrderPlacerProtocol | None = None,
 ) -> dict:
-    execute_orders_enabled = config.runtime.execute_orders
-    live_http_active = (
-        config.runtime.mode == "live"
-        and execute_orders_enabled
-        and config.runtime.live_http_enabled
+    connection_pool = (
+        HttpConnectionPool()
+        if exchange_adapter is None
+        and _live_http_active(config)
+        and config.exchange.http_keep_alive
+        else None
     )
+    try:
+        return _run_live(
+            config,
+            risk_snapshot=risk_snapshot,
+            exchange_adapter=exchange_adapter,
+            connection_pool=connection_pool,
+        )
+    finally:
+        if connection_pool is not None:
+            connection_pool.close()
+
+
+def _run_live(
+    config: RuntimeConfig,
+    *,
+    risk_snapshot: dict[str, float] | None,
+    exchange_adapter: OrderPlacerProtocol | None,
+    connection_pool: HttpConnectionPool | None,
+) -> dict:
+    execute_orders_enabled = config.runtime.execute_orders
+    live_http_active = _live_http_active(config)
     emit_run_progress(
         artifacts_dir=config.paths.artifacts_dir,
         mode="live",
@@ -266,7 +420,31 @@ def run_live(
     heartbeat.parent.mkdir(parents=True, exist_ok=True)
     heartbeat.write_text("ok", encoding="utf-8")
 
+    adapter = exchange_adapter or GMOAdapter(
+        product_type=cast(ProductType, config.exchange.product_type),
+        api_base_url=config.exchange.api_base_url,
+        ws_url=config.exchange.ws_url,
+        use_http=live_http_active,
+        private_retry_max_attempts=config.exchange.private_retry_max_attempts,
+        private_retry_base_delay_seconds=config.exchange.private_retry_base_delay_seconds,
+        connection_pool=connection_pool,
+        rate_limiter=(
+            GMORateLimiter.from_rates(
+                public_per_second=config.exchange.public_rate_limit_per_second,
+                private_per_second=config.exchange.private_rate_limit_per_second,
+                burst=config.exchange.rate_limit_burst,
+            )
+            if live_http_active and config.exchange.rate_limit_enabled
+            else None
+        ),
+    )
+    market_snapshot, market_summary = _load_market_snapshot(
+        config=config,
+        adapter=adapter,
+    )
+
     snapshot = _default_risk_snapshot()
+    snapshot.update(market_snapshot)
     if risk_snapshot:
         snapshot.update(risk_snapshot)
     guard_result = evaluate_risk_guards(
@@ -300,14 +478,6 @@ def run_live(
             regime_min_volume_ratio=config.strategy.regime_min_volume_ratio,
         ),
     )
-    adapter = exchange_adapter or GMOAdapter(
-        product_type=cast(ProductType, config.exchange.product_type),
-        api_base_url=config.exchange.api_base_url,
-        ws_url=config.exchange.ws_url,
-        use_http=live_http_active,
-        private_retry_max_attempts=config.exchange.private_retry_max_attempts,
-        private_retry_base_delay_seconds=config.exchange.private_retry_base_delay_seconds,
-    )
     stream_monitor_status = _probe_stream_monitor_status(adapter)
     order_attempted = False
     order_status = "not_attempted"
@@ -340,7 +510,7 @@ def run_live(
                 adapter=adapter,
                 snapshot=snapshot,
             )
-            qty, order_sizing = _compute_order_qty(
+            qty, order_sizing = compute_order_qty(
                 available_balance=available_balance,
                 close_price=snapshot["close"],
                 atr_value=snapshot["atr"],
@@ -516,6 +686,7 @@ def run_live(
             "reason_codes": reason_codes,
             "stop_reason_codes": stop_reason_codes,
             "risk_guards": guard_result,
+            "market_data": market_summary,
             "monitor_summary": {
                 "status": resolved_monitor_status,
                 "reconnect_count": 0,
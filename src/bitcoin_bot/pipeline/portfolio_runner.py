@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.config.models import BacktestRunSettings, RuntimeConfig
+from bitcoin_bot.config.validator import validate_config
+from bitcoin_bot.pipeline.backtest_runner import (
+    load_backtest_frame,
+    run_backtest_on_frame,
+)
+
+PortfolioTask = tuple[RuntimeConfig, pd.DataFrame, str, str | None]
+
+
+def build_run_config(config: RuntimeConfig, run: BacktestRunSettings) -> RuntimeConfig:
+    run_config = copy.deepcopy(config)
+    run_config.backtest.runs = []
+    run_config.exchange.symbol = run.symbol
+    run_config.exchange.product_type = run.product_type
+    for section, values in run.overrides.items():
+        settings = getattr(run_config, section)
+        for key, value in values.items():
+            setattr(settings, key, value)
+    return validate_config(run_config)
+
+
+def _data_key(config: RuntimeConfig) -> tuple:
+    return (
+        config.exchange.symbol,
+        config.data.csv_path,
+        config.data.timeframe,
+        config.data.backtest_data_quality_mode,
+        config.data.ohlcv_cache_enabled,
+        config.data.csv_chunk_rows,
+        tuple(config.data.source_priority),
+    )
+
+
+def _run_portfolio_member(task: PortfolioTask) -> tuple[dict, pd.Series]:
+    config, frame, data_source, fallback_reason = task
+    result, simulation = run_backtest_on_frame(
+        config, frame, data_source=data_source, fallback_reason=fallback_reason
+    )
+    equity = pd.Series(
+        simulation.equity,
+        index=pd.DatetimeIndex(frame["timestamp"]),
+        name=f"{config.exchange.symbol}:{config.exchange.product_type}",
+    )
+    return result, equity[~equity.index.duplicated(keep="last")]
+
+
+def portfolio_equity(curves: list[pd.Series]) -> pd.Series:
+    if not curves:
+        return pd.Series(dtype=np.float64)
+    aligned = pd.concat(curves, axis=1, ignore_index=True).sort_index().ffill()
+    return aligned.fillna(aligned.bfill().iloc[0]).sum(axis=1)
+
+
+def portfolio_summary(results: list[dict], equity: pd.Series) -> dict:
+    summaries = [result["summary"] for result in results]
+    initial_balance = float(sum(item["initial_balance"] for item in summaries))
+    final_balance = float(sum(item["final_balance"] for item in summaries))
+    trade_count = float(sum(item["trade_count"] for item in summaries))
+    values = equity.to_numpy(dtype=np.float64)
+    drawdown = 1.0 - (values / np.maximum.accumulate(values)) if values.size else values
+    return {
+        "mode": "backtest",
+        "run_count": len(results),
+        "symbols": sorted({item["symbol"] for item in summaries}),
+        "initial_balance": initial_balance,
+        "final_balance": final_balance,
+        "return": final_balance / initial_balance - 1.0 if initial_balance else 0.0,
+        "max_drawdown": float(drawdown.max()) if drawdown.size else 0.0,
+        "win_rate": (
+            sum(item["win_rate"] * item["trade_count"] for item in summaries)
+            / trade_count
+            if trade_count
+            else 0.0
+        ),
+        "trade_count": trade_count,
+    }
+
+
+def run_portfolio_backtest(config: RuntimeConfig) -> dict:
+    run_configs = [build_run_config(config, run) for run in config.backtest.runs]
+    frames: dict[tuple, tuple[pd.DataFrame, str, str | None]] = {}
+    for run_config in run_configs:
+        key = _data_key(run_config)
+        if key not in frames:
+            frames[key] = load_backtest_frame(run_config)
+
+    workers = min(config.optimizer.max_workers, len(run_configs))
+    if workers > 1:
+        for run_config in run_configs:
+            run_config.optimizer.max_workers = 1
+    tasks = [(run_config, *frames[_data_key(run_config)]) for run_config in run_configs]
+    if workers <= 1:
+        members = [_run_portfolio_member(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            members = list(pool.map(_run_portfolio_member, tasks))
+
+    results = [result for result, _ in members]
+    scores = [result["optimization_score"] for result in results]
+    return {
+        "status": "success",
+        "summary": {
+            **portfolio_summary(results, portfolio_equity([e for _, e in members])),
+            "data_loads": len(frames),
+        },
+        "runs": results,
+        "optimization_score": (
+            None if not scores or None in scores else float(min(scores))
+        ),
+        "opt_trials_executed": sum(
+            int(result.get("opt_trials_executed", 0)) for result in results
+        ),
+        "optimization_salvage": None,
+        "robustness": None,
+        "pareto_front": None,
+    }
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from bitcoin_bot.strategy.core import (
+    Action,
+    DecisionHooks,
+    StrategyDecision,
+    StrategyRisk,
+)
+from bitcoin_bot.telemetry.reason_codes import (
+    REASON_CODE_BELOW_MIN_CONFIDENCE,
+    REASON_CODE_COOLDOWN_ACTIVE,
+    REASON_CODE_EMA_MOMENTUM_LONG,
+    REASON_CODE_EMA_MOMENTUM_SHORT,
+    REASON_CODE_NO_TRADE_SETUP,
+    REASON_CODE_REGIME_THIN_LIQUIDITY,
+    REASON_CODE_REGIME_VOLATILITY_SPIKE,
+)
+
+ACTION_HOLD = 0
+ACTION_BUY = 1
+ACTION_SELL = -1
+ACTION_NAMES: dict[int, Action] = {
+    ACTION_HOLD: "hold",
+    ACTION_BUY: "buy",
+    ACTION_SELL: "sell",
+}
+
+REASON_CODE_BITS = {
+    REASON_CODE_COOLDOWN_ACTIVE: 1 << 0,
+    REASON_CODE_EMA_MOMENTUM_LONG: 1 << 1,
+    REASON_CODE_EMA_MOMENTUM_SHORT: 1 << 2,
+    REASON_CODE_NO_TRADE_SETUP: 1 << 3,
+    REASON_CODE_BELOW_MIN_CONFIDENCE: 1 << 4,
+    REASON_CODE_REGIME_VOLATILITY_SPIKE: 1 << 5,
+    REASON_CODE_REGIME_THIN_LIQUIDITY: 1 << 6,
+}
+
+
+def decode_reason_mask(mask: int) -> list[str]:
+    return [code for code, bit in REASON_CODE_BITS.items() if int(mask) & bit]
+
+
+@dataclass(slots=True)
+class DecisionBatch:
+    action: np.ndarray
+    confidence: np.ndarray
+    sl: np.ndarray
+    tp: np.ndarray
+    reason_mask: np.ndarray
+    max_holding_bars: int
+
+    def __len__(self) -> int:
+        return int(self.action.shape[0])
+
+    def decision_at(self, position: int) -> StrategyDecision:
+        return StrategyDecision(
+            action=ACTION_NAMES[int(self.action[position])],
+            confidence=float(self.confidence[position]),
+            reason_codes=decode_reason_mask(int(self.reason_mask[position])),
+            risk=StrategyRisk(
+                sl=float(self.sl[position]),
+                tp=float(self.tp[position]),
+                max_holding_bars=self.max_holding_bars,
+            ),
+        )
+
+
+def decide_action_batch(
+    *,
+    close: np.ndarray,
+    ema_fast: np.ndarray,
+    ema_slow: np.ndarray,
+    rsi: np.ndarray,
+    atr: np.ndarray,
+    volume: np.ndarray | float = 100.0,
+    volume_ma: np.ndarray | float = 100.0,
+    hooks: DecisionHooks | None = None,
+) -> DecisionBatch:
+    applied_hooks = hooks or DecisionHooks()
+    close, ema_fast, ema_slow, rsi, atr, volume, volume_ma = np.broadcast_arrays(
+        *(
+            np.asarray(values, dtype=np.float64)
+            for values in (close, ema_fast, ema_slow, rsi, atr, volume, volume_ma)
+        )
+    )
+    bars = close.shape[0]
+
+    action = np.zeros(bars, dtype=np.int8)
+    confidence = np.zeros(bars, dtype=np.float64)
+    reason_mask = np.zeros(bars, dtype=np.uint16)
+    risk_atr = np.maximum(atr, 0.0)
+
+    if applied_hooks.cooldown_bars_remaining > 0:
+        reason_mask[:] = REASON_CODE_BITS[REASON_CODE_COOLDOWN_ACTIVE]
+        return DecisionBatch(
+            action=action,
+            confidence=confidence,
+            sl=close - risk_atr,
+            tp=close + risk_atr,
+            reason_mask=reason_mask,
+            max_holding_bars=applied_hooks.max_holding_bars,
+        )
+
+    volatility = np.maximum(np.abs(atr), 1e-9)
+    normalized_gap = (ema_fast - ema_slow) / volatility
+    raw_confidence = np.fmin(1.0, np.abs(normalized_gap))
+
+    long_setup = (normalized_gap > 0.2) & (rsi < 70)
+    short_setup = ~long_setup & (normalized_gap < -0.2) & (rsi > 30)
+    setup = long_setup | short_setup
+    np.copyto(confidence, raw_confidence, where=setup)
+    reason_mask[long_setup] = REASON_CODE_BITS[REASON_CODE_EMA_MOMENTUM_LONG]
+    reason_mask[short_setup] = REASON_CODE_BITS[REASON_CODE_EMA_MOMENTUM_SHORT]
+    reason_mask[~setup] = REASON_CODE_BITS[REASON_CODE_NO_TRADE_SETUP]
+
+    below_min = setup & (confidence < applied_hooks.min_confidence)
+    atr_to_price_ratio = np.abs(atr) / np.maximum(np.abs(close), 1e-9)
+    volume_ratio = volume / np.maximum(volume_ma, 1e-9)
+    volatility_spike = (
+        setup
+        & ~below_min
+        & (atr_to_price_ratio > applied_hooks.regime_max_atr_to_price_ratio)
+    )
+    thin_liquidity = (
+        setup
+        & ~below_min
+        & ~volatility_spike
+        & (volume_ratio < applied_hooks.regime_min_volume_ratio)
+    )
+    reason_mask[below_min] |= REASON_CODE_BITS[REASON_CODE_BELOW_MIN_CONFIDENCE]
+    reason_mask[volatility_spike] |= REASON_CODE_BITS[
+        REASON_CODE_REGIME_VOLATILITY_SPIKE
+    ]
+    reason_mask[thin_liquidity] |= REASON_CODE_BITS[REASON_CODE_REGIME_THIN_LIQUIDITY]
+
+    accepted = setup & ~below_min & ~volatility_spike & ~thin_liquidity
+    action[accepted & long_setup] = ACTION_BUY
+    action[accepted & short_setup] = ACTION_SELL
+
+    sl = close - risk_atr
+    tp = close + risk_atr
+    buy = action == ACTION_BUY
+    sell = action == ACTION_SELL
+    tp[buy] = close[buy] + (risk_atr[buy] * 2.0)
+    sl[sell] = close[sell] + risk_atr[sell]
+    tp[sell] = close[sell] - (risk_atr[sell] * 2.0)
+
+    return DecisionBatch(
+        action=action,
+        confidence=confidence,
+        sl=sl,
+        tp=tp,
+        reason_mask=reason_mask,
+        max_holding_bars=applied_hooks.max_holding_bars,
+    )
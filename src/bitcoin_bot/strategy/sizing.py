@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import math
+
+
+def compute_order_qty(
+    *,
+    available_balance: float,
+    close_price: float,
+    atr_value: float,
+    max_position_size: float,
+    position_risk_fraction: float,
+    min_order_qty: float,
+    qty_step: float,
+) -> tuple[float, dict[str, float]]:
+    close = max(close_price, 1e-9)
+    atr = max(atr_value, 1e-9)
+    risk_budget = available_balance * max(position_risk_fraction, 0.0)
+    qty_by_risk = risk_budget / atr
+
+    max_notional = available_balance * max(max_position_size, 0.0)
+    qty_by_cap = max_notional / close
+
+    raw_qty = min(qty_by_risk, qty_by_cap)
+    safe_step = max(qty_step, 1e-9)
+    rounded_qty = math.floor(raw_qty / safe_step) * safe_step
+    rounded_qty = round(max(rounded_qty, 0.0), 8)
+
+    final_qty = rounded_qty if rounded_qty >= min_order_qty else 0.0
+    sizing = {
+        "available_balance": available_balance,
+        "close": close,
+        "atr": atr,
+        "risk_budget": risk_budget,
+        "qty_by_risk": qty_by_risk,
+        "qty_by_cap": qty_by_cap,
+        "raw_qty": raw_qty,
+        "rounded_qty": rounded_qty,
+        "final_qty": final_qty,
+        "min_order_qty": min_order_qty,
+        "qty_step": safe_step,
+    }
+    return final_qty, sizing
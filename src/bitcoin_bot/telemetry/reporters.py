@@ -72,6 +72,12 @@ def emit_run_progress(
     return progress
 
 
+def emit_pareto_front(*, artifacts_dir: str, pareto_front: dict) -> dict:
+    output_path = f"{artifacts_dir}/pareto_front.json"
+    atomic_dump_json(output_path, pareto_front)
+    return {"path": output_path, "front_size": pareto_front.get("front_size", 0)}
+
+
 def emit_run_complete(
     *,
     mode: str,
@@ -95,11 +101,18 @@ def emit_run_complete(
         opt_trials=opt_trials_executed,
         score=optimization_score,
         salvage=optimization_salvage,
+        robustness=pipeline_result.get("robustness"),
     )
     pipeline_summary = dict(pipeline_result.get("summary", {}))
     pipeline_summary["opt_trials_executed"] = opt_trials_executed
 
-    run_complete = {
+    pareto_front = pipeline_result.get("pareto_front")
+    if pareto_front is not None:
+        optimization["pareto_front"] = emit_pareto_front(
+            artifacts_dir=artifacts_dir, pareto_front=pareto_front
+        )
+
+    run_complete: dict = {
         "schema_version": RUN_COMPLETE_SCHEMA_VERSION,
         "run_id": str(uuid.uuid4()),
         "started_at": started_at.isoformat(),
@@ -116,6 +129,25 @@ def emit_run_complete(
         },
     }
 
+    runs = pipeline_result.get("runs")
+    if runs is not None:
+        run_complete["runs"] = [
+            {
+                "symbol": run["summary"].get("symbol"),
+                "product_type": run["summary"].get("product_type"),
+                "status": run.get("status", "unknown"),
+                "summary": run.get("summary", {}),
+                "optimization": build_optimization_snapshot(
+                    enabled=optimizer_enabled,
+                    opt_trials=int(run.get("opt_trials_executed", 0)),
+                    score=run.get("optimization_score"),
+                    salvage=run.get("optimization_salvage"),
+                    robustness=run.get("robustness"),
+                ),
+            }
+            for run in runs
+        ]
+
     output_path = f"{artifacts_dir}/run_complete.json"
     atomic_dump_json(output_path, run_complete)
 
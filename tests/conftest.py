@@ -1,12 +1,78 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from bitcoin_bot.data.ohlcv import normalize_ohlcv_frame
+
 
 @pytest.fixture
 def artifacts_dir(tmp_path: Path) -> Path:
     path = tmp_path / "artifacts"
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def _wave_columns(
+    rows: int, *, trend: float, amplitude: float, period: float
+) -> dict[str, np.ndarray]:
+    close = np.array(
+        [100.0 + trend * i + amplitude * math.sin(i / period) for i in range(rows)]
+    )
+    return {
+        "open": close - 0.2,
+        "high": close + 0.6,
+        "low": close - 0.6,
+        "close": close,
+        "volume": np.full(rows, 10.0),
+    }
+
+
+def _random_walk_columns(
+    rows: int, *, seed: int, open_noise: float
+) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.6, rows))
+    return {
+        "open": close + rng.normal(0.0, open_noise, rows) if open_noise else close,
+        "high": close + rng.random(rows),
+        "low": close - rng.random(rows),
+        "close": close,
+        "volume": rng.lognormal(5.0, 1.0, rows),
+    }
+
+
+@pytest.fixture(scope="session")
+def ohlcv_frame() -> Callable[..., pd.DataFrame]:
+    def _build(
+        rows: int = 400,
+        *,
+        trend: float = 0.03,
+        amplitude: float = 5.0,
+        period: float = 7.0,
+        seed: int | None = None,
+        open_noise: float = 0.0,
+    ) -> pd.DataFrame:
+        columns = (
+            _wave_columns(rows, trend=trend, amplitude=amplitude, period=period)
+            if seed is None
+            else _random_walk_columns(rows, seed=seed, open_noise=open_noise)
+        )
+        return normalize_ohlcv_frame(
+            {
+                "timestamp": pd.date_range(
+                    "2026-01-01", periods=rows, freq="1min", tz="UTC"
+                ),
+                **columns,
+            },
+            provider="test",
+            symbol="BTC_JPY",
+            timeframe="1m",
+        )
+
+    return _build
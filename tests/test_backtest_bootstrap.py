@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import numpy as np
+
+from bitcoin_bot.backtest.bootstrap import (
+    block_resample_returns,
+    equity_bar_returns,
+    run_bootstrap,
+)
+from bitcoin_bot.main import run
+from bitcoin_bot.optimizer.gates import evaluate_optimization_gates
+
+
+def _returns(seed: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.002, 0.02, size=80), rng.normal(0.0, 0.001, size=2_000)
+
+
+def test_bootstrap_is_seeded_and_independent_of_worker_count():
+    trade_returns, bar_returns = _returns()
+    kwargs = {
+        "trade_returns": trade_returns,
+        "bar_returns": bar_returns,
+        "samples": 400,
+        "block_bars": 50,
+        "seed": 11,
+    }
+
+    serial = run_bootstrap(**kwargs, max_workers=1)
+    parallel = run_bootstrap(**kwargs, max_workers=2)
+    reseeded = run_bootstrap(**{**kwargs, "seed": 12})
+
+    assert serial == parallel
+    assert serial != reseeded
+
+
+def test_bootstrap_percentiles_are_ordered_and_feed_p95_drawdown():
+    trade_returns, bar_returns = _returns()
+
+    result = run_bootstrap(
+        trade_returns=trade_returns,
+        bar_returns=bar_returns,
+        samples=300,
+        block_bars=40,
+    )
+
+    for source in ("trades", "bars"):
+        drawdown = result[source]["max_drawdown"]
+        values = [drawdown[key] for key in ("p5", "p25", "p50", "p75", "p95")]
+        assert values == sorted(values)
+        assert 0.0 <= values[0]
+    assert result["p95_drawdown"] == max(
+        result["trades"]["max_drawdown"]["p95"],
+        result["bars"]["max_drawdown"]["p95"],
+    )
+
+    empty = run_bootstrap(
+        trade_returns=np.empty(0), bar_returns=np.empty(0), samples=10, block_bars=5
+    )
+    assert empty["trades"] is None
+    assert empty["p95_drawdown"] == 0.0
+
+
+def test_block_resample_keeps_contiguous_blocks():
+    returns = np.arange(10, dtype=np.float64)
+
+    paths = block_resample_returns(
+        returns, samples=4, block_bars=5, rng=np.random.default_rng(0)
+    )
+
+    assert paths.shape == (4, 10)
+    steps = np.diff(paths[:, :5], axis=1) % 10
+    assert np.all(steps == 1)
+    assert np.allclose(equity_bar_returns(np.array([100.0, 110.0, 99.0])), [0.1, -0.1])
+
+
+def test_optimization_gates_reject_excess_p95_drawdown():
+    assert evaluate_optimization_gates(0.5, p95_drawdown=0.3, max_p95_drawdown=0.2) == {
+        "accept": False,
+        "reasons": ["p95_drawdown_exceeded"],
+    }
+    assert evaluate_optimization_gates(
+        -0.1, p95_drawdown=0.3, max_p95_drawdown=0.2
+    ) == {
+        "accept": False,
+        "reasons": ["score_below_threshold", "p95_drawdown_exceeded"],
+    }
+    assert evaluate_optimization_gates(0.5, p95_drawdown=0.1, max_p95_drawdown=0.2) == {
+        "accept": True,
+        "reasons": [],
+    }
+
+
+def test_run_complete_gates_on_bootstrap_p95_drawdown(tmp_path, ohlcv_frame):
+    frame = ohlcv_frame(400, amplitude=4.0, period=8)
+    csv_path = tmp_path / "klines.csv"
+    frame.to_csv(csv_path, index=False)
+    artifacts_dir = tmp_path / "artifacts"
+    config_path = tmp_path / "runtime.yaml"
+    config_path.write_text(
+        f"""
+runtime:
+  mode: backtest
+data:
+  csv_path: "{csv_path}"
+backtest:
+  bootstrap_samples: 50
+  bootstrap_block_bars: 30
+optimizer:
+  enabled: true
+  opt_trials: 3
+  trial_store_enabled: false
+risk:
+  max_drawdown: 0.01
+notify:
+  discord:
+    enabled: false
+paths:
+  artifacts_dir: "{artifacts_dir}"
+  logs_dir: "{tmp_path / "logs"}"
+  cache_dir: "{tmp_path / "cache"}"
+""",
+        encoding="utf-8",
+    )
+
+    artifact = run(mode="backtest", config_path=str(config_path))
+
+    robustness = artifact["pipeline"]["summary"]["robustness"]
+    assert robustness["samples"] == 50
+    assert robustness["max_p95_drawdown"] == 0.01
+    assert robustness["p95_drawdown"] > 0.01
+    assert artifact["optimization"]["gates"]["accept"] is False
+    assert "p95_drawdown_exceeded" in artifact["optimization"]["gates"]["reasons"]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.backtest.checkpoint import (
+    backtest_checkpoint_path,
+    checkpoint_settings_hash,
+    load_simulator_state,
+    run_checkpointed_simulation,
+    save_simulator_state,
+)
+from bitcoin_bot.backtest.costs import BpsFillCostModel
+from bitcoin_bot.backtest.simulator import TradeLog, simulate_strategy
+from bitcoin_bot.config.models import BacktestSettings, RiskSettings, StrategySettings
+from bitcoin_bot.indicators.generator import volume_moving_average
+
+
+def _settings(**backtest) -> dict:
+    return {
+        "strategy": StrategySettings(
+            min_confidence=0.2, ema_fast=6, ema_slow=20, regime_min_volume_ratio=0.1
+        ),
+        "risk": RiskSettings(),
+        "backtest": BacktestSettings(**backtest),
+        "cost_model": BpsFillCostModel(
+            fee_bps=5.0, spread_range_fraction=0.1, slippage_bps=5.0
+        ),
+    }
+
+
+def _assert_same_simulation(actual, expected) -> None:
+    assert np.array_equal(actual.equity, expected.equity)
+    assert actual.final_balance == expected.final_balance
+    for item in fields(TradeLog):
+        assert np.array_equal(
+            getattr(actual.trades, item.name), getattr(expected.trades, item.name)
+        ), item.name
+
+
+def test_resumed_simulation_matches_full_rerun_at_every_cut(tmp_path, ohlcv_frame):
+    frame = ohlcv_frame(3000, seed=0, open_noise=0.1)
+    settings = _settings(cooldown_bars=3, max_holding_bars=25)
+    path = tmp_path / "checkpoint.npz"
+    state = None
+
+    for cut in (40, 41, 700, 1234, 1250, 2100, 2999, 3000):
+        simulation, next_state, info = run_checkpointed_simulation(
+            frame.iloc[:cut], state=state, **settings
+        )
+        save_simulator_state(path, next_state)
+        state = load_simulator_state(path)
+
+        _assert_same_simulation(
+            simulation, simulate_strategy(frame.iloc[:cut], **settings)
+        )
+        assert info["mode"] == ("full" if cut == 40 else "resumed")
+    assert len(simulation.trades) > 20
+    assert info["bars_processed"] <= 1 + 25
+
+
+def test_checkpoint_falls_back_to_full_run_when_inputs_change(ohlcv_frame):
+    frame = ohlcv_frame(3000, seed=0, open_noise=0.1)
+    settings = _settings(max_holding_bars=12)
+    _, state, _ = run_checkpointed_simulation(frame.iloc[:2000], **settings)
+
+    changed = _settings(max_holding_bars=13)
+    simulation, _, info = run_checkpointed_simulation(frame, state=state, **changed)
+    assert info == {"mode": "full", "bars_processed": len(frame)}
+    _assert_same_simulation(simulation, simulate_strategy(frame, **changed))
+
+    rewritten = frame.copy()
+    rewritten.loc[rewritten.index[10], "close"] += 1.0
+    _, _, info = run_checkpointed_simulation(rewritten, state=state, **settings)
+    assert info["mode"] == "full"
+
+
+def test_checkpoint_path_is_keyed_by_settings_and_saved_atomically(
+    tmp_path, ohlcv_frame
+):
+    settings = _settings(max_holding_bars=12)
+    paths = [
+        backtest_checkpoint_path(
+            tmp_path,
+            symbol="BTC_JPY",
+            product_type="spot",
+            timeframe="1m",
+            settings_hash=checkpoint_settings_hash(**candidate),
+        )
+        for candidate in (settings, _settings(max_holding_bars=13))
+    ]
+    assert paths[0] != paths[1]
+    assert paths[0].parent == tmp_path / "backtest"
+
+    _, state, _ = run_checkpointed_simulation(ohlcv_frame(200, seed=0), **settings)
+    save_simulator_state(paths[0], state)
+    save_simulator_state(paths[0], state)
+    assert sorted(path.name for path in paths[0].parent.iterdir()) == [paths[0].name]
+
+
+def test_load_simulator_state_ignores_unreadable_files(tmp_path):
+    path = tmp_path / "checkpoint.npz"
+    path.write_bytes(b"not a checkpoint")
+
+    assert load_simulator_state(path) is None
+    assert load_simulator_state(tmp_path / "missing.npz") is None
+
+
+def test_volume_moving_average_depends_only_on_its_window():
+    volume = pd.Series(np.random.default_rng(1).lognormal(3.0, 1.0, 5000))
+
+    full = volume_moving_average(volume).to_numpy()
+    tail = volume_moving_average(volume.iloc[3000:]).to_numpy()
+
+    assert np.isnan(full[:19]).all()
+    assert np.array_equal(full[3019:], tail[19:])
+    assert np.allclose(full, volume.rolling(20).mean().to_numpy(), equal_nan=True)
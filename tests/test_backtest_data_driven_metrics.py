@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import math
 from pathlib import Path
 
+import pytest
+
 from bitcoin_bot.config.models import RuntimeConfig
 from bitcoin_bot.pipeline.backtest_runner import run_backtest
 
@@ -12,12 +15,18 @@ def _write_csv(path: Path, closes: list[float]) -> None:
         open_price = close - 0.5
         high = close + 0.5
         low = close - 1.0
+        hour, minute = divmod(idx, 60)
         lines.append(
-            f"2026-01-01 00:{idx:02d}:00+00:00,{open_price},{high},{low},{close},10"
+            f"2026-01-01 {hour:02d}:{minute:02d}:00+00:00,"
+            f"{open_price},{high},{low},{close},10"
         )
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
+def _trending_closes(drift: float, rows: int = 240) -> list[float]:
+    return [100.0 + drift * idx + 8.0 * math.sin(idx / 10) for idx in range(rows)]
+
+
 def _base_config(csv_path: Path) -> RuntimeConfig:
     config = RuntimeConfig()
     config.runtime.mode = "backtest"
@@ -29,8 +38,8 @@ def test_backtest_metrics_change_with_ohlcv_input(tmp_path):
     rising_csv = tmp_path / "rising.csv"
     falling_csv = tmp_path / "falling.csv"
 
-    _write_csv(rising_csv, [100, 101, 102, 103, 104])
-    _write_csv(falling_csv, [100, 99, 98, 97, 96])
+    _write_csv(rising_csv, _trending_closes(0.2))
+    _write_csv(falling_csv, _trending_closes(-0.2))
 
     rising = run_backtest(_base_config(rising_csv))["summary"]
     falling = run_backtest(_base_config(falling_csv))["summary"]
@@ -38,7 +47,23 @@ def test_backtest_metrics_change_with_ohlcv_input(tmp_path):
     assert rising["data_source"] == "csv"
     assert falling["data_source"] == "csv"
     assert rising["return"] > falling["return"]
-    assert rising["trade_count"] == falling["trade_count"] == 4.0
+    assert rising["trade_count"] > 0.0
+    assert falling["trade_count"] > 0.0
+    assert rising["trade_count"] != falling["trade_count"]
+    assert rising["final_balance"] == pytest.approx(
+        rising["initial_balance"] * (1.0 + rising["return"])
+    )
+
+
+def test_backtest_without_signals_reports_no_trades(tmp_path):
+    flat_csv = tmp_path / "flat.csv"
+    _write_csv(flat_csv, [100.0] * 120)
+
+    summary = run_backtest(_base_config(flat_csv))["summary"]
+
+    assert summary["trade_count"] == 0.0
+    assert summary["return"] == 0.0
+    assert summary["final_balance"] == summary["initial_balance"]
 
 
 def test_backtest_uses_explicit_fallback_on_invalid_data(tmp_path):
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bitcoin_bot.backtest import metrics as metrics_module
+from bitcoin_bot.backtest.metrics import MetricsAccumulator
+from bitcoin_bot.backtest.simulator import simulate_strategy, simulation_metrics
+from bitcoin_bot.config.models import BacktestSettings, RiskSettings, StrategySettings
+
+
+def _reference_metrics(result) -> dict[str, float]:
+    trades = result.trades
+    equity = result.equity
+    drawdown = 1.0 - (equity / np.maximum.accumulate(equity))
+    gross_profit = float(trades.trade_return[trades.trade_return > 0.0].sum())
+    gross_loss = abs(float(trades.trade_return[trades.trade_return < 0.0].sum()))
+    return {
+        "return": (result.final_balance / result.initial_balance) - 1.0,
+        "max_drawdown": float(drawdown.max()),
+        "win_rate": float((trades.pnl > 0.0).mean()),
+        "profit_factor": gross_profit / gross_loss,
+        "trade_count": float(len(trades)),
+        "fees_paid": float(trades.fees.sum()),
+        "slippage_cost": float(trades.slippage.sum()),
+    }
+
+
+@pytest.fixture(scope="module")
+def simulation(ohlcv_frame):
+    return simulate_strategy(
+        ohlcv_frame(5000, seed=3),
+        strategy=StrategySettings(min_confidence=0.2, ema_fast=6, ema_slow=20),
+        risk=RiskSettings(),
+        backtest=BacktestSettings(max_holding_bars=20),
+    )
+
+
+def test_simulation_metrics_match_full_array_reference(simulation):
+    assert len(simulation.trades) > 50
+    assert simulation_metrics(simulation) == _reference_metrics(simulation)
+
+
+def test_streamed_updates_match_single_pass(simulation, monkeypatch):
+    monkeypatch.setattr(metrics_module, "METRICS_CHUNK_BARS", 7)
+    expected = simulation_metrics(simulation)
+    trades = simulation.trades
+
+    accumulator = MetricsAccumulator(initial_balance=simulation.initial_balance)
+    for position in range(len(trades)):
+        accumulator.add_trade(
+            pnl=float(trades.pnl[position]),
+            trade_return=float(trades.trade_return[position]),
+            fee=float(trades.fees[position]),
+            slippage=float(trades.slippage[position]),
+        )
+    for start in range(0, simulation.equity.shape[0], 997):
+        accumulator.update_equity(simulation.equity[start : start + 997])
+    actual = accumulator.to_metrics()
+
+    assert accumulator.balance == simulation.final_balance
+    assert actual["max_drawdown"] == expected["max_drawdown"]
+    assert actual["trade_count"] == expected["trade_count"]
+    assert actual["win_rate"] == expected["win_rate"]
+    assert actual == pytest.approx(expected, rel=1e-12)
+
+
+def test_accumulator_without_trades_reports_zeros():
+    accumulator = MetricsAccumulator(initial_balance=100.0)
+    accumulator.update_equity(np.array([100.0, 90.0, 95.0]))
+
+    assert accumulator.max_drawdown == pytest.approx(0.1)
+    assert accumulator.to_metrics()["max_drawdown"] == 0.0
+    assert MetricsAccumulator(initial_balance=1.0).max_drawdown == 0.0
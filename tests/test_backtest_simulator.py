@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bitcoin_bot.backtest.costs import (
+    DEFAULT_FEE_BPS,
+    BpsFillCostModel,
+    fill_cost_model_from_settings,
+)
+from bitcoin_bot.backtest.simulator import (
+    EXIT_REASON_MAX_HOLDING,
+    EXIT_REASON_STOP_LOSS,
+    EXIT_REASON_TAKE_PROFIT,
+    MarketArrays,
+    simulate_trades,
+    simulation_metrics,
+)
+from bitcoin_bot.config.models import BacktestSettings, ExchangeSettings, RiskSettings
+from bitcoin_bot.strategy.batch import DecisionBatch
+from bitcoin_bot.strategy.sizing import compute_order_qty
+
+
+def _market(close: list[float]) -> MarketArrays:
+    values = np.asarray(close, dtype=np.float64)
+    return MarketArrays(
+        open=values.copy(),
+        high=values + 0.5,
+        low=values - 0.5,
+        close=values,
+        atr=np.full(values.shape, 2.0),
+    )
+
+
+def _decisions(market: MarketArrays, actions: dict[int, int]) -> DecisionBatch:
+    bars = market.close.shape[0]
+    action = np.zeros(bars, dtype=np.int8)
+    for index, code in actions.items():
+        action[index] = code
+    direction = action.astype(np.float64)
+    return DecisionBatch(
+        action=action,
+        confidence=np.where(action != 0, 1.0, 0.0),
+        sl=market.close - (direction * market.atr),
+        tp=market.close + (direction * market.atr * 2.0),
+        reason_mask=np.zeros(bars, dtype=np.uint16),
+        max_holding_bars=3,
+    )
+
+
+def test_simulator_exits_on_take_profit_stop_loss_and_max_holding():
+    close = [100.0, 101.0, 104.5, 104.0, 105.6, 100.0, 100.0, 100.2, 100.1, 99.9, 100.0]
+    market = _market(close)
+    decisions = _decisions(market, {0: 1, 3: -1, 6: 1})
+    backtest = BacktestSettings(initial_balance=1_000_000.0, max_holding_bars=3)
+
+    result = simulate_trades(market, decisions, risk=RiskSettings(), backtest=backtest)
+
+    trades = result.trades
+    assert trades.entry_index.tolist() == [0, 3, 6]
+    assert trades.exit_index.tolist() == [2, 4, 9]
+    assert trades.exit_reason.tolist() == [
+        EXIT_REASON_TAKE_PROFIT,
+        EXIT_REASON_STOP_LOSS,
+        EXIT_REASON_MAX_HOLDING,
+    ]
+    assert trades.exit_price.tolist() == [104.0, 106.0, 99.9]
+
+    expected_qty, _ = compute_order_qty(
+        available_balance=1_000_000.0,
+        close_price=100.0,
+        atr_value=2.0,
+        max_position_size=RiskSettings().max_position_size,
+        position_risk_fraction=RiskSettings().position_risk_fraction,
+        min_order_qty=RiskSettings().min_order_qty,
+        qty_step=RiskSettings().qty_step,
+    )
+    assert trades.qty[0] == expected_qty
+    assert result.final_balance == pytest.approx(
+        result.initial_balance + float(trades.pnl.sum())
+    )
+    assert result.equity[-1] == pytest.approx(result.final_balance)
+
+    metrics = simulation_metrics(result)
+    assert metrics["trade_count"] == 3.0
+    assert metrics["win_rate"] == pytest.approx(1 / 3)
+
+
+def test_simulator_exit_plan_is_independent_of_the_chunk_budget(monkeypatch):
+    close = [100.0, 101.0, 104.5, 104.0, 105.6, 100.0, 100.0, 100.2, 100.1, 99.9, 100.0]
+    market = _market(close)
+    decisions = _decisions(market, {0: 1, 3: -1, 6: 1})
+    backtest = BacktestSettings(initial_balance=1_000_000.0, max_holding_bars=3)
+    expected = simulate_trades(
+        market, decisions, risk=RiskSettings(), backtest=backtest
+    ).trades
+
+    monkeypatch.setattr("bitcoin_bot.backtest.simulator._EXIT_PLAN_ELEMENT_BUDGET", 4)
+    trades = simulate_trades(
+        market, decisions, risk=RiskSettings(), backtest=backtest
+    ).trades
+
+    assert trades.exit_index.tolist() == expected.exit_index.tolist()
+    assert trades.exit_price.tolist() == expected.exit_price.tolist()
+    assert trades.exit_reason.tolist() == expected.exit_reason.tolist()
+
+
+def test_simulator_skips_signals_during_position_and_cooldown():
+    market = _market([100.0] * 12)
+    decisions = _decisions(market, {0: 1, 1: 1, 4: 1, 5: -1, 8: 1})
+    backtest = BacktestSettings(max_holding_bars=3, cooldown_bars=2)
+
+    result = simulate_trades(market, decisions, risk=RiskSettings(), backtest=backtest)
+
+    assert result.trades.entry_index.tolist() == [0, 8]
+    assert result.trades.exit_index.tolist() == [3, 11]
+    assert simulation_metrics(result)["return"] == 0.0
+
+
+def test_fill_costs_reduce_pnl_by_fee_spread_and_slippage():
+    market = _market([100.0, 100.0, 100.0, 100.0, 100.0])
+    market.volume = np.full(5, 10.0)
+    decisions = _decisions(market, {0: 1})
+    backtest = BacktestSettings(max_holding_bars=2)
+    model = BpsFillCostModel(fee_bps=10.0, spread_range_fraction=0.5, slippage_bps=20.0)
+
+    frictionless = simulate_trades(
+        market, decisions, risk=RiskSettings(), backtest=backtest
+    )
+    result = simulate_trades(
+        market, decisions, risk=RiskSettings(), backtest=backtest, cost_model=model
+    )
+
+    qty = float(result.trades.qty[0])
+    impact = (0.5 * 0.5 * 1.0 / 100.0) + (0.002 * qty / 10.0)
+    entry_fill = 100.0 * (1.0 + impact)
+    exit_fill = 100.0 * (1.0 - impact)
+    fee = 0.001 * qty * (entry_fill + exit_fill)
+    assert frictionless.trades.pnl.tolist() == [0.0]
+    assert result.trades.entry_price[0] == pytest.approx(entry_fill)
+    assert result.trades.exit_price[0] == pytest.approx(exit_fill)
+    assert result.trades.fees[0] == pytest.approx(fee)
+    assert result.trades.pnl[0] == pytest.approx((exit_fill - entry_fill) * qty - fee)
+
+    metrics = simulation_metrics(result)
+    assert metrics["fees_paid"] == pytest.approx(fee)
+    assert metrics["slippage_cost"] == pytest.approx((entry_fill - exit_fill) * qty)
+    assert metrics["return"] < 0.0
+
+
+def test_fill_cost_model_defaults_fee_by_product_type():
+    backtest = BacktestSettings()
+    spot = fill_cost_model_from_settings(
+        ExchangeSettings(product_type="spot"), backtest
+    )
+    leverage = fill_cost_model_from_settings(
+        ExchangeSettings(product_type="leverage"), backtest
+    )
+    override = fill_cost_model_from_settings(
+        ExchangeSettings(product_type="leverage"), BacktestSettings(fee_bps=1.5)
+    )
+
+    assert spot.fee_bps == DEFAULT_FEE_BPS["spot"]
+    assert leverage.fee_bps == DEFAULT_FEE_BPS["leverage"]
+    assert override.fee_bps == 1.5
+    assert spot.describe()["spread_range_fraction"] == backtest.spread_range_fraction
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import numpy as np
+
+from bitcoin_bot.backtest.walk_forward import run_walk_forward, walk_forward_folds
+from bitcoin_bot.config.models import (
+    BacktestSettings,
+    RiskSettings,
+    RuntimeConfig,
+    StrategySettings,
+)
+from bitcoin_bot.optimizer.search import (
+    SearchContext,
+    SearchResult,
+    evaluate_params,
+    sample_trial_params,
+)
+from bitcoin_bot.pipeline.backtest_runner import run_backtest
+
+
+def test_walk_forward_folds_roll_by_test_window():
+    folds = walk_forward_folds(100, train_bars=40, test_bars=20)
+
+    assert [(f.train_start, f.train_end, f.test_end) for f in folds] == [
+        (0, 40, 60),
+        (20, 60, 80),
+        (40, 80, 100),
+    ]
+    latest = walk_forward_folds(100, train_bars=40, test_bars=20, max_folds=2)
+    assert [(f.index, f.train_start) for f in latest] == [(0, 20), (1, 40)]
+    assert walk_forward_folds(50, train_bars=40, test_bars=20) == []
+
+
+def test_walk_forward_parallel_folds_match_sequential(ohlcv_frame):
+    context = SearchContext(
+        strategy=StrategySettings(),
+        risk=RiskSettings(),
+        backtest=BacktestSettings(
+            walk_forward_train_bars=200, walk_forward_test_bars=100
+        ),
+    )
+
+    frame = ohlcv_frame(600, trend=0.05, amplitude=6.0, period=9)
+    sequential = run_walk_forward(frame, context, max_workers=1)
+    parallel = run_walk_forward(frame, context, max_workers=2)
+
+    assert parallel == sequential
+    assert sequential["aggregate"]["fold_count"] == 4
+    fold = sequential["folds"][0]
+    assert fold["test"] == {
+        "start": 200,
+        "end": 300,
+        "start_at": "2026-01-01T03:20:00+00:00",
+    }
+    assert fold["candidates"] > 1
+    assert sequential["aggregate"]["oos_score"] == round(
+        float(np.mean([item["test_score"] for item in sequential["folds"]])), 6
+    )
+
+
+def test_backtest_walk_forward_mode_scores_out_of_sample(tmp_path, ohlcv_frame):
+    frame = ohlcv_frame(600, trend=0.05, amplitude=6.0, period=9)
+    csv_path = tmp_path / "klines.csv"
+    frame.to_csv(csv_path, index=False)
+    config = RuntimeConfig()
+    config.runtime.mode = "backtest"
+    config.data.csv_path = str(csv_path)
+    config.backtest.walk_forward_enabled = True
+    config.backtest.walk_forward_train_bars = 200
+    config.backtest.walk_forward_test_bars = 200
+    config.optimizer.enabled = False
+
+    result = run_backtest(config)
+
+    walk_forward = result["summary"]["walk_forward"]
+    assert len(walk_forward["folds"]) == 2
+    assert result["optimization_score"] == walk_forward["aggregate"]["oos_score"]
+
+
+def test_backtest_walk_forward_never_reuses_full_frame_search(
+    tmp_path, monkeypatch, ohlcv_frame
+):
+    frame = ohlcv_frame(600, trend=0.05, amplitude=6.0, period=9)
+    frame.loc[frame.index[400:], ["open", "high", "low", "close"]] += (
+        -3.0 * np.arange(200)
+    )[:, None]
+    csv_path = tmp_path / "klines.csv"
+    frame.to_csv(csv_path, index=False)
+    config = RuntimeConfig()
+    config.runtime.mode = "backtest"
+    config.data.csv_path = str(csv_path)
+    config.paths.cache_dir = str(tmp_path / "cache")
+    config.backtest.walk_forward_enabled = True
+    config.backtest.walk_forward_train_bars = 200
+    config.backtest.walk_forward_test_bars = 200
+    config.optimizer.enabled = True
+    config.optimizer.opt_trials = 6
+    config.optimizer.trial_store_enabled = False
+
+    context = SearchContext(
+        strategy=config.strategy, risk=config.risk, backtest=config.backtest
+    )
+    oracle = max(
+        sample_trial_params(context, trials=40, seed=99),
+        key=lambda params: evaluate_params(frame, params, context, entry_start=400)[
+            "score"
+        ],
+    )
+    leaked = {"params": oracle, "score": 99.0, "metrics": {}, "gates": {}}
+    monkeypatch.setattr(
+        "bitcoin_bot.pipeline.backtest_runner._run_optimizer",
+        lambda *args, **kwargs: SearchResult(trials=[leaked], best=leaked),
+    )
+
+    walk_forward = run_backtest(config)["summary"]["walk_forward"]
+
+    assert [fold["candidates"] for fold in walk_forward["folds"]] == [6, 6]
+    assert all(fold["params"] != oracle for fold in walk_forward["folds"])
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import pytest
 
+from bitcoin_bot.exchange.async_adapter import AsyncGMOAdapter
 from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
 
 
+@pytest.mark.parametrize("variant", ["sync", "async"])
 @pytest.mark.parametrize(
     ("source_code", "expected_category", "expected_retryable"),
     [
@@ -16,11 +18,15 @@ from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
     ],
 )
 def test_gmo_error_normalization_categories(
+    variant: str,
     source_code: str,
     expected_category: str,
     expected_retryable: bool,
 ):
-    adapter = GMOAdapter(product_type="spot")
+    sync_adapter = GMOAdapter(product_type="spot")
+    adapter: GMOAdapter | AsyncGMOAdapter = (
+        sync_adapter if variant == "sync" else AsyncGMOAdapter(sync_adapter)
+    )
     normalized = adapter.normalize_error(source_code=source_code, message="failed")
 
     assert normalized.category == expected_category
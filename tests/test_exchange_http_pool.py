@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.client import RemoteDisconnected
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bitcoin_bot.config.models import RuntimeConfig
+from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
+from bitcoin_bot.exchange.http_pool import HttpConnectionPool
+from bitcoin_bot.exchange.protocol import NormalizedError, NormalizedTicker
+from bitcoin_bot.pipeline.live_runner import run_live
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.client_ports.append(self.client_address[1])  # type: ignore[attr-defined]
+        if self.path.startswith("/limited"):
+            self._send(429, {"status": 5})
+            return
+        self._send(
+            200,
+            {
+                "data": [
+                    {
+                        "symbol": "BTC_JPY",
+                        "bid": "100.1",
+                        "ask": "100.2",
+                        "last": "100.15",
+                    }
+                ]
+            },
+            close="close=1" in self.path,
+        )
+
+    def _send(self, status: int, payload: dict, *, close: bool = False) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if close:
+            self.send_header("Connection", "close")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        return
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    httpd.client_ports = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _base_url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_pool_reuses_one_connection_for_sequential_requests(server):
+    with HttpConnectionPool() as pool:
+        responses = [
+            pool.request("GET", f"{_base_url(server)}/public/v1/ticker?symbol=BTC_JPY")
+            for _ in range(3)
+        ]
+
+        assert [response.status for response in responses] == [200, 200, 200]
+        assert pool.stats.to_dict() == {
+            "created": 1,
+            "reused": 2,
+            "discarded": 0,
+            "reconnects": 0,
+        }
+        assert len(set(server.client_ports)) == 1
+        assert pool.idle_count() == 1
+    assert pool.idle_count() == 0
+
+
+def test_pool_replaces_connections_the_server_closed(server):
+    pool = HttpConnectionPool()
+    pool.request("GET", f"{_base_url(server)}/public/v1/ticker?symbol=BTC_JPY")
+    for pooled in pool._idle.values():
+        pooled[0].connection.sock.shutdown(2)
+
+    response = pool.request("GET", f"{_base_url(server)}/public/v1/ticker?close=1")
+    assert response.status == 200
+    assert pool.idle_count() == 0
+
+    pool.request("GET", f"{_base_url(server)}/public/v1/ticker?symbol=BTC_JPY")
+    assert pool.stats.created == 3
+    assert pool.stats.discarded == 1
+    pool.close()
+
+
+def test_adapter_uses_pool_for_public_requests_and_normalizes_http_errors(server):
+    with HttpConnectionPool() as pool:
+        adapter = GMOAdapter(
+            product_type="spot",
+            api_base_url=_base_url(server),
+            use_http=True,
+            connection_pool=pool,
+        )
+
+        first = adapter.fetch_ticker("BTC_JPY")
+        second = adapter.fetch_ticker("BTC_JPY")
+        limited = adapter._request_json(method="GET", path="/limited")
+
+        assert isinstance(first, NormalizedTicker)
+        assert isinstance(second, NormalizedTicker)
+        assert second.last == 100.15
+        assert isinstance(limited, NormalizedError)
+        assert limited.category == "rate_limit"
+        assert "HTTP Error 429" in limited.message
+        assert pool.stats.created == 1
+
+
+class _StaleConnection:
+    def __init__(self, *, fail: bool) -> None:
+        self.fail = fail
+        self.sock = None
+        self.timeout = None
+        self.requests: list[str] = []
+
+    def request(self, method, target, body=None, headers=None) -> None:
+        self.requests.append(method)
+
+    def getresponse(self):
+        if self.fail:
+            raise RemoteDisconnected("closed")
+        return _FakeResponse()
+
+    def close(self) -> None:
+        return
+
+
+class _FakeResponse:
+    status = 200
+    reason = "OK"
+    will_close = False
+
+    def read(self) -> bytes:
+        return b"{}"
+
+
+def test_stale_reused_connection_retries_idempotent_requests_only(monkeypatch):
+    created: list[_StaleConnection] = []
+
+    def factory(scheme, host, port, timeout):
+        created.append(_StaleConnection(fail=False))
+        return created[-1]
+
+    monkeypatch.setattr("bitcoin_bot.exchange.http_pool._is_dropped", lambda _: False)
+    pool = HttpConnectionPool(connection_factory=factory)
+    pool.request("GET", "https://api.example/public/v1/status")
+
+    created[-1].fail = True
+    response = pool.request("GET", "https://api.example/public/v1/status")
+    assert response.status == 200
+    assert pool.stats.reconnects == 1
+    assert len(created) == 2
+
+    created[-1].fail = True
+    with pytest.raises(RemoteDisconnected):
+        pool.request("POST", "https://api.example/private/v1/order", body=b"{}")
+    assert len(created) == 2
+    assert created[-1].requests == ["GET", "POST"]
+
+
+def test_run_live_closes_its_connection_pool(tmp_path, monkeypatch):
+    pools: list[HttpConnectionPool] = []
+
+    class _TrackedPool(HttpConnectionPool):
+        def __init__(self) -> None:
+            super().__init__()
+            self.closed = False
+            pools.append(self)
+
+        def close(self) -> None:
+            self.closed = True
+            super().close()
+
+    def _fail_run(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(
+        "bitcoin_bot.pipeline.live_runner.HttpConnectionPool", _TrackedPool
+    )
+    monkeypatch.setattr("bitcoin_bot.pipeline.live_runner._run_live", _fail_run)
+    config = RuntimeConfig()
+    config.runtime.mode = "live"
+    config.runtime.execute_orders = True
+    config.runtime.live_http_enabled = True
+    config.paths.artifacts_dir = str(tmp_path / "artifacts")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_live(config)
+
+    assert len(pools) == 1
+    assert pools[0].closed
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import threading
 from datetime import UTC, datetime
 
 import pytest
 
+from bitcoin_bot.exchange.async_adapter import AsyncGMOAdapter
 from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
 from bitcoin_bot.exchange.protocol import (
+    AsyncExchangeProtocol,
     ExchangeProtocol,
     NormalizedAccountEvent,
     NormalizedBalance,
@@ -16,22 +21,86 @@ from bitcoin_bot.exchange.protocol import (
     NormalizedTicker,
 )
 
+ADAPTER_VARIANTS = ["sync", "async"]
+
+
+def _make_adapter(variant: str, **kwargs):
+    adapter = GMOAdapter(**kwargs)
+    return adapter if variant == "sync" else AsyncGMOAdapter(adapter)
+
+
+def _sync_adapter(adapter) -> GMOAdapter:
+    return adapter.adapter if isinstance(adapter, AsyncGMOAdapter) else adapter
+
+
+def _call(adapter, name: str, **kwargs):
+    result = getattr(adapter, name)(**kwargs)
+    if not inspect.isawaitable(result):
+        return result
+
+    async def _await():
+        return await result
+
+    return asyncio.run(_await())
+
+
+def _collect(adapter, name: str) -> list:
+    events = getattr(adapter, name)()
+    if not hasattr(events, "__aiter__"):
+        return list(events)
+
+    async def _drain() -> list:
+        return [event async for event in events]
+
+    return asyncio.run(_drain())
+
 
 def test_gmo_adapter_satisfies_exchange_protocol():
     adapter = GMOAdapter(product_type="spot")
     assert isinstance(adapter, ExchangeProtocol)
 
 
+def test_async_gmo_adapter_satisfies_async_exchange_protocol():
+    adapter = AsyncGMOAdapter(GMOAdapter(product_type="spot"))
+    assert isinstance(adapter, AsyncExchangeProtocol)
+    assert adapter.product_type == "spot"
+
+
+def test_async_gmo_adapter_overlaps_blocking_calls(monkeypatch: pytest.MonkeyPatch):
+    adapter = AsyncGMOAdapter(GMOAdapter(product_type="spot"))
+    barrier = threading.Barrier(3, timeout=2.0)
+
+    def _blocking(name):
+        def _call_blocking(*args, **kwargs):
+            barrier.wait()
+            return name
+
+        return _call_blocking
+
+    for name in ("fetch_balances", "fetch_ticker", "fetch_order"):
+        monkeypatch.setattr(adapter.adapter, name, _blocking(name))
+
+    async def _gather():
+        return await asyncio.gather(
+            adapter.fetch_balances("main"),
+            adapter.fetch_ticker("BTC_JPY"),
+            adapter.fetch_order("oid-1"),
+        )
+
+    assert asyncio.run(_gather()) == ["fetch_balances", "fetch_ticker", "fetch_order"]
+
+
+@pytest.mark.parametrize("variant", ADAPTER_VARIANTS)
 @pytest.mark.parametrize(
     ("product_type", "expected_reduce_only"),
     [("spot", None), ("leverage", True)],
 )
 def test_gmo_adapter_spot_leverage_switching(
-    product_type: str, expected_reduce_only: bool | None
+    variant: str, product_type: str, expected_reduce_only: bool | None
 ):
-    adapter = GMOAdapter(product_type=product_type)  # type: ignore[arg-type]
+    adapter = _make_adapter(variant, product_type=product_type)
 
-    balances = adapter.fetch_balances(account_type="main")
+    balances = _call(adapter, "fetch_balances", account_type="main")
     assert not isinstance(balances, NormalizedError)
     assert balances
     assert isinstance(balances[0], NormalizedBalance)
@@ -49,28 +118,31 @@ def test_gmo_adapter_spot_leverage_switching(
         reduce_only=True,
         client_order_id="cid-1",
     )
-    placed = adapter.place_order(order_request)
+    placed = _call(adapter, "place_order", order_request=order_request)
     assert isinstance(placed, NormalizedOrderState)
     assert placed.product_type == product_type
     assert placed.reduce_only == expected_reduce_only
 
 
-def test_gmo_adapter_mandatory_methods_return_normalized_models():
-    adapter = GMOAdapter(product_type="leverage")
+@pytest.mark.parametrize("variant", ADAPTER_VARIANTS)
+def test_gmo_adapter_mandatory_methods_return_normalized_models(variant: str):
+    adapter = _make_adapter(variant, product_type="leverage")
 
-    klines = adapter.fetch_klines(
+    klines = _call(
+        adapter,
+        "fetch_klines",
         symbol="BTC_JPY",
         timeframe="1m",
         start=datetime.now(UTC),
         end=datetime.now(UTC),
         limit=10,
     )
-    ticker = adapter.fetch_ticker(symbol="BTC_JPY")
-    positions = adapter.fetch_positions(symbol="BTC_JPY")
-    cancelled = adapter.cancel_order(order_id="oid-1")
-    fetched = adapter.fetch_order(order_id="oid-1")
-    order_events = list(adapter.stream_order_events())
-    account_events = list(adapter.stream_account_events())
+    ticker = _call(adapter, "fetch_ticker", symbol="BTC_JPY")
+    positions = _call(adapter, "fetch_positions", symbol="BTC_JPY")
+    cancelled = _call(adapter, "cancel_order", order_id="oid-1")
+    fetched = _call(adapter, "fetch_order", order_id="oid-1")
+    order_events = _collect(adapter, "stream_order_events")
+    account_events = _collect(adapter, "stream_account_events")
 
     assert isinstance(klines, list)
     assert isinstance(ticker, NormalizedTicker)
@@ -82,12 +154,14 @@ def test_gmo_adapter_mandatory_methods_return_normalized_models():
     assert all(isinstance(event, NormalizedAccountEvent) for event in account_events)
 
 
+@pytest.mark.parametrize("variant", ADAPTER_VARIANTS)
 @pytest.mark.parametrize("product_type", ["spot", "leverage"])
 def test_fetch_balances_uses_assets_endpoint(
+    variant: str,
     product_type: str,
     monkeypatch: pytest.MonkeyPatch,
 ):
-    adapter = GMOAdapter(product_type=product_type, use_http=True)  # type: ignore[arg-type]
+    adapter = _make_adapter(variant, product_type=product_type, use_http=True)
     captured: dict[str, object] = {}
 
     def _mock_request_json(*, method, path, params=None, auth=False):
@@ -101,21 +175,23 @@ def test_fetch_balances_uses_assets_endpoint(
         )
         return {"data": []}
 
-    monkeypatch.setattr(adapter, "_request_json", _mock_request_json)
+    monkeypatch.setattr(_sync_adapter(adapter), "_request_json", _mock_request_json)
 
-    balances = adapter.fetch_balances(account_type="main")
+    balances = _call(adapter, "fetch_balances", account_type="main")
     assert not isinstance(balances, NormalizedError)
     assert captured["method"] == "GET"
     assert captured["path"] == "/private/v1/account/assets"
     assert captured["auth"] is True
 
 
+@pytest.mark.parametrize("variant", ADAPTER_VARIANTS)
 @pytest.mark.parametrize("product_type", ["spot", "leverage"])
 def test_fetch_positions_uses_open_positions_endpoint(
+    variant: str,
     product_type: str,
     monkeypatch: pytest.MonkeyPatch,
 ):
-    adapter = GMOAdapter(product_type=product_type, use_http=True)  # type: ignore[arg-type]
+    adapter = _make_adapter(variant, product_type=product_type, use_http=True)
     captured: dict[str, object] = {}
 
     def _mock_request_json(*, method, path, params=None, auth=False):
@@ -129,9 +205,9 @@ def test_fetch_positions_uses_open_positions_endpoint(
         )
         return {"data": []}
 
-    monkeypatch.setattr(adapter, "_request_json", _mock_request_json)
+    monkeypatch.setattr(_sync_adapter(adapter), "_request_json", _mock_request_json)
 
-    positions = adapter.fetch_positions(symbol="BTC_JPY")
+    positions = _call(adapter, "fetch_positions", symbol="BTC_JPY")
     assert isinstance(positions, list)
     assert captured["method"] == "GET"
     assert captured["path"] == "/private/v1/openPositions"
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+
+from bitcoin_bot.config.models import RuntimeConfig
+from bitcoin_bot.config.validator import validate_config
+from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
+from bitcoin_bot.exchange.rate_limit import GMORateLimiter, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _bucket(clock: _FakeClock, *, rate: float = 2.0, capacity: float = 2.0):
+    return TokenBucket(
+        rate_per_second=rate, capacity=capacity, clock=clock, sleeper=clock.sleep
+    )
+
+
+def test_token_bucket_spends_burst_then_paces_to_rate():
+    clock = _FakeClock()
+    bucket = _bucket(clock)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.would_wait_ms() == pytest.approx(500.0)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    clock.now += 10.0
+    assert bucket.would_wait_ms() == 0.0
+    assert bucket.tokens == pytest.approx(2.0)
+
+
+def test_token_bucket_query_and_try_acquire_do_not_block():
+    clock = _FakeClock()
+    bucket = _bucket(clock, capacity=1.0)
+
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.would_wait_ms() == pytest.approx(500.0)
+    clock.now += 0.2
+    assert bucket.would_wait_ms() == pytest.approx(300.0)
+    assert clock.sleeps == []
+
+
+def test_token_bucket_rejects_invalid_settings():
+    with pytest.raises(ValueError, match="rate_per_second"):
+        TokenBucket(rate_per_second=0.0, capacity=1.0)
+    with pytest.raises(ValueError, match="capacity"):
+        TokenBucket(rate_per_second=1.0, capacity=0.5)
+
+
+class _FakeResponse:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+    def read(self) -> bytes:
+        return b'{"data": []}'
+
+
+def test_adapter_requests_draw_from_public_and_private_buckets(monkeypatch):
+    clock = _FakeClock()
+    limiter = GMORateLimiter(public=_bucket(clock), private=_bucket(clock))
+    adapter = GMOAdapter(product_type="spot", use_http=True, rate_limiter=limiter)
+    monkeypatch.setenv("GMO_API_KEY", "key")
+    monkeypatch.setenv("GMO_API_SECRET", "secret")
+    monkeypatch.setattr(
+        "bitcoin_bot.exchange.gmo_adapter.urlopen",
+        lambda request, timeout: _FakeResponse(),
+    )
+
+    adapter.fetch_ticker("BTC_JPY")
+    adapter.fetch_ticker("BTC_JPY")
+    assert adapter.rate_limit_wait_ms(private=False) == pytest.approx(500.0)
+    assert adapter.rate_limit_wait_ms(private=True) == 0.0
+
+    adapter.fetch_balances(account_type="main")
+    assert limiter.private.tokens == pytest.approx(1.0)
+    assert clock.sleeps == []
+
+    adapter.fetch_ticker("BTC_JPY")
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_adapter_without_limiter_never_waits():
+    adapter = GMOAdapter(product_type="spot")
+    assert adapter.rate_limit_wait_ms(private=True) == 0.0
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [
+        ("public_rate_limit_per_second", 0.0),
+        ("private_rate_limit_per_second", -1.0),
+        ("rate_limit_burst", 0),
+    ],
+)
+def test_invalid_rate_limit_settings_raise(key: str, value: float):
+    config = RuntimeConfig()
+    setattr(config.exchange, key, value)
+    with pytest.raises(ValueError, match=f"exchange.{key}"):
+        validate_config(config)
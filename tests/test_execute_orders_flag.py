@@ -37,7 +37,7 @@ def test_execute_orders_true_keeps_existing_flow(tmp_path):
 def test_loader_and_validator_accept_execute_orders_bool(tmp_path):
     config_path = tmp_path / "runtime.yaml"
     config_path.write_text(
-        """
+        f"""
 runtime:
   mode: live
   execute_orders: true
@@ -46,7 +46,7 @@ exchange:
 paths:
   artifacts_dir: "./var/artifacts"
   logs_dir: "./var/logs"
-  cache_dir: "./var/cache"
+  cache_dir: "{tmp_path / "cache"}"
 """,
         encoding="utf-8",
     )
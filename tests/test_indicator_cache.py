@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitcoin_bot.indicators.cache import IndicatorCache, ohlcv_content_hash
+from bitcoin_bot.indicators.generator import (
+    generate_indicator_grid,
+    generate_indicators,
+)
+
+
+def _frame(rows: int = 120, offset: float = 0.0) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 100.0 + offset + np.cumsum(rng.normal(0.0, 1.0, rows))
+    index = pd.date_range("2026-01-01", periods=rows, freq="min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "timestamp": index,
+            "open": close,
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": 1.0,
+        },
+        index=index,
+    )
+
+
+def test_indicator_cache_hits_return_identical_columns():
+    frame = _frame()
+    cache = IndicatorCache()
+    uncached = generate_indicators(frame, backend="numpy")
+
+    first = generate_indicators(frame, backend="numpy", cache=cache)
+    misses_after_first = cache.stats.misses
+    second = generate_indicators(frame, backend="numpy", cache=cache)
+
+    pd.testing.assert_frame_equal(first, uncached)
+    pd.testing.assert_frame_equal(second, uncached)
+    assert misses_after_first == 6
+    assert cache.stats.misses == 6
+    assert cache.stats.hits == 6
+
+    second["ema_12"] = 0.0
+    third = generate_indicators(frame, backend="numpy", cache=cache)
+    pd.testing.assert_series_equal(third["ema_12"], uncached["ema_12"])
+
+
+def test_indicator_cache_keys_follow_content_and_windows():
+    frame = _frame()
+    cache = IndicatorCache()
+    generate_indicators(frame, backend="numpy", cache=cache)
+    generate_indicators(_frame(offset=5.0), backend="numpy", cache=cache)
+    assert cache.stats.hits == 0
+
+    generate_indicator_grid(
+        frame, ema_windows=[12, 20], rsi_windows=[14], atr_windows=[14], cache=cache
+    )
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 13
+    assert ohlcv_content_hash(frame) == ohlcv_content_hash(frame.copy())
+
+
+def test_indicator_cache_evicts_least_recently_used_by_bytes():
+    cache = IndicatorCache(max_bytes=2 * 8 * 100)
+    values = np.arange(100, dtype=np.float64)
+    cache.put("content", "ema", 1, values)
+    cache.put("content", "ema", 2, values)
+    assert cache.get("content", "ema", 1) is not None
+    cache.put("content", "ema", 3, values)
+
+    assert cache.stats.evictions == 1
+    assert cache.get("content", "ema", 2) is None
+    assert cache.get("content", "ema", 1) is not None
+    assert cache.memory_bytes <= cache.max_bytes
+    assert cache.stats.to_dict()["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_indicator_cache_disk_tier_survives_new_instance(tmp_path):
+    frame = _frame()
+    first = IndicatorCache(cache_dir=tmp_path)
+    expected = generate_indicators(frame, backend="numpy", cache=first)
+    assert first.stats.disk_writes == 6
+
+    second = IndicatorCache(cache_dir=tmp_path)
+    result = generate_indicators(frame, backend="numpy", cache=second)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert second.stats.disk_hits == 6
+    assert second.stats.misses == 0
+
+
+def test_indicator_cache_requires_numpy_backend():
+    with pytest.raises(ValueError):
+        generate_indicators(_frame(), cache=IndicatorCache())
+
+
+def test_indicator_cache_disk_tier_drops_least_recent_files(tmp_path):
+    unbounded = IndicatorCache(cache_dir=tmp_path)
+    for window in range(4):
+        unbounded.put("content", "ema", window, np.full(100, float(window)))
+    for age, path in enumerate(sorted((tmp_path / "indicators").glob("*.npy"))):
+        os.utime(path, ns=(age * 10**9, age * 10**9))
+    oldest = min(
+        (tmp_path / "indicators").glob("*.npy"), key=lambda path: path.stat().st_mtime
+    )
+
+    bounded = IndicatorCache(cache_dir=tmp_path, max_disk_bytes=3 * 1024)
+    bounded.put("content", "ema", 4, np.full(100, 4.0))
+
+    remaining = list((tmp_path / "indicators").glob("*.npy"))
+    assert len(remaining) == 3
+    assert not oldest.exists()
+    assert bounded.get("content", "ema", 4) is not None
+
+
+def test_indicators_reuse_an_explicit_content_hash(monkeypatch):
+    frame = _frame()
+    content_hash = ohlcv_content_hash(frame)
+    expected = generate_indicators(frame, backend="numpy", cache=IndicatorCache())
+
+    def _fail_rehash(*args, **kwargs):
+        raise AssertionError("content hash must not be recomputed")
+
+    monkeypatch.setattr(
+        "bitcoin_bot.indicators.generator.ohlcv_content_hash", _fail_rehash
+    )
+    reused = generate_indicators(
+        frame, backend="numpy", cache=IndicatorCache(), content_hash=content_hash
+    )
+    pd.testing.assert_frame_equal(reused, expected)
@@ -63,3 +63,26 @@ def test_existing_columns_are_not_overwritten():
 
     with pytest.raises(ValueError):
         generate_indicators(frame)
+
+
+def test_numpy_backend_matches_pandas_backend():
+    frame = _base_ohlcv_frame(rows=120)
+    frame.loc[frame.index[40:60], ["close", "high", "low"]] = [150.0, 151.0, 149.0]
+    frame.loc[frame.index[70:], "close"] = frame["close"].iloc[70:] * 0.97
+
+    expected = generate_indicators(frame)
+    result = generate_indicators(frame, backend="numpy")
+
+    assert list(result.columns) == list(expected.columns)
+    for column in ["ema_12", "ema_26", "rsi_14", "atr_14", "slope_norm", "gap_norm"]:
+        assert result[column].dtype == "float64"
+        pd.testing.assert_series_equal(
+            result[column],
+            pd.to_numeric(expected[column]).astype("float64"),
+            check_exact=True,
+        )
+
+
+def test_unknown_indicator_backend_is_rejected():
+    with pytest.raises(ValueError):
+        generate_indicators(_base_ohlcv_frame(), backend="polars")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitcoin_bot.indicators.generator import (
+    generate_indicator_grid,
+    generate_indicators,
+)
+
+
+def _frame(rows: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, rows))
+    index = pd.date_range("2026-01-01", periods=rows, freq="min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "timestamp": index,
+            "open": close,
+            "high": close + rng.random(rows),
+            "low": close - rng.random(rows),
+            "close": close,
+            "volume": 1.0,
+        },
+        index=index,
+    )
+
+
+def test_indicator_grid_matches_single_parameter_indicators():
+    frame = _frame()
+    grid = generate_indicator_grid(
+        frame,
+        ema_windows=[26, 8, 12, 21, 8],
+        rsi_windows=[7, 14],
+        atr_windows=[10, 14],
+    )
+
+    assert grid.ema_windows == (8, 12, 21, 26)
+    assert grid.ema.shape == (len(frame), 4)
+    assert grid.rsi.shape == (len(frame), 2)
+    assert grid.atr.flags.f_contiguous
+
+    for ema_fast, ema_slow, rsi_period, atr_period in [
+        (8, 21, 7, 10),
+        (12, 26, 14, 14),
+    ]:
+        expected = generate_indicators(
+            frame,
+            ema_fast_window=ema_fast,
+            ema_slow_window=ema_slow,
+            rsi_window=rsi_period,
+            atr_window=atr_period,
+            backend="numpy",
+        )
+        selected = grid.select(
+            ema_fast_window=ema_fast,
+            ema_slow_window=ema_slow,
+            rsi_window=rsi_period,
+            atr_window=atr_period,
+        )
+        for key, column in [
+            ("ema_fast", f"ema_{ema_fast}"),
+            ("ema_slow", f"ema_{ema_slow}"),
+            ("rsi", f"rsi_{rsi_period}"),
+            ("atr", f"atr_{atr_period}"),
+        ]:
+            assert np.array_equal(
+                selected[key], expected[column].to_numpy(), equal_nan=True
+            ), key
+
+
+def test_indicator_grid_rejects_empty_or_invalid_windows():
+    frame = _frame(rows=30)
+    with pytest.raises(ValueError):
+        generate_indicator_grid(
+            frame, ema_windows=[], rsi_windows=[14], atr_windows=[14]
+        )
+    with pytest.raises(ValueError):
+        generate_indicator_grid(
+            frame, ema_windows=[0], rsi_windows=[14], atr_windows=[14]
+        )
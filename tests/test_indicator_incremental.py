@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.indicators.generator import generate_indicators
+from bitcoin_bot.indicators.incremental import (
+    IncrementalIndicatorEngine,
+    load_indicator_state,
+    save_indicator_state,
+)
+
+
+def _random_frame(rows: int = 800, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, rows))
+    close[200:230] = close[199]
+    index = pd.date_range("2026-01-01", periods=rows, freq="min", tz="UTC")
+    frame = pd.DataFrame(
+        {
+            "timestamp": index,
+            "open": close,
+            "high": close + rng.random(rows),
+            "low": close - rng.random(rows),
+            "close": close,
+            "volume": 1.0,
+        },
+        index=index,
+    )
+    return frame
+
+
+def test_incremental_engine_matches_batch_indicators_bit_for_bit():
+    frame = _random_frame()
+    batch = generate_indicators(
+        frame, ema_fast_window=5, ema_slow_window=9, rsi_window=3, atr_window=7
+    )
+    engine = IncrementalIndicatorEngine(
+        ema_fast_window=5, ema_slow_window=9, rsi_window=3, atr_window=7
+    )
+    rows = [
+        engine.update(
+            high=float(row.high),
+            low=float(row.low),
+            close=float(row.close),
+            timestamp=row.Index,
+        )
+        for row in frame.itertuples()
+    ]
+    incremental = pd.DataFrame(rows, index=frame.index)
+
+    for key, column in [
+        ("ema_fast", "ema_5"),
+        ("ema_slow", "ema_9"),
+        ("rsi", "rsi_3"),
+        ("atr", "atr_7"),
+        ("slope_norm", "slope_norm"),
+        ("gap_norm", "gap_norm"),
+    ]:
+        expected = pd.to_numeric(batch[column]).to_numpy(dtype=float)
+        assert np.array_equal(incremental[key].to_numpy(), expected, equal_nan=True), (
+            key
+        )
+    assert engine.last_timestamp == frame.index[-1]
+    assert engine.bars == len(frame)
+
+
+def test_incremental_engine_state_roundtrip_resumes_identically(tmp_path):
+    frame = _random_frame()
+    reference = IncrementalIndicatorEngine.from_frame(frame)
+
+    partial = IncrementalIndicatorEngine.from_frame(frame.iloc[:500])
+    state_path = tmp_path / "indicator_state.json"
+    save_indicator_state(state_path, partial)
+    json.loads(state_path.read_text(encoding="utf-8"))
+
+    restored = load_indicator_state(
+        state_path, ema_fast_window=12, ema_slow_window=26, rsi_window=14, atr_window=14
+    )
+    assert restored is not None
+    restored.update_frame(frame.iloc[500:])
+
+    assert restored.snapshot() == reference.snapshot()
+    assert restored.to_state() == reference.to_state()
+    assert (
+        load_indicator_state(
+            state_path,
+            ema_fast_window=5,
+            ema_slow_window=26,
+            rsi_window=14,
+            atr_window=14,
+        )
+        is None
+    )
+
+
+def test_from_history_matches_bar_by_bar_engine_state():
+    frame = _random_frame()
+
+    for windows in (
+        {"ema_fast_window": 12, "ema_slow_window": 26},
+        {"ema_fast_window": 5, "ema_slow_window": 9, "rsi_window": 3},
+    ):
+        for rows in (2, 10, 800):
+            expected = IncrementalIndicatorEngine.from_frame(
+                frame.iloc[:rows], **windows
+            )
+            actual = IncrementalIndicatorEngine.from_history(
+                frame.iloc[:rows], **windows
+            )
+            assert json.dumps(actual.to_state()) == json.dumps(expected.to_state())
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from bitcoin_bot.data.backfill import backfill_klines, load_backfilled_ohlcv
+from bitcoin_bot.data.kline_store import KlineStore
+from bitcoin_bot.data.ohlcv import load_ohlcv_for_backtest
+from bitcoin_bot.exchange.gmo_adapter import GMOAdapter
+from bitcoin_bot.exchange.protocol import (
+    ErrorAwareList,
+    NormalizedKline,
+    ReadFailureInfo,
+)
+
+
+def _kline(timestamp: datetime, close: float) -> NormalizedKline:
+    return NormalizedKline(
+        timestamp=timestamp,
+        open=close - 0.5,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=1.0,
+    )
+
+
+def test_kline_partitions_follow_gmo_date_rollover():
+    adapter = GMOAdapter(product_type="spot")
+    start = datetime(2026, 1, 1, 20, 0, tzinfo=UTC)
+    end = datetime(2026, 1, 3, 0, 0, tzinfo=UTC)
+
+    partitions = adapter.kline_partitions("1m", start, end)
+
+    assert [partition[0] for partition in partitions] == [
+        start,
+        datetime(2026, 1, 1, 21, 0, tzinfo=UTC),
+        datetime(2026, 1, 2, 21, 0, tzinfo=UTC),
+    ]
+    assert partitions[0][1] == datetime(2026, 1, 1, 21, 0, tzinfo=UTC) - timedelta(
+        milliseconds=1
+    )
+    assert partitions[-1][1] == end
+    assert len(adapter.kline_partitions("1d", start, end)) == 1
+
+
+def test_fetch_klines_requests_each_gmo_date(monkeypatch):
+    adapter = GMOAdapter(product_type="spot", use_http=True)
+    start = datetime(2026, 1, 1, 20, 58, tzinfo=UTC)
+    end = datetime(2026, 1, 1, 21, 1, tzinfo=UTC)
+    requested: list[dict[str, str]] = []
+
+    def _fake_request_json(*, method, path, params=None, body=None, auth=False):
+        requested.append(dict(params or {}))
+        rows = []
+        for minute in range(57, 63):
+            opened = datetime(2026, 1, 1, 20, 0, tzinfo=UTC) + timedelta(minutes=minute)
+            rows.append(
+                {
+                    "openTime": str(int(opened.timestamp() * 1000)),
+                    "open": "100",
+                    "high": "101",
+                    "low": "99",
+                    "close": "100.5",
+                    "volume": "0.1",
+                }
+            )
+        return {"status": 0, "data": rows}
+
+    monkeypatch.setattr(adapter, "_request_json", _fake_request_json)
+    klines = adapter.fetch_klines("BTC_JPY", "1m", start, end, 0)
+
+    assert [params["date"] for params in requested] == ["20260101", "20260102"]
+    assert all(params["interval"] == "1min" for params in requested)
+    assert klines.error is None
+    assert {kline.timestamp for kline in klines} == {
+        start + timedelta(minutes=offset) for offset in range(4)
+    }
+
+
+class _PartitionedAdapter:
+    def __init__(self, failing_day: int) -> None:
+        self.failing_day = failing_day
+        self.calls: list[tuple[datetime, datetime, int]] = []
+
+    def fetch_klines(self, symbol, timeframe, start, end, limit):
+        self.calls.append((start, end, limit))
+        if start.day == self.failing_day:
+            return ErrorAwareList(
+                error=ReadFailureInfo(
+                    category="network",
+                    retryable=True,
+                    source_code="NETWORK_TIMEOUT",
+                    message="timeout",
+                )
+            )
+        rows = [
+            _kline(start + timedelta(hours=hour), 100.0 + start.day * 10 + hour)
+            for hour in range(3)
+        ]
+        return ErrorAwareList([rows[2], rows[0], rows[1], rows[1]])
+
+
+def test_backfill_streams_partitions_into_cache_in_order(tmp_path):
+    adapter = _PartitionedAdapter(failing_day=3)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    end = datetime(2026, 1, 4, 23, 0, tzinfo=UTC)
+
+    summary = backfill_klines(
+        adapter=adapter,
+        symbol="BTC_JPY",
+        timeframe="1h",
+        start=start,
+        end=end,
+        cache_dir=str(tmp_path),
+        max_workers=3,
+    )
+
+    assert summary["status"] == "degraded"
+    assert summary["partitions"] == 4
+    assert summary["written_bars"] == 9
+    assert summary["failed_partitions"] == [
+        datetime(2026, 1, 3, tzinfo=UTC).isoformat()
+    ]
+    assert all(limit == 24 for _, _, limit in adapter.calls)
+
+    frame = load_backfilled_ohlcv(
+        tmp_path, symbol="BTC_JPY", timeframe="1h", start=start, end=end
+    )
+    assert frame is not None
+    assert len(frame) == 9
+    assert frame.index.is_unique
+    assert frame.index.is_monotonic_increasing
+    assert frame.attrs["provider"] == "gmo"
+    assert float(frame["close"].iloc[-1]) == 142.0
+    assert (
+        load_backfilled_ohlcv(
+            tmp_path,
+            symbol="BTC_JPY",
+            timeframe="1h",
+            start=end + timedelta(days=1),
+            end=end + timedelta(days=2),
+        )
+        is None
+    )
+
+
+def test_backfill_merges_older_ranges_into_kline_store(tmp_path):
+    store = KlineStore(cache_dir=str(tmp_path), symbol="BTC_JPY", timeframe="1h")
+    store.append_klines(
+        [_kline(datetime(2026, 1, 5, hour, tzinfo=UTC), 500.0) for hour in range(3)]
+    )
+
+    summary = backfill_klines(
+        adapter=_PartitionedAdapter(failing_day=0),
+        symbol="BTC_JPY",
+        timeframe="1h",
+        start=datetime(2026, 1, 1, tzinfo=UTC),
+        end=datetime(2026, 1, 2, 23, 0, tzinfo=UTC),
+        cache_dir=str(tmp_path),
+    )
+
+    frame = store.load()
+    assert summary["written_bars"] == 6
+    assert summary["cache_entry_dir"] == str(store.entry_dir)
+    assert frame is not None
+    assert len(frame) == 9
+    assert frame.index.is_monotonic_increasing
+    assert store.last_timestamp() == datetime(2026, 1, 5, 2, tzinfo=UTC)
+    assert store.merge_frame(frame.iloc[:4]) == 0
+
+
+def test_backtest_loader_reads_backfilled_store_per_source_priority(tmp_path):
+    backfill_klines(
+        adapter=_PartitionedAdapter(failing_day=0),
+        symbol="BTC_JPY",
+        timeframe="1h",
+        start=datetime(2026, 1, 1, tzinfo=UTC),
+        end=datetime(2026, 1, 2, 23, 0, tzinfo=UTC),
+        cache_dir=str(tmp_path),
+    )
+    missing_csv = str(tmp_path / "missing.csv")
+    csv_path = tmp_path / "ohlcv.csv"
+    csv_path.write_text(
+        "timestamp,open,high,low,close,volume\n"
+        + "".join(
+            f"2026-01-01 00:{idx:02d}:00+00:00,99.5,100.5,99.0,100.0,10\n"
+            for idx in range(4)
+        ),
+        encoding="utf-8",
+    )
+
+    frame, source, reason = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1h",
+        backtest_data_quality_mode="strict",
+        source_priority=["api", "csv"],
+        kline_store_dir=str(tmp_path),
+    )
+    assert (source, reason, len(frame)) == ("kline_store", None, 6)
+
+    frame, source, reason = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1h",
+        source_priority=["csv", "api"],
+        kline_store_dir=str(tmp_path),
+    )
+    assert (source, reason, len(frame)) == ("csv", None, 4)
+
+    frame, source, reason = load_ohlcv_for_backtest(
+        csv_path=missing_csv,
+        symbol="BTC_JPY",
+        timeframe="1h",
+        source_priority=["csv", "api"],
+        kline_store_dir=str(tmp_path),
+    )
+    assert (source, reason, len(frame)) == ("kline_store", "csv_not_found", 6)
+
+    with pytest.raises(ValueError, match="csv_not_found"):
+        load_ohlcv_for_backtest(
+            csv_path=missing_csv,
+            symbol="BTC_JPY",
+            timeframe="1h",
+            backtest_data_quality_mode="strict",
+            source_priority=["csv", "api"],
+            kline_store_dir=str(tmp_path),
+        )
+
+    _, source, _ = load_ohlcv_for_backtest(
+        csv_path=missing_csv,
+        symbol="BTC_JPY",
+        timeframe="1h",
+        source_priority=["csv"],
+        kline_store_dir=str(tmp_path),
+    )
+    assert source == "synthetic_fallback"
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from bitcoin_bot.config.models import RuntimeConfig
+from bitcoin_bot.data.kline_store import KlineStore, timeframe_to_timedelta
+from bitcoin_bot.exchange.protocol import ErrorAwareList, NormalizedKline
+from bitcoin_bot.pipeline.live_runner import run_live
+
+
+def _klines(start: datetime, count: int, base: float = 100.0) -> list[NormalizedKline]:
+    klines: list[NormalizedKline] = []
+    for index in range(count):
+        close = base + index + (index % 3) * 0.5 - (index % 4) * 0.7
+        klines.append(
+            NormalizedKline(
+                timestamp=start + timedelta(minutes=index),
+                open=close - 0.2,
+                high=close + 0.5,
+                low=close - 0.5,
+                close=close,
+                volume=10.0 + (index % 5),
+            )
+        )
+    return klines
+
+
+def test_timeframe_to_timedelta_accepts_config_and_gmo_notation():
+    assert timeframe_to_timedelta("1m") == timedelta(minutes=1)
+    assert timeframe_to_timedelta("5min") == timedelta(minutes=5)
+    assert timeframe_to_timedelta("1hour") == timedelta(hours=1)
+    with pytest.raises(ValueError):
+        timeframe_to_timedelta("fortnight")
+
+
+def test_kline_store_appends_only_newer_bars(tmp_path):
+    store = KlineStore(cache_dir=str(tmp_path), symbol="BTC_JPY", timeframe="1m")
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    assert store.last_timestamp() is None
+    assert store.append_klines(_klines(start, 5)) == 5
+
+    overlapping = _klines(start + timedelta(minutes=3), 4)
+    assert store.append_klines([*overlapping, overlapping[-1]]) == 2
+
+    frame = store.load()
+    assert frame is not None
+    assert len(frame) == 7
+    assert frame.index.is_unique
+    assert frame.index.is_monotonic_increasing
+    assert store.last_timestamp() == start + timedelta(minutes=6)
+
+    tail = store.tail(3)
+    assert tail is not None
+    assert list(tail.index) == list(frame.index[-3:])
+    assert tail.attrs["symbol"] == "BTC_JPY"
+
+
+class _KlineAdapter:
+    def __init__(self, klines: list[NormalizedKline]) -> None:
+        self.klines = klines
+        self.limits: list[int] = []
+
+    def fetch_klines(self, symbol, timeframe, start, end, limit):
+        self.limits.append(limit)
+        return ErrorAwareList(self.klines[-limit:])
+
+
+def test_live_reads_indicators_from_kline_store(tmp_path, monkeypatch):
+    config = RuntimeConfig()
+    config.paths.artifacts_dir = str(tmp_path / "artifacts")
+    config.paths.logs_dir = str(tmp_path / "logs")
+    config.paths.cache_dir = str(tmp_path / "cache")
+    config.data.live_window_bars = 60
+
+    now = datetime.now(UTC).replace(second=0, microsecond=0)
+    adapter = _KlineAdapter(_klines(now - timedelta(minutes=61), 60))
+
+    first = run_live(config, exchange_adapter=adapter)["summary"]
+    store = KlineStore(
+        cache_dir=config.paths.cache_dir, symbol="BTC_JPY", timeframe="1m"
+    )
+    assert (store.entry_dir / "indicator_state.json").exists()
+
+    def _fail_reseed(*args, **kwargs):
+        raise AssertionError("persisted indicator state must be reused")
+
+    monkeypatch.setattr(
+        "bitcoin_bot.pipeline.live_runner.IncrementalIndicatorEngine.from_history",
+        _fail_reseed,
+    )
+    second = run_live(config, exchange_adapter=adapter)["summary"]
+
+    assert first["market_data"]["source"] == "kline_store"
+    assert first["market_data"]["appended"] == 60
+    assert second["market_data"]["appended"] == 0
+    assert second["market_data"]["bars"] == 60
+    assert second["market_data"]["source"] == "kline_store"
+    assert adapter.limits[0] == 60
+    assert len(adapter.limits) == 1 or adapter.limits[1] <= 3
+
+
+class _RangeKlineAdapter:
+    def __init__(self, klines: list[NormalizedKline]) -> None:
+        self.klines = klines
+        self.requests: list[tuple[datetime, datetime]] = []
+
+    def fetch_klines(self, symbol, timeframe, start, end, limit):
+        self.requests.append((start, end))
+        return ErrorAwareList(
+            [kline for kline in self.klines if start <= kline.timestamp <= end][:limit]
+        )
+
+
+def test_live_backfills_gap_between_stale_seed_and_now(tmp_path):
+    config = RuntimeConfig()
+    config.paths.artifacts_dir = str(tmp_path / "artifacts")
+    config.paths.logs_dir = str(tmp_path / "logs")
+    config.paths.cache_dir = str(tmp_path / "cache")
+    config.data.live_window_bars = 60
+
+    now = datetime.now(UTC).replace(second=0, microsecond=0)
+    history = _klines(now - timedelta(minutes=400), 400)
+    store = KlineStore(
+        cache_dir=config.paths.cache_dir, symbol="BTC_JPY", timeframe="1m"
+    )
+    store.append_klines(history[:100])
+    adapter = _RangeKlineAdapter(history)
+
+    summary = run_live(config, exchange_adapter=adapter)["summary"]
+
+    frame = store.load()
+    assert frame is not None
+    assert summary["market_data"]["appended"] == 300
+    assert len(frame) == 400
+    assert (frame.index.to_series().diff().dropna() == timedelta(minutes=1)).all()
+    assert adapter.requests[0][0] == history[100].timestamp
@@ -73,7 +73,7 @@ def test_run_progress_can_store_failed_state(tmp_path):
 def test_run_complete_contract_not_broken(tmp_path):
     config_path = tmp_path / "runtime.yaml"
     config_path.write_text(
-        """
+        f"""
 runtime:
   mode: backtest
 exchange:
@@ -87,7 +87,7 @@ notify:
 paths:
   artifacts_dir: "./var/artifacts"
   logs_dir: "./var/logs"
-  cache_dir: "./var/cache"
+  cache_dir: "{tmp_path / "cache"}"
 """,
         encoding="utf-8",
     )
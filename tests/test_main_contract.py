@@ -10,7 +10,7 @@ from bitcoin_bot.telemetry.reporters import RUN_COMPLETE_SCHEMA_VERSION
 def test_main_run_emits_run_complete(tmp_path, capsys):
     config_path = tmp_path / "runtime.yaml"
     config_path.write_text(
-        """
+        f"""
 runtime:
   mode: backtest
 exchange:
@@ -24,7 +24,7 @@ notify:
 paths:
   artifacts_dir: "./var/artifacts"
   logs_dir: "./var/logs"
-  cache_dir: "./var/cache"
+  cache_dir: "{tmp_path / "cache"}"
 """,
         encoding="utf-8",
     )
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from bitcoin_bot.config.models import RuntimeConfig
+from bitcoin_bot.data.ohlcv import load_ohlcv_for_backtest
+
+
+def _write_csv(path: Path, closes: list[float]) -> None:
+    lines = ["timestamp,open,high,low,close,volume"]
+    for idx, close in enumerate(closes):
+        lines.append(
+            f"2026-01-01 00:{idx:02d}:00+00:00,{close - 0.5},{close + 0.5},"
+            f"{close - 1.0},{close},10"
+        )
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _load(csv_path: Path, cache_dir: Path) -> tuple[pd.DataFrame, str, str | None]:
+    return load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1m",
+        cache_dir=str(cache_dir),
+    )
+
+
+def test_ohlcv_cache_roundtrip_matches_csv_frame(tmp_path, monkeypatch):
+    csv_path = tmp_path / "klines.csv"
+    cache_dir = tmp_path / "cache"
+    _write_csv(csv_path, [100.0, 101.0, 102.5, 101.5])
+
+    first, source, reason = _load(csv_path, cache_dir)
+    assert source == "csv"
+    assert reason is None
+    assert list((cache_dir / "ohlcv").iterdir())
+
+    def _fail_read_csv(*args, **kwargs):
+        raise AssertionError("cache hit must not re-read csv")
+
+    monkeypatch.setattr("bitcoin_bot.data.ohlcv.pd.read_csv", _fail_read_csv)
+    second, source, _ = _load(csv_path, cache_dir)
+
+    assert source == "csv"
+    pd.testing.assert_frame_equal(first, second)
+    assert str(second.index.tz) == "UTC"
+    assert second.attrs == {
+        "provider": "csv",
+        "symbol": "BTC_JPY",
+        "timeframe": "1m",
+        "missing_policy": "drop",
+    }
+
+
+def test_ohlcv_cache_invalidates_when_source_changes(tmp_path):
+    csv_path = tmp_path / "klines.csv"
+    cache_dir = tmp_path / "cache"
+    _write_csv(csv_path, [100.0, 101.0, 102.0])
+    first, _, _ = _load(csv_path, cache_dir)
+
+    _write_csv(csv_path, [200.0, 201.0, 202.0, 203.0])
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second, _, _ = _load(csv_path, cache_dir)
+
+    assert len(first) == 3
+    assert len(second) == 4
+    assert float(second["close"].iloc[-1]) == 203.0
+    assert len(list((cache_dir / "ohlcv").iterdir())) == 1
+
+
+def test_ohlcv_cache_evicts_least_recently_used_csv_entries(tmp_path):
+    cache_dir = tmp_path / "cache"
+    paths = [tmp_path / f"klines-{index}.csv" for index in range(3)]
+    for path in paths:
+        _write_csv(path, [100.0, 101.0, 102.0])
+
+    def _load_bounded(csv_path: Path) -> None:
+        load_ohlcv_for_backtest(
+            csv_path=str(csv_path),
+            symbol="BTC_JPY",
+            timeframe="1m",
+            cache_dir=str(cache_dir),
+            cache_max_entries=2,
+        )
+
+    _load_bounded(paths[0])
+    _load_bounded(paths[1])
+    for entry in (cache_dir / "ohlcv").iterdir():
+        os.utime(entry / "meta.json", ns=(0, 0))
+    _load_bounded(paths[0])
+    _load_bounded(paths[2])
+
+    entries = list((cache_dir / "ohlcv").iterdir())
+    sources = {
+        json.loads((entry / "meta.json").read_text(encoding="utf-8"))["source_id"]
+        for entry in entries
+    }
+    assert sources == {str(paths[0].resolve()), str(paths[2].resolve())}
+
+
+def test_ohlcv_cache_is_disabled_by_default():
+    assert RuntimeConfig().data.ohlcv_cache_enabled is False
+
+
+def test_ohlcv_cache_rewrite_does_not_disturb_open_readers(tmp_path):
+    csv_path = tmp_path / "klines.csv"
+    cache_dir = tmp_path / "cache"
+    _write_csv(csv_path, [100.0, 101.0, 102.0])
+    first, _, _ = _load(csv_path, cache_dir)
+
+    _write_csv(csv_path, [200.0, 201.0, 202.0])
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second, _, _ = _load(csv_path, cache_dir)
+
+    assert first["close"].tolist() == [100.0, 101.0, 102.0]
+    assert second["close"].tolist() == [200.0, 201.0, 202.0]
+    assert not list((cache_dir / "ohlcv").glob("*/*.tmp"))
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitcoin_bot.data.ohlcv import (
+    iter_ohlcv_csv_chunks,
+    load_ohlcv_for_backtest,
+    normalize_ohlcv_frame,
+)
+
+
+def _write_gappy_csv(path: Path, rows: int = 50) -> None:
+    timestamps = pd.date_range("2026-01-01", periods=rows, freq="min", tz="UTC")
+    closes = np.linspace(100.0, 150.0, rows)
+    frame = pd.DataFrame(
+        {
+            "timestamp": timestamps.astype(str),
+            "open": closes - 0.5,
+            "high": closes + 0.5,
+            "low": closes - 1.0,
+            "close": closes,
+            "volume": np.full(rows, 10.0),
+        }
+    )
+    frame.loc[9:11, "close"] = np.nan
+    frame.loc[20, "high"] = np.nan
+    frame.loc[33, "timestamp"] = "broken"
+    frame.to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("missing_policy", ["drop", "ffill"])
+def test_chunked_ingestion_matches_full_read(tmp_path, missing_policy):
+    csv_path = tmp_path / "klines.csv"
+    _write_gappy_csv(csv_path)
+
+    full = normalize_ohlcv_frame(
+        pd.read_csv(csv_path),
+        provider="csv",
+        symbol="BTC_JPY",
+        timeframe="1m",
+        missing_policy=missing_policy,
+    )
+    chunks = list(
+        iter_ohlcv_csv_chunks(
+            csv_path,
+            chunk_rows=10,
+            provider="csv",
+            symbol="BTC_JPY",
+            timeframe="1m",
+            missing_policy=missing_policy,
+        )
+    )
+
+    assert len(chunks) > 1
+    assert all(chunk.attrs["missing_policy"] == missing_policy for chunk in chunks)
+    pd.testing.assert_frame_equal(full, pd.concat(chunks), check_like=False)
+
+
+def test_chunked_ingestion_ffill_carries_across_chunk_boundary(tmp_path):
+    csv_path = tmp_path / "klines.csv"
+    _write_gappy_csv(csv_path)
+
+    chunks = list(
+        iter_ohlcv_csv_chunks(
+            csv_path,
+            chunk_rows=10,
+            provider="csv",
+            symbol="BTC_JPY",
+            timeframe="1m",
+            missing_policy="ffill",
+        )
+    )
+
+    second_chunk = chunks[1]
+    assert len(second_chunk) == 10
+    assert second_chunk["close"].iloc[0] == chunks[0]["close"].iloc[-1]
+
+
+def test_chunked_load_streams_into_cache(tmp_path):
+    csv_path = tmp_path / "klines.csv"
+    cache_dir = tmp_path / "cache"
+    _write_gappy_csv(csv_path)
+
+    frame, source, reason = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1m",
+        missing_policy="ffill",
+        cache_dir=str(cache_dir),
+        chunk_rows=7,
+    )
+    cached, _, _ = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1m",
+        missing_policy="ffill",
+        cache_dir=str(cache_dir),
+    )
+
+    assert source == "csv"
+    assert reason is None
+    assert len(frame) == 50
+    assert frame.attrs["missing_policy"] == "ffill"
+    pd.testing.assert_frame_equal(frame, cached)
+
+
+def _memmap_backed(values: np.ndarray) -> bool:
+    base: np.ndarray | None = values
+    while base is not None:
+        if isinstance(base, np.memmap):
+            return True
+        base = base.base
+    return False
+
+
+def test_chunked_load_without_cache_dir_spills_to_memmap(tmp_path):
+    csv_path = tmp_path / "klines.csv"
+    _write_gappy_csv(csv_path)
+
+    frame, source, _ = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1m",
+        chunk_rows=7,
+    )
+    full = normalize_ohlcv_frame(
+        pd.read_csv(csv_path), provider="csv", symbol="BTC_JPY", timeframe="1m"
+    )
+
+    assert source == "csv"
+    assert _memmap_backed(frame["close"].to_numpy())
+    np.testing.assert_array_equal(frame["close"].to_numpy(), full["close"].to_numpy())
+
+
+def test_chunked_load_falls_back_to_memory_when_cache_write_fails(
+    tmp_path, monkeypatch
+):
+    csv_path = tmp_path / "klines.csv"
+    _write_gappy_csv(csv_path)
+
+    def _fail_append(self, frame):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(
+        "bitcoin_bot.data.ohlcv_cache.OhlcvCacheWriter.append", _fail_append
+    )
+    frame, source, reason = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1m",
+        cache_dir=str(tmp_path / "cache"),
+        chunk_rows=7,
+    )
+
+    assert source == "csv"
+    assert reason is None
+    assert len(frame) == 45
+    assert not _memmap_backed(frame["close"].to_numpy())
+
+
+def test_chunked_load_reports_parse_errors_as_csv_read_error(tmp_path):
+    csv_path = tmp_path / "klines.csv"
+    csv_path.write_text('timestamp,open\n"unterminated,1\n', encoding="utf-8")
+
+    _, source, reason = load_ohlcv_for_backtest(
+        csv_path=str(csv_path),
+        symbol="BTC_JPY",
+        timeframe="1m",
+        chunk_rows=7,
+    )
+
+    assert source == "synthetic_fallback"
+    assert reason == "csv_read_error"
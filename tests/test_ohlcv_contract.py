@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from bitcoin_bot.data.ohlcv import REQUIRED_OHLCV_COLUMNS, normalize_ohlcv
+import numpy as np
+import pandas as pd
+
+from bitcoin_bot.data.ohlcv import (
+    REQUIRED_OHLCV_COLUMNS,
+    normalize_ohlcv,
+    normalize_ohlcv_frame,
+)
 
 
 def test_ohlcv_contract_columns_utc_index_and_attrs():
@@ -62,3 +69,75 @@ def test_ohlcv_missing_policy_is_explicit_and_applied():
 
     assert len(frame) == 1
     assert frame.attrs["missing_policy"] == "drop"
+
+
+def test_normalize_ohlcv_frame_matches_row_path_for_both_policies():
+    rows = [
+        {
+            "timestamp": "2026-01-01 00:00:00+00:00",
+            "open": 1,
+            "high": None,
+            "low": 1,
+            "close": "2",
+            "volume": 10,
+        },
+        {
+            "timestamp": "not-a-timestamp",
+            "open": 1,
+            "high": 2,
+            "low": 1,
+            "close": 2,
+            "volume": 10,
+        },
+        {
+            "timestamp": "2026-01-01 00:02:00+00:00",
+            "open": 3,
+            "high": 4,
+            "low": 2,
+            "close": 3,
+            "volume": 11,
+        },
+    ]
+
+    for policy in ("drop", "ffill"):
+        from_rows = normalize_ohlcv(
+            rows,
+            provider="csv",
+            symbol="BTC_JPY",
+            timeframe="1m",
+            missing_policy=policy,
+        )
+        from_frame = normalize_ohlcv_frame(
+            pd.DataFrame(rows),
+            provider="csv",
+            symbol="BTC_JPY",
+            timeframe="1m",
+            missing_policy=policy,
+        )
+        pd.testing.assert_frame_equal(from_rows, from_frame)
+
+    assert len(from_frame) == 2
+    assert float(from_frame["high"].iloc[0]) == 2.0
+
+
+def test_normalize_ohlcv_frame_accepts_numpy_column_mapping():
+    timestamps = pd.date_range("2026-01-01", periods=3, freq="min", tz="UTC")
+    frame = normalize_ohlcv_frame(
+        {
+            "timestamp": timestamps.to_numpy(),
+            "open": np.array([1.0, 2.0, 3.0]),
+            "high": np.array([2.0, np.nan, 4.0]),
+            "low": np.array([0.5, 1.5, 2.5]),
+            "close": np.array([1.5, 2.5, 3.5]),
+            "volume": np.array([10.0, 11.0, 12.0]),
+        },
+        provider="gmo",
+        symbol="BTC_JPY",
+        timeframe="1m",
+        missing_policy="drop",
+    )
+
+    assert list(frame.columns) == REQUIRED_OHLCV_COLUMNS
+    assert str(frame.index.tz) == "UTC"
+    assert frame["close"].tolist() == [1.5, 3.5]
+    assert frame.attrs["missing_policy"] == "drop"
@@ -9,7 +9,7 @@ from bitcoin_bot.main import run
 def test_run_complete_optimization_contract_and_trials_recorded(tmp_path):
     config_path = tmp_path / "runtime.yaml"
     config_path.write_text(
-        """
+        f"""
 runtime:
   mode: backtest
 exchange:
@@ -23,7 +23,7 @@ notify:
 paths:
   artifacts_dir: "./var/artifacts"
   logs_dir: "./var/logs"
-  cache_dir: "./var/cache"
+  cache_dir: "{tmp_path / "cache"}"
 """,
         encoding="utf-8",
     )
@@ -48,7 +48,7 @@ paths:
 def test_run_complete_contract_top_level_keys_remain(tmp_path):
     config_path = tmp_path / "runtime.yaml"
     config_path.write_text(
-        """
+        f"""
 runtime:
   mode: backtest
 exchange:
@@ -62,7 +62,7 @@ notify:
 paths:
   artifacts_dir: "./var/artifacts"
   logs_dir: "./var/logs"
-  cache_dir: "./var/cache"
+  cache_dir: "{tmp_path / "cache"}"
 """,
         encoding="utf-8",
     )
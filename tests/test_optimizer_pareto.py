@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from bitcoin_bot.main import run
+from bitcoin_bot.optimizer.pareto import pareto_front, pareto_front_mask
+
+
+def _brute_force_mask(values: np.ndarray) -> np.ndarray:
+    return np.array(
+        [
+            not any(
+                np.all(other >= point) and np.any(other > point) for other in values
+            )
+            for point in values
+        ]
+    )
+
+
+def test_pareto_front_mask_matches_brute_force_with_ties():
+    rng = np.random.default_rng(4)
+    values = np.round(rng.normal(size=(300, 3)), 1)
+    values[::10] = values[1::10][: len(values[::10])]
+
+    assert np.array_equal(pareto_front_mask(values), _brute_force_mask(values))
+    assert pareto_front_mask(np.empty((0, 3))).tolist() == []
+
+
+def test_pareto_front_minimizes_drawdown_and_skips_pruned_trials():
+    def trial(index, ret, drawdown, profit_factor, **extra):
+        return {
+            "trial": index,
+            "params": {},
+            "score": 0.0,
+            "metrics": {
+                "return": ret,
+                "max_drawdown": drawdown,
+                "profit_factor": profit_factor,
+            },
+            **extra,
+        }
+
+    trials = [
+        trial(0, 0.10, 0.20, 1.5),
+        trial(1, 0.05, 0.05, 1.2),
+        trial(2, 0.04, 0.06, 1.1),
+        trial(3, 0.50, 0.01, 9.0, pruned=True),
+        trial(4, 0.02, 0.05, 2.0),
+    ]
+
+    assert [item["trial"] for item in pareto_front(trials)] == [0, 1, 4]
+
+
+def test_run_complete_writes_pareto_front_artifact(tmp_path):
+    artifacts_dir = tmp_path / "artifacts"
+    config_path = tmp_path / "runtime.yaml"
+    config_path.write_text(
+        f"""
+runtime:
+  mode: backtest
+optimizer:
+  enabled: true
+  opt_trials: 6
+  pareto_enabled: true
+  trial_store_enabled: false
+notify:
+  discord:
+    enabled: false
+paths:
+  artifacts_dir: "{artifacts_dir}"
+  logs_dir: "{tmp_path / "logs"}"
+  cache_dir: "{tmp_path / "cache"}"
+""",
+        encoding="utf-8",
+    )
+
+    artifact = run(mode="backtest", config_path=str(config_path))
+
+    payload = json.loads(
+        Path(artifacts_dir / "pareto_front.json").read_text(encoding="utf-8")
+    )
+    assert payload["trial_count"] == 6
+    assert 1 <= payload["front_size"] == len(payload["front"]) <= 6
+    assert [item["metric"] for item in payload["objectives"]] == [
+        "return",
+        "max_drawdown",
+        "profit_factor",
+    ]
+    summary = artifact["optimization"]["pareto_front"]
+    assert summary["front_size"] == payload["front_size"]
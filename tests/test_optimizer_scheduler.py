@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bitcoin_bot.config.models import (
+    BacktestSettings,
+    RiskSettings,
+    RuntimeConfig,
+    StrategySettings,
+)
+from bitcoin_bot.config.validator import validate_config
+from bitcoin_bot.indicators.generator import VOLUME_MA_WINDOW
+from bitcoin_bot.main import run
+from bitcoin_bot.optimizer.scheduler import (
+    WARMUP_MARGIN_BARS,
+    halving_fractions,
+    run_successive_halving,
+)
+from bitcoin_bot.optimizer.search import SearchContext
+
+
+def test_halving_fractions_grow_by_eta_and_end_with_full_data():
+    assert halving_fractions(eta=3, min_fraction=0.1) == pytest.approx(
+        [0.1, 0.3, 0.9, 1.0]
+    )
+    assert halving_fractions(eta=2, min_fraction=1.0) == [1.0]
+
+
+def test_successive_halving_prunes_and_records_rungs(ohlcv_frame):
+    context = SearchContext(
+        strategy=StrategySettings(),
+        risk=RiskSettings(),
+        backtest=BacktestSettings(),
+    )
+
+    result = run_successive_halving(
+        ohlcv_frame(900, trend=0.02, period=11),
+        context,
+        trials=27,
+        seed=2,
+        eta=3,
+        min_fraction=1 / 9,
+    )
+
+    salvage = result.salvage
+    assert [rung["evaluated"] for rung in salvage["rungs"]] == [27, 9, 3]
+    assert [rung["bars"] for rung in salvage["rungs"]] == [168, 300, 900]
+    assert salvage["warmup_bars"] == 168
+    assert salvage["savings_ratio"] == pytest.approx(
+        (27 * 900) / (27 * 168 + 9 * 300 + 3 * 900)
+    )
+    assert result.trials_executed == 27
+
+    finalists = [trial for trial in result.trials if not trial["pruned"]]
+    assert len(finalists) == 3
+    assert all(trial["bars"] == 900 for trial in finalists)
+    assert result.best in finalists
+    first_rung = salvage["rungs"][0]
+    for index in first_rung["pruned_trials"]:
+        assert result.trials[index]["rung"] == 0
+        assert result.trials[index]["score"] <= first_rung["score_cutoff"]
+
+
+def test_successive_halving_rungs_cover_indicator_warmup(ohlcv_frame):
+    context = SearchContext(
+        strategy=StrategySettings(),
+        risk=RiskSettings(),
+        backtest=BacktestSettings(),
+    )
+
+    result = run_successive_halving(
+        ohlcv_frame(900, trend=0.02, period=11),
+        context,
+        trials=9,
+        seed=4,
+        eta=3,
+        min_fraction=0.01,
+    )
+
+    longest = max(
+        max(trial["params"]["strategy.ema_slow"] for trial in result.trials),
+        context.strategy.rsi_period,
+        context.strategy.atr_period,
+        VOLUME_MA_WINDOW,
+    )
+    first_rung = result.salvage["rungs"][0]
+    assert first_rung["bars"] == longest + WARMUP_MARGIN_BARS
+    assert first_rung["bars"] > int(900 * 0.01)
+
+
+def test_run_complete_records_pruning_in_optimization_salvage(tmp_path, ohlcv_frame):
+    csv_path = tmp_path / "klines.csv"
+    ohlcv_frame(900, trend=0.02, period=11).to_csv(csv_path, index=False)
+    config_path = tmp_path / "runtime.yaml"
+    config_path.write_text(
+        f"""
+runtime:
+  mode: backtest
+data:
+  csv_path: "{csv_path}"
+optimizer:
+  enabled: true
+  opt_trials: 9
+  scheduler: successive_halving
+  halving_min_fraction: 0.2
+notify:
+  discord:
+    enabled: false
+paths:
+  artifacts_dir: "{tmp_path / "artifacts"}"
+  logs_dir: "{tmp_path / "logs"}"
+  cache_dir: "{tmp_path / "cache"}"
+""",
+        encoding="utf-8",
+    )
+
+    run(mode="backtest", config_path=str(config_path))
+
+    artifact = json.loads(
+        Path(tmp_path / "artifacts" / "run_complete.json").read_text(encoding="utf-8")
+    )
+    salvage = artifact["optimization"]["salvage"]
+    assert salvage["scheduler"] == "successive_halving"
+    assert salvage["rungs"][0]["evaluated"] == 9
+    assert artifact["pipeline_summary"]["opt_trials_executed"] == 9
+
+
+def test_invalid_optimizer_scheduler_raises():
+    config = RuntimeConfig()
+    config.optimizer.scheduler = "hyperband"  # type: ignore[assignment]
+    with pytest.raises(ValueError, match="optimizer.scheduler"):
+        validate_config(config)
+
+
+def test_successive_halving_rejects_tpe_sampler():
+    config = RuntimeConfig()
+    config.optimizer.scheduler = "successive_halving"
+    config.optimizer.sampler = "tpe"
+    with pytest.raises(ValueError, match="optimizer.sampler"):
+        validate_config(config)
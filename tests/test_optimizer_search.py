@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from bitcoin_bot.config.models import (
+    BacktestSettings,
+    RiskSettings,
+    RuntimeConfig,
+    StrategySettings,
+)
+from bitcoin_bot.optimizer import search as search_module
+from bitcoin_bot.optimizer.search import (
+    DEFAULT_SEARCH_SPACE,
+    RandomSampler,
+    SearchContext,
+    apply_params,
+    current_params,
+    run_parameter_search,
+    select_best_trial,
+)
+from bitcoin_bot.pipeline.backtest_runner import run_backtest
+
+
+def _context() -> SearchContext:
+    return SearchContext(
+        strategy=StrategySettings(),
+        risk=RiskSettings(),
+        backtest=BacktestSettings(),
+    )
+
+
+def test_random_sampler_is_seeded_and_within_bounds():
+    first = [RandomSampler(seed=3).sample() for _ in range(2)]
+    sampler = RandomSampler(seed=3)
+    samples = [sampler.sample() for _ in range(50)]
+
+    assert first[0] == first[1] == samples[0]
+    for params in samples:
+        for spec in DEFAULT_SEARCH_SPACE:
+            assert spec.low <= params[spec.key] <= spec.high
+            if spec.kind == "int":
+                assert isinstance(params[spec.key], int)
+
+
+def test_apply_params_updates_sections_and_orders_ema_windows():
+    strategy, risk = apply_params(
+        {
+            "strategy.ema_fast": 30,
+            "strategy.ema_slow": 10,
+            "risk.position_risk_fraction": 0.02,
+        },
+        strategy=StrategySettings(),
+        risk=RiskSettings(),
+    )
+
+    assert (strategy.ema_fast, strategy.ema_slow) == (30, 31)
+    assert risk.position_risk_fraction == 0.02
+    with pytest.raises(ValueError):
+        apply_params(
+            {"exchange.symbol": 1}, strategy=StrategySettings(), risk=RiskSettings()
+        )
+
+
+def test_parameter_search_runs_trials_in_shared_memory_pool(ohlcv_frame):
+    context = _context()
+    sequential = run_parameter_search(ohlcv_frame(), context, trials=6, seed=1)
+    parallel = run_parameter_search(
+        ohlcv_frame(), context, trials=6, seed=1, max_workers=2
+    )
+
+    assert parallel.trials == sequential.trials
+    assert sequential.trials_executed == 6
+    assert sequential.trials[0]["params"] == current_params(
+        context.space, strategy=context.strategy, risk=context.risk
+    )
+    assert sequential.best["score"] == max(
+        trial["score"] for trial in sequential.trials
+    )
+    assert set(sequential.best["gates"]) == {"accept", "reasons"}
+
+
+def test_parameter_search_reuses_one_pool_across_batches(monkeypatch, ohlcv_frame):
+    shared_blocks: list[SharedMemory] = []
+    share = search_module.share_ohlcv_frame
+
+    def _tracking_share(frame):
+        shared, shape = share(frame)
+        shared_blocks.append(shared)
+        return shared, shape
+
+    monkeypatch.setattr(search_module, "share_ohlcv_frame", _tracking_share)
+    context = _context()
+    sequential = run_parameter_search(ohlcv_frame(), context, trials=6, seed=1)
+    batched = run_parameter_search(
+        ohlcv_frame(), context, trials=6, seed=1, max_workers=2, batch_size=2
+    )
+
+    assert batched.trials == sequential.trials
+    assert len(shared_blocks) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared_blocks[0].name)
+
+
+def test_parameter_search_reports_worker_indicator_cache_stats(tmp_path, ohlcv_frame):
+    context = _context()
+    context.cache_dir = str(tmp_path)
+    sequential = run_parameter_search(ohlcv_frame(), context, trials=6, seed=1)
+    parallel = run_parameter_search(
+        ohlcv_frame(), context, trials=6, seed=1, max_workers=2
+    )
+
+    first = sequential.to_summary()["indicator_cache"]
+    second = parallel.to_summary()["indicator_cache"]
+    assert first["hits"] + first["misses"] == 24
+    assert second["hits"] + second["misses"] == 24
+    assert first["disk_writes"] > 0
+    assert second["disk_hits"] > 0
+    assert any((tmp_path / "indicators").glob("*.npy"))
+
+
+def test_backtest_reports_executed_optimizer_trials(tmp_path, ohlcv_frame):
+    csv_path = tmp_path / "klines.csv"
+    ohlcv_frame().to_csv(csv_path, index=False)
+    config = RuntimeConfig()
+    config.data.csv_path = str(csv_path)
+    config.optimizer.enabled = True
+    config.optimizer.opt_trials = 4
+
+    result = run_backtest(config)
+
+    optimizer = result["summary"]["optimizer"]
+    assert result["opt_trials_executed"] == 4
+    assert optimizer["trials_executed"] == 4
+    assert result["optimization_score"] == optimizer["best"]["score"]
+
+    config.optimizer.enabled = False
+    assert run_backtest(config)["opt_trials_executed"] == 0
+
+
+def test_select_best_trial_prefers_trials_passing_gates():
+    rejected = {"score": 5.0, "gates": {"accept": False, "reasons": ["x"]}}
+    accepted = {"score": 1.0, "gates": {"accept": True, "reasons": []}}
+
+    assert select_best_trial([rejected, accepted]) is accepted
+    assert select_best_trial([rejected]) is rejected
+    assert select_best_trial([]) is None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+
+from bitcoin_bot.config.models import RuntimeConfig
+from bitcoin_bot.optimizer.search import ParameterSpec, RandomSampler
+from bitcoin_bot.optimizer.tpe import TPESampler
+from bitcoin_bot.pipeline.backtest_runner import run_backtest
+
+SPACE = (
+    ParameterSpec("strategy", "ema_fast", 2, 60, "int"),
+    ParameterSpec("strategy", "min_confidence", 0.0, 1.0),
+    ParameterSpec("strategy", "mode", kind="categorical", choices=("trend", "flat")),
+    ParameterSpec(
+        "risk",
+        "position_risk_fraction",
+        0.0,
+        0.1,
+        condition=("strategy.mode", ("trend",)),
+    ),
+)
+
+
+def _objective(params: dict) -> float:
+    score = -abs(params["strategy.ema_fast"] - 42) / 10.0
+    score -= (params["strategy.min_confidence"] - 0.3) ** 2 * 10.0
+    if params["strategy.mode"] == "trend":
+        score += 1.0 - abs(params["risk.position_risk_fraction"] - 0.07) * 20.0
+    return score
+
+
+def _run(sampler, trials: int = 60) -> list[tuple[dict, float]]:
+    history = []
+    for _ in range(trials):
+        params = sampler.sample()
+        score = _objective(params)
+        sampler.tell(params, score)
+        history.append((params, score))
+    return history
+
+
+def test_tpe_sampler_is_deterministic_and_respects_space():
+    first = _run(TPESampler(SPACE, seed=7))
+    second = _run(TPESampler(SPACE, seed=7))
+
+    assert first == second
+    for params, _ in first:
+        assert isinstance(params["strategy.ema_fast"], int)
+        assert 2 <= params["strategy.ema_fast"] <= 60
+        assert 0.0 <= params["strategy.min_confidence"] <= 1.0
+        assert params["strategy.mode"] in {"trend", "flat"}
+        assert ("risk.position_risk_fraction" in params) == (
+            params["strategy.mode"] == "trend"
+        )
+
+
+def test_tpe_sampler_beats_random_sampling_on_the_same_budget():
+    tpe_best = []
+    random_best = []
+    for seed in range(5):
+        tpe_best.append(max(score for _, score in _run(TPESampler(SPACE, seed=seed))))
+        random_best.append(
+            max(score for _, score in _run(RandomSampler(SPACE, seed=seed)))
+        )
+
+    assert np.mean(tpe_best) > np.mean(random_best)
+
+
+def test_backtest_tpe_search_is_reproducible(tmp_path, ohlcv_frame):
+    frame = ohlcv_frame(300, amplitude=4.0, period=8)
+    csv_path = tmp_path / "klines.csv"
+    frame.to_csv(csv_path, index=False)
+    config = RuntimeConfig()
+    config.data.csv_path = str(csv_path)
+    config.optimizer.enabled = True
+    config.optimizer.sampler = "tpe"
+    config.optimizer.opt_trials = 14
+    config.optimizer.trial_store_enabled = False
+
+    first = run_backtest(config)
+    second = run_backtest(config)
+
+    assert first["opt_trials_executed"] == 14
+    assert first["summary"]["optimizer"] == second["summary"]["optimizer"]
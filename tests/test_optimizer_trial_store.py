@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from bitcoin_bot.config.models import (
+    BacktestSettings,
+    RiskSettings,
+    RuntimeConfig,
+    StrategySettings,
+)
+from bitcoin_bot.optimizer import search as search_module
+from bitcoin_bot.optimizer.search import (
+    SearchContext,
+    run_parameter_search,
+    trial_key,
+)
+from bitcoin_bot.optimizer.trial_store import TrialStore, trial_store_path
+from bitcoin_bot.pipeline.backtest_runner import run_backtest
+
+
+def _context() -> SearchContext:
+    return SearchContext(
+        strategy=StrategySettings(),
+        risk=RiskSettings(),
+        backtest=BacktestSettings(),
+    )
+
+
+def test_trial_store_top_k_and_lookup(tmp_path):
+    with TrialStore(tmp_path / "trials.sqlite3") as store:
+        store.put_many(
+            "data-a",
+            [
+                (
+                    f"key-{index}",
+                    {"params": {"p": index}, "score": score, "metrics": {}},
+                )
+                for index, score in enumerate([0.5, 2.0, -1.0, 1.5])
+            ],
+        )
+        store.put_many(
+            "data-b", [("key-0", {"params": {}, "score": 9.0, "metrics": {}})]
+        )
+
+        assert len(store) == 5
+        top = store.top_trials(2, data_hash="data-a")
+        assert [record["score"] for record in top] == [2.0, 1.5]
+        assert store.top_trials(1)[0]["data_hash"] == "data-b"
+        found = store.get_many("data-a", ["key-2", "missing"])
+        assert list(found) == ["key-2"]
+        assert found["key-2"]["params"] == {"p": 2}
+
+
+def test_trial_key_covers_only_simulator_inputs():
+    base = _context()
+    params = {"strategy.ema_fast": 8}
+    key = trial_key(params, base)
+
+    reporting = _context()
+    reporting.backtest = BacktestSettings(bootstrap_samples=50, checkpoint_enabled=True)
+    assert trial_key(params, reporting) == key
+
+    holding = _context()
+    holding.backtest = BacktestSettings(max_holding_bars=7)
+    assert trial_key(params, holding) != key
+    assert trial_key({"strategy.ema_fast": 9}, base) != key
+
+
+def test_resumed_search_skips_stored_trials(tmp_path, monkeypatch, ohlcv_frame):
+    path = tmp_path / "trials.sqlite3"
+    frame = ohlcv_frame(300, amplitude=4.0, period=8)
+    with TrialStore(path) as store:
+        first = run_parameter_search(frame, _context(), trials=5, store=store)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("trial should come from the store")
+
+    monkeypatch.setattr(search_module, "evaluate_params", _fail)
+    with TrialStore(path) as store:
+        resumed = run_parameter_search(frame, _context(), trials=5, store=store)
+        assert len(store) == 5
+
+    assert all(trial["cached"] for trial in resumed.trials)
+    assert [trial["score"] for trial in resumed.trials] == [
+        trial["score"] for trial in first.trials
+    ]
+    assert resumed.best["params"] == first.best["params"]
+
+
+def test_backtest_persists_trials_under_cache_dir(tmp_path, ohlcv_frame):
+    csv_path = tmp_path / "klines.csv"
+    ohlcv_frame(300, amplitude=4.0, period=8).to_csv(csv_path, index=False)
+    config = RuntimeConfig()
+    config.data.csv_path = str(csv_path)
+    config.paths.cache_dir = str(tmp_path / "cache")
+    config.optimizer.enabled = True
+    config.optimizer.trial_store_enabled = True
+    config.optimizer.opt_trials = 3
+
+    first = run_backtest(config)["summary"]["optimizer"]
+    second = run_backtest(config)["summary"]["optimizer"]
+
+    assert trial_store_path(config.paths.cache_dir).exists()
+    assert first["cached_trials"] == 0
+    assert second["cached_trials"] == 3
+
+
+def test_backtest_leaves_trial_store_closed_by_default(tmp_path, ohlcv_frame):
+    csv_path = tmp_path / "klines.csv"
+    ohlcv_frame(300, amplitude=4.0, period=8).to_csv(csv_path, index=False)
+    config = RuntimeConfig()
+    config.data.csv_path = str(csv_path)
+    config.paths.cache_dir = str(tmp_path / "cache")
+    config.optimizer.enabled = True
+    config.optimizer.opt_trials = 2
+
+    assert run_backtest(config)["opt_trials_executed"] == 2
+    assert not trial_store_path(config.paths.cache_dir).exists()
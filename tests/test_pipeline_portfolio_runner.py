@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitcoin_bot.config.loader import load_runtime_config
+from bitcoin_bot.config.models import BacktestRunSettings, RuntimeConfig
+from bitcoin_bot.config.validator import validate_config
+from bitcoin_bot.data.ohlcv import normalize_ohlcv_frame
+from bitcoin_bot.main import run
+from bitcoin_bot.pipeline import portfolio_runner
+from bitcoin_bot.pipeline.backtest_runner import run_backtest
+from bitcoin_bot.pipeline.portfolio_runner import (
+    build_run_config,
+    portfolio_equity,
+    run_portfolio_backtest,
+)
+
+
+def _write_klines(path: Path, *, rows: int, phase: float, start: str) -> Path:
+    close = np.array(
+        [100.0 + 0.03 * i + 4.0 * math.sin(i / 8 + phase) for i in range(rows)]
+    )
+    frame = normalize_ohlcv_frame(
+        {
+            "timestamp": pd.date_range(start, periods=rows, freq="1min", tz="UTC"),
+            "open": close - 0.2,
+            "high": close + 0.6,
+            "low": close - 0.6,
+            "close": close,
+            "volume": np.full(rows, 10.0),
+        },
+        provider="test",
+        symbol="BTC_JPY",
+        timeframe="1m",
+    )
+    frame.to_csv(path, index=False)
+    return path
+
+
+def _portfolio_config(tmp_path: Path) -> RuntimeConfig:
+    btc = _write_klines(tmp_path / "btc.csv", rows=300, phase=0.0, start="2026-01-01")
+    eth = _write_klines(
+        tmp_path / "eth.csv", rows=240, phase=1.3, start="2026-01-01 01:00"
+    )
+    config = RuntimeConfig()
+    config.data.csv_path = str(btc)
+    config.optimizer.enabled = False
+    config.paths.cache_dir = str(tmp_path / "cache")
+    config.backtest.runs = [
+        BacktestRunSettings(symbol="BTC_JPY", product_type="spot"),
+        BacktestRunSettings(symbol="BTC_JPY", product_type="leverage"),
+        BacktestRunSettings(
+            symbol="ETH_JPY",
+            overrides={"data": {"csv_path": str(eth)}, "strategy": {"ema_fast": 8}},
+        ),
+    ]
+    return config
+
+
+def test_portfolio_runs_match_single_runs_and_load_each_symbol_once(
+    tmp_path, monkeypatch
+):
+    config = _portfolio_config(tmp_path)
+    loads = []
+    original = portfolio_runner.load_backtest_frame
+
+    def counting_load(run_config):
+        loads.append(run_config.exchange.symbol)
+        return original(run_config)
+
+    monkeypatch.setattr(portfolio_runner, "load_backtest_frame", counting_load)
+
+    result = run_portfolio_backtest(config)
+
+    assert sorted(loads) == ["BTC_JPY", "ETH_JPY"]
+    assert result["summary"]["data_loads"] == 2
+    assert [
+        (run["summary"]["symbol"], run["summary"]["product_type"])
+        for run in result["runs"]
+    ] == [("BTC_JPY", "spot"), ("BTC_JPY", "leverage"), ("ETH_JPY", "spot")]
+    for spec, run_result in zip(config.backtest.runs, result["runs"]):
+        single = run_backtest(build_run_config(config, spec))
+        assert run_result["summary"] == single["summary"]
+
+    summary = result["summary"]
+    assert summary["run_count"] == 3
+    assert summary["symbols"] == ["BTC_JPY", "ETH_JPY"]
+    assert summary["initial_balance"] == pytest.approx(3 * 1_000_000.0)
+    assert summary["final_balance"] == pytest.approx(
+        sum(run["summary"]["final_balance"] for run in result["runs"])
+    )
+
+
+def test_parallel_portfolio_matches_serial(tmp_path):
+    config = _portfolio_config(tmp_path)
+    config.optimizer.enabled = True
+    config.optimizer.opt_trials = 3
+    config.optimizer.trial_store_enabled = False
+
+    serial = run_portfolio_backtest(config)
+    config.optimizer.max_workers = 2
+    parallel = run_portfolio_backtest(config)
+
+    assert parallel["summary"] == serial["summary"]
+    assert [run["summary"] for run in parallel["runs"]] == [
+        run["summary"] for run in serial["runs"]
+    ]
+    assert parallel["opt_trials_executed"] == 9
+
+
+def test_portfolio_equity_holds_balances_outside_each_run():
+    index = pd.date_range("2026-01-01", periods=4, freq="1min", tz="UTC")
+    first = pd.Series([100.0, 110.0, 90.0], index=index[:3])
+    second = pd.Series([50.0, 60.0], index=index[2:])
+
+    assert portfolio_equity([first, second]).tolist() == [150.0, 160.0, 140.0, 150.0]
+
+
+def test_run_overrides_are_validated():
+    config = RuntimeConfig()
+    config.backtest.runs = [
+        BacktestRunSettings(symbol="ETH_JPY", overrides={"strategy": {"nope": 1}})
+    ]
+
+    with pytest.raises(ValueError, match=r"backtest.runs\[0\].overrides"):
+        validate_config(config)
+
+
+def test_runs_for_other_symbols_require_their_own_csv():
+    config = RuntimeConfig()
+    config.backtest.runs = [
+        BacktestRunSettings(symbol="BTC_JPY", product_type="leverage"),
+        BacktestRunSettings(symbol="ETH_JPY"),
+    ]
+
+    with pytest.raises(
+        ValueError, match=r"backtest.runs\[1\].overrides: data.csv_path"
+    ):
+        validate_config(config)
+
+
+def test_run_complete_includes_portfolio_and_per_run_entries(tmp_path):
+    btc = _write_klines(tmp_path / "btc.csv", rows=200, phase=0.0, start="2026-01-01")
+    eth = _write_klines(tmp_path / "eth.csv", rows=200, phase=1.0, start="2026-01-01")
+    artifacts_dir = tmp_path / "artifacts"
+    config_path = tmp_path / "runtime.yaml"
+    config_path.write_text(
+        f"""
+runtime:
+  mode: backtest
+data:
+  csv_path: "{btc}"
+backtest:
+  runs:
+    - symbol: BTC_JPY
+      product_type: spot
+    - symbol: ETH_JPY
+      product_type: leverage
+      overrides:
+        data:
+          csv_path: "{eth}"
+optimizer:
+  enabled: true
+  opt_trials: 2
+  trial_store_enabled: false
+notify:
+  discord:
+    enabled: false
+paths:
+  artifacts_dir: "{artifacts_dir}"
+  logs_dir: "{tmp_path / "logs"}"
+  cache_dir: "{tmp_path / "cache"}"
+""",
+        encoding="utf-8",
+    )
+
+    assert len(load_runtime_config(str(config_path)).backtest.runs) == 2
+    artifact = run(mode="backtest", config_path=str(config_path))
+
+    payload = json.loads(
+        Path(artifacts_dir / "run_complete.json").read_text(encoding="utf-8")
+    )
+    assert payload == artifact
+    assert payload["pipeline"]["summary"]["run_count"] == 2
+    assert payload["pipeline_summary"]["opt_trials_executed"] == 4
+    assert [(item["symbol"], item["product_type"]) for item in payload["runs"]] == [
+        ("BTC_JPY", "spot"),
+        ("ETH_JPY", "leverage"),
+    ]
+    assert all(item["optimization"]["trials"] == 2 for item in payload["runs"])
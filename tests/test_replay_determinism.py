@@ -5,7 +5,11 @@ import subprocess
 
 from bitcoin_bot.config.loader import load_runtime_config
 from bitcoin_bot.config.validator import validate_config
-from bitcoin_bot.pipeline.backtest_runner import extract_replay_summary, run_backtest
+from bitcoin_bot.pipeline.backtest_runner import (
+    extract_replay_summary,
+    load_backtest_frame,
+    run_backtest,
+)
 
 
 def test_backtest_replay_summary_is_deterministic():
@@ -18,6 +22,28 @@ def test_backtest_replay_summary_is_deterministic():
     assert first == second
 
 
+def test_checkpointed_replay_summary_matches_full_rerun(tmp_path):
+    config = validate_config(load_runtime_config("configs/runtime.example.yaml"))
+    config.runtime.mode = "backtest"
+    config.optimizer.enabled = False
+    config.paths.cache_dir = str(tmp_path / "cache")
+    frame, _, _ = load_backtest_frame(config)
+    csv_path = tmp_path / "klines.csv"
+    frame.iloc[: len(frame) // 2].to_csv(csv_path, index=False)
+    config.data.csv_path = str(csv_path)
+    config.backtest.checkpoint_enabled = True
+    run_backtest(config)
+
+    frame.to_csv(csv_path, index=False)
+    resumed = run_backtest(config)
+    config.backtest.checkpoint_enabled = False
+    full = run_backtest(config)
+
+    assert resumed["summary"]["checkpoint"]["mode"] == "resumed"
+    assert resumed["summary"]["checkpoint"]["bars_processed"] < len(frame)
+    assert extract_replay_summary(resumed) == extract_replay_summary(full)
+
+
 def test_replay_check_script_detects_mismatch():
     env = os.environ.copy()
     env["REPLAY_FORCE_DRIFT"] = "1"
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bitcoin_bot.strategy.batch import (
+    ACTION_BUY,
+    ACTION_HOLD,
+    decide_action_batch,
+    decode_reason_mask,
+)
+from bitcoin_bot.strategy.core import DecisionHooks, IndicatorInput, decide_action
+
+
+def _random_inputs(bars: int = 4000, seed: int = 5) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + rng.normal(0.0, 5.0, bars)
+    ema_slow = close + rng.normal(0.0, 2.0, bars)
+    inputs = {
+        "close": close,
+        "ema_fast": ema_slow + rng.normal(0.0, 3.0, bars),
+        "ema_slow": ema_slow,
+        "rsi": rng.uniform(0.0, 100.0, bars),
+        "atr": np.abs(rng.normal(0.0, 4.0, bars)),
+        "volume": rng.uniform(0.0, 200.0, bars),
+        "volume_ma": rng.uniform(50.0, 150.0, bars),
+    }
+    inputs["atr"][::97] = 0.0
+    inputs["atr"][::53] = 20.0
+    inputs["ema_fast"][::211] = np.nan
+    inputs["rsi"][::307] = np.nan
+    return inputs
+
+
+@pytest.mark.parametrize(
+    "hooks",
+    [
+        DecisionHooks(),
+        DecisionHooks(
+            min_confidence=0.2,
+            regime_max_atr_to_price_ratio=0.05,
+            regime_min_volume_ratio=0.8,
+            max_holding_bars=30,
+        ),
+        DecisionHooks(cooldown_bars_remaining=2),
+    ],
+)
+def test_batch_decisions_match_scalar_decide_action(hooks):
+    inputs = _random_inputs()
+    batch = decide_action_batch(**inputs, hooks=hooks)
+
+    assert len(batch) == len(inputs["close"])
+    for position in range(len(batch)):
+        expected = decide_action(
+            IndicatorInput(
+                **{key: float(values[position]) for key, values in inputs.items()}
+            ),
+            hooks,
+        )
+        actual = batch.decision_at(position)
+        assert actual.action == expected.action
+        assert actual.confidence == expected.confidence
+        assert actual.reason_codes == expected.reason_codes
+        assert np.array_equal(
+            [actual.risk.sl, actual.risk.tp],
+            [expected.risk.sl, expected.risk.tp],
+            equal_nan=True,
+        )
+        assert actual.risk.max_holding_bars == expected.risk.max_holding_bars
+
+
+def test_batch_decisions_broadcast_scalar_volume_defaults():
+    batch = decide_action_batch(
+        close=np.array([100.0, 100.0]),
+        ema_fast=np.array([110.0, 100.0]),
+        ema_slow=np.array([100.0, 100.0]),
+        rsi=np.array([55.0, 50.0]),
+        atr=np.array([2.0, 2.0]),
+    )
+
+    assert batch.action.tolist() == [ACTION_BUY, ACTION_HOLD]
+    assert decode_reason_mask(int(batch.reason_mask[0])) == ["ema_momentum_long"]
+    assert decode_reason_mask(int(batch.reason_mask[1])) == ["no_trade_setup"]